@@ -107,6 +107,20 @@ class TestsListBrandView(TestCase):
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
 
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de marcas executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        with self.assertNumQueries(6):
+            self.client.get(reverse('brand_list'))
+
+        for index in range(10):
+            Brand.objects.create(name=f'Marca {index:02d}')
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('brand_list'))
+        self.assertEqual(len(response.context['brands']), 10)
+
     def tearDown(self):
         """Limpa os dados criados no banco de dados após cada teste."""
         Brand.objects.all().delete()
@@ -109,6 +109,20 @@ class TestsListCategoryView(TestCase):
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
 
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de categorias executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        with self.assertNumQueries(6):
+            self.client.get(reverse('category_list'))
+
+        for index in range(10):
+            Category.objects.create(name=f'Categoria {index:02d}')
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('category_list'))
+        self.assertEqual(len(response.context['categories']), 10)
+
     def tearDown(self):
         """Limpa os dados criados no banco de dados após cada teste."""
         Category.objects.all().delete()
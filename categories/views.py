@@ -13,6 +13,7 @@ from django.views.generic import (
 
 from categories.forms import CategoryForm
 from categories.models import Category
+from core.pagination import EstimatedCountPaginator
 
 
 class CategoryListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
@@ -27,6 +28,7 @@ class CategoryListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         template_name: O template a ser renderizado para a lista de categorias.
         context_object_name: O nome do contexto a ser utilizado no template.
         paginate_by: Número de categorias a serem exibidas por página.
+        paginator_class: Paginador que estima o total em listagens grandes.
         permission_required: Permissão necessária para acessar a view.
     """
 
@@ -34,6 +36,7 @@ class CategoryListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     template_name = 'category_list.html'
     context_object_name = 'categories'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
     permission_required = 'categories.view_category'
 
     def get_queryset(self):
@@ -43,7 +46,7 @@ class CategoryListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         Returns:
             QuerySet: Lista de categorias filtradas pelo nome (se fornecido).
         """
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().only('name', 'description')
         name = self.request.GET.get('name')
         if name:
             queryset = queryset.filter(name__istartswith=name)
@@ -0,0 +1,140 @@
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+
+EXPORT_CHUNK_SIZE = 2000
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class _Echo:
+    """
+    Pseudo-arquivo que devolve o que recebe, para que o `csv.writer`
+    produza cada linha como texto em vez de acumulá-las.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _escape_csv_cell(value):
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def stream_csv(columns, rows):
+    """
+    Gera um CSV, linha a linha, com cabeçalho.
+
+    Textos que começam com `=`, `+`, `-`, `@`, tabulação ou retorno de
+    carro recebem um `'` no início, para que planilhas não os executem
+    como fórmulas.
+
+    Args:
+        columns (Iterable[str]): Nomes das colunas.
+        rows (Iterable[tuple]): Valores de cada linha.
+
+    Yields:
+        str: Cabeçalho e linhas do CSV, uma por vez.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow(map(_escape_csv_cell, row))
+
+
+def stream_jsonl(columns, rows):
+    """
+    Gera um JSON Lines, com um objeto por linha.
+
+    Args:
+        columns (Iterable[str]): Chaves de cada objeto.
+        rows (Iterable[tuple]): Valores de cada linha.
+
+    Yields:
+        str: Um objeto JSON por linha, terminado por quebra de linha.
+    """
+    columns = tuple(columns)
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+
+async def aiterate_in_chunks(iterable, chunk_size: int):
+    """
+    Percorre um iterável síncrono a partir de código assíncrono, lendo
+    `chunk_size` itens por vez com `sync_to_async`.
+
+    Os blocos são lidos na thread das views síncronas, a mesma que abriu
+    a conexão com o banco, e só um bloco fica em memória por vez.
+
+    Args:
+        iterable (Iterable): Itens a percorrer, como as linhas de uma
+        exportação.
+        chunk_size (int): Itens lidos por chamada.
+
+    Yields:
+        Os itens do iterável, na mesma ordem.
+    """
+    iterator = iter(iterable)
+    read_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+    while chunk := await read_chunk():
+        for item in chunk:
+            yield item
+
+
+EXPORT_FORMATS = {
+    'csv': (stream_csv, 'text/csv; charset=utf-8'),
+    'jsonl': (stream_jsonl, 'application/x-ndjson; charset=utf-8'),
+}
+
+
+class StreamingExportMixin:
+    """
+    Mixin para ListViews que troca a página da listagem por uma
+    exportação em CSV ou JSON Lines dos mesmos registros.
+
+    O queryset é o da própria listagem, com os mesmos filtros da URL, sem
+    paginação. As colunas são lidas com `values_list` e `.iterator()`, em
+    blocos de `export_chunk_size` registros, e a resposta é uma
+    `StreamingHttpResponse`: a memória usada não cresce com o tamanho da
+    exportação e os primeiros bytes são enviados antes de o banco terminar
+    de devolver os registros. O formato vem do parâmetro `format` (`csv`,
+    o padrão, ou `jsonl`). Sob ASGI o conteúdo é um gerador assíncrono,
+    que lê os blocos com `sync_to_async`; um gerador síncrono seria
+    consumido inteiro pelo Django antes do envio do primeiro byte.
+
+    Attributes:
+        export_fields (tuple): Pares (coluna, campo do queryset) exportados.
+        export_filename (str): Nome do arquivo baixado, sem extensão.
+        export_chunk_size (int): Registros lidos do banco por vez.
+    """
+
+    export_fields = ()
+    export_filename = 'export'
+    export_chunk_size = EXPORT_CHUNK_SIZE
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest('Formato de exportação inválido.')
+        stream, content_type = EXPORT_FORMATS[export_format]
+
+        columns = [column for column, _ in self.export_fields]
+        rows = (
+            self.get_queryset()
+            .values_list(*(field for _, field in self.export_fields))
+            .iterator(chunk_size=self.export_chunk_size)
+        )
+        content = stream(columns, rows)
+        if isinstance(request, ASGIRequest):
+            content = aiterate_in_chunks(content, self.export_chunk_size)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = (
+            f'attachment; filename="{self.export_filename}.{export_format}"'
+        )
+        return response
@@ -0,0 +1,22 @@
+from django import forms
+
+from core.widgets import AutocompleteSelect
+
+
+class AutocompleteModelFormMixin(forms.BaseModelForm):
+    """
+    Mixin para ModelForms com campos `AutocompleteSelect`.
+
+    O `ModelChoiceField` já valida a existência do registro com uma
+    consulta pela chave primária; este mixin evita que a validação do
+    modelo repita a mesma consulta para a chave estrangeira.
+    """
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        exclude.update(
+            name
+            for name, field in self.fields.items()
+            if isinstance(field.widget, AutocompleteSelect)
+        )
+        return exclude
@@ -0,0 +1,236 @@
+import cProfile
+import io
+import logging
+import pstats
+import time
+from abc import ABC, abstractmethod
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+
+from core.monitoring import record_request
+from core.queries import QueryCounter
+from core.timing import collect_timings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    """Erro levantado quando uma view passa do orçamento de consultas."""
+
+
+class InstrumentationMiddleware(ABC):
+    """
+    Base dos middlewares de instrumentação, que atendem tanto requisições
+    síncronas (WSGI) quanto assíncronas (ASGI).
+
+    Quando o `get_response` recebido é assíncrono, o próprio middleware
+    passa a ser uma corrotina e delega a `aprocess`; assim o Django não
+    precisa adaptá-lo com `sync_to_async`, e as views assíncronas
+    continuam no loop de eventos. Do contrário, delega a `process`.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.aprocess(request)
+        return self.process(request)
+
+    @abstractmethod
+    def process(self, request):
+        """Atende uma requisição síncrona."""
+
+    @abstractmethod
+    async def aprocess(self, request):
+        """Atende uma requisição assíncrona."""
+
+
+class QueryBudgetMiddleware(InstrumentationMiddleware):
+    """
+    Middleware que conta as consultas SQL e o tempo gasto nelas em cada
+    requisição e avisa quando a view passa do orçamento.
+
+    Só é ativado com `QUERY_BUDGET_ENABLED`. O orçamento de cada view vem
+    de `QUERY_BUDGETS`, pelo nome da URL, ou de `QUERY_BUDGET_DEFAULT`.
+    Com `QUERY_BUDGET_RAISE` o excesso levanta `QueryBudgetExceeded`; do
+    contrário, é registrado no log.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_BUDGET_ENABLED:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def get_budget(self, request) -> int:
+        match = request.resolver_match
+        url_name = match.view_name if match else None
+        return settings.QUERY_BUDGETS.get(
+            url_name, settings.QUERY_BUDGET_DEFAULT
+        )
+
+    def check_budget(self, request, counter: QueryCounter) -> None:
+        budget = self.get_budget(request)
+        if counter.count > budget:
+            message = (
+                f'{request.path} executou {counter.count} consultas '
+                f'({counter.duration * 1000:.1f} ms), acima do orçamento '
+                f'de {budget}.'
+            )
+            if settings.QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+    def process(self, request):
+        with QueryCounter() as counter:
+            response = self.get_response(request)
+        self.check_budget(request, counter)
+        return response
+
+    async def aprocess(self, request):
+        with QueryCounter() as counter:
+            response = await self.get_response(request)
+        self.check_budget(request, counter)
+        return response
+
+
+class PrometheusMiddleware(InstrumentationMiddleware):
+    """
+    Middleware que registra a duração e as consultas SQL de cada
+    requisição nas métricas do Prometheus, pelo nome da URL.
+
+    Requisições que não correspondem a nenhuma URL são agrupadas em
+    `unresolved`, para não criar uma série por caminho acessado.
+    """
+
+    def record(self, request, start: float, queries: QueryCounter) -> None:
+        match = request.resolver_match
+        record_request(
+            match.view_name if match else 'unresolved',
+            request.method,
+            time.perf_counter() - start,
+            queries.count,
+        )
+
+    def process(self, request):
+        start = time.perf_counter()
+        with QueryCounter() as queries:
+            response = self.get_response(request)
+        self.record(request, start, queries)
+        return response
+
+    async def aprocess(self, request):
+        start = time.perf_counter()
+        with QueryCounter() as queries:
+            response = await self.get_response(request)
+        self.record(request, start, queries)
+        return response
+
+
+class ServerTimingMiddleware(InstrumentationMiddleware):
+    """
+    Middleware que adiciona o cabeçalho `Server-Timing` a todas as
+    respostas, com o tempo gasto no banco (`db`), na renderização de
+    templates (`template`), nas métricas do dashboard (`metrics`) e no
+    total da requisição (`total`).
+
+    A renderização é medida nas respostas `TemplateResponse`, usadas
+    pelas views genéricas; as métricas, pelas funções decoradas com
+    `core.timing.timed`.
+    """
+
+    def add_header(self, response, start: float, timings, queries) -> None:
+        timings.add('db', queries.duration, f'{queries.count} consultas')
+        timings.add('total', time.perf_counter() - start)
+        response['Server-Timing'] = timings.as_header()
+
+    def process(self, request):
+        start = time.perf_counter()
+        with collect_timings() as timings, QueryCounter() as queries:
+            request.server_timings = timings
+            response = self.get_response(request)
+        self.add_header(response, start, timings, queries)
+        return response
+
+    async def aprocess(self, request):
+        start = time.perf_counter()
+        with collect_timings() as timings, QueryCounter() as queries:
+            request.server_timings = timings
+            response = await self.get_response(request)
+        self.add_header(response, start, timings, queries)
+        return response
+
+    def process_template_response(self, request, response):
+        start = time.perf_counter()
+
+        def add_render_time(rendered):
+            request.server_timings.add('template', time.perf_counter() - start)
+
+        response.add_post_render_callback(add_render_time)
+        return response
+
+
+class ProfilerMiddleware(InstrumentationMiddleware):
+    """
+    Middleware que devolve o perfil de execução (cProfile) da requisição
+    no lugar da resposta, para usuários da equipe (`is_staff`) que
+    incluírem o parâmetro `PROFILER_PARAM` na URL.
+
+    O valor do parâmetro, quando numérico, limita a quantidade de
+    funções listadas. O relatório traz as funções ordenadas pelo tempo
+    acumulado e, em seguida, as funções chamadas por cada uma. Em
+    requisições assíncronas o perfil cobre apenas a thread do loop de
+    eventos: o código executado com `sync_to_async` aparece como a espera
+    pela thread, e outras requisições concorrentes podem aparecer nele.
+    """
+
+    default_limit = 40
+
+    def _get_limit(self, value: str) -> int:
+        return int(value) if value.isdigit() else self.default_limit
+
+    def process(self, request):
+        param = settings.PROFILER_PARAM
+        if param not in request.GET or not request.user.is_staff:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.report(profiler, request.GET[param])
+
+    async def aprocess(self, request):
+        param = settings.PROFILER_PARAM
+        if param not in request.GET or not (await request.auser()).is_staff:
+            return await self.get_response(request)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.report(profiler, request.GET[param])
+
+    def report(self, profiler, value: str) -> HttpResponse:
+        limit = self._get_limit(value)
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.strip_dirs().sort_stats('cumulative')
+        stats.print_stats(limit)
+        stats.print_callees(limit)
+        return HttpResponse(
+            output.getvalue(), content_type='text/plain; charset=utf-8'
+        )
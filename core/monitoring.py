@@ -0,0 +1,155 @@
+import glob
+import os
+
+import psutil
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+MULTIPROCESS_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+REQUEST_DURATION = Histogram(
+    'sge_http_request_duration_seconds',
+    'Duração das requisições HTTP, por nome da URL.',
+    ['view', 'method'],
+)
+DB_QUERIES = Counter(
+    'sge_db_queries_total',
+    'Consultas SQL executadas pelas requisições, por nome da URL.',
+    ['view'],
+)
+STOCK_MOVEMENTS = Counter(
+    'sge_stock_movements_total',
+    'Movimentações de estoque registradas, por tipo.',
+    ['kind'],
+)
+STOCK_UNITS = Counter(
+    'sge_stock_units_total',
+    'Unidades movimentadas no estoque, por tipo.',
+    ['kind'],
+)
+
+
+def record_request(view: str, method: str, seconds: float, queries: int):
+    """
+    Registra a duração e as consultas SQL de uma requisição.
+
+    Args:
+        view (str): Nome da URL atendida.
+        method (str): Método HTTP.
+        seconds (float): Duração da requisição, em segundos.
+        queries (int): Consultas SQL executadas.
+    """
+    REQUEST_DURATION.labels(view, method).observe(seconds)
+    DB_QUERIES.labels(view).inc(queries)
+
+
+def record_stock_movement(
+    kind: str, quantity: int, movements: int = 1
+) -> None:
+    """
+    Registra entradas ou saídas de estoque.
+
+    Args:
+        kind (str): 'inflow' ou 'outflow'.
+        quantity (int): Unidades movimentadas.
+        movements (int): Quantidade de movimentações registradas.
+    """
+    STOCK_MOVEMENTS.labels(kind).inc(movements)
+    STOCK_UNITS.labels(kind).inc(quantity)
+
+
+def is_multiprocess() -> bool:
+    return MULTIPROCESS_DIR_ENV in os.environ
+
+
+def get_worker_pids() -> list:
+    """
+    Lista os processos que registram métricas.
+
+    No modo multiprocesso, os PIDs vêm dos arquivos do diretório
+    compartilhado; do contrário, apenas o processo atual é considerado.
+
+    Returns:
+        list: PIDs dos processos.
+    """
+    if not is_multiprocess():
+        return [os.getpid()]
+    pattern = os.path.join(os.environ[MULTIPROCESS_DIR_ENV], '*.db')
+    pids = set()
+    for path in glob.glob(pattern):
+        pid = os.path.basename(path).rsplit('_', 1)[-1].removesuffix('.db')
+        if pid.isdigit():
+            pids.add(int(pid))
+    return sorted(pids)
+
+
+class ProcessStatsCollector:
+    """
+    Coletor com memória, CPU, threads e arquivos abertos de cada
+    processo (worker) da aplicação, lidos com o psutil.
+    """
+
+    def collect(self):
+        memory = GaugeMetricFamily(
+            'sge_worker_resident_memory_bytes',
+            'Memória residente do processo.',
+            labels=['pid'],
+        )
+        cpu = CounterMetricFamily(
+            'sge_worker_cpu_seconds',
+            'Tempo de CPU (usuário e sistema) do processo.',
+            labels=['pid'],
+        )
+        threads = GaugeMetricFamily(
+            'sge_worker_threads',
+            'Threads do processo.',
+            labels=['pid'],
+        )
+        open_files = GaugeMetricFamily(
+            'sge_worker_open_fds',
+            'Descritores de arquivo abertos pelo processo.',
+            labels=['pid'],
+        )
+        for pid in get_worker_pids():
+            try:
+                process = psutil.Process(pid)
+                with process.oneshot():
+                    times = process.cpu_times()
+                    label = [str(pid)]
+                    memory.add_metric(label, process.memory_info().rss)
+                    cpu.add_metric(label, times.user + times.system)
+                    threads.add_metric(label, process.num_threads())
+                    if hasattr(process, 'num_fds'):
+                        open_files.add_metric(label, process.num_fds())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        yield from (memory, cpu, threads, open_files)
+
+
+_process_registry = CollectorRegistry()
+_process_registry.register(ProcessStatsCollector())
+
+
+def render_metrics() -> bytes:
+    """
+    Gera as métricas no formato de exposição de texto do Prometheus.
+
+    Com a variável de ambiente `PROMETHEUS_MULTIPROC_DIR`, as métricas
+    de todos os workers são agregadas a partir dos arquivos mmap do
+    diretório compartilhado.
+
+    Returns:
+        bytes: Métricas no formato de texto.
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return generate_latest(registry) + generate_latest(_process_registry)
+    return generate_latest(REGISTRY) + generate_latest(_process_registry)
@@ -0,0 +1,264 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+
+def encode_cursor(values: list, direction: str) -> str:
+    """
+    Codifica a posição de um registro em um token opaco.
+
+    Args:
+        values (list): Valores dos campos de ordenação do registro.
+        direction (str): 'next' para avançar a partir do registro ou
+        'previous' para voltar a partir dele.
+
+    Returns:
+        str: Token seguro para ser usado na URL.
+    """
+    payload = json.dumps([direction, values], cls=DjangoJSONEncoder)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(token: str, fields=None):
+    """
+    Decodifica um token gerado por `encode_cursor`.
+
+    Quando os campos de ordenação são informados, o token deve ter um
+    valor, diferente de nulo, para cada campo, e cada valor é convertido
+    com o `to_python` do seu campo. Tokens editados à mão ou gerados para
+    outra ordenação são tratados como inválidos.
+
+    Args:
+        token (str): Token recebido na URL.
+        fields (list, optional): Campos do modelo (Field) usados na
+        ordenação.
+
+    Returns:
+        tuple | None: Direção e valores dos campos de ordenação, ou None
+        quando o token está vazio ou é inválido.
+    """
+    try:
+        direction, values = json.loads(base64.urlsafe_b64decode(token))
+    except (binascii.Error, ValueError, TypeError):
+        return None
+    if direction not in ('next', 'previous') or not isinstance(values, list):
+        return None
+    if fields is None:
+        return direction, values
+    if len(values) != len(fields) or None in values:
+        return None
+    try:
+        values = [
+            field.to_python(value) for field, value in zip(fields, values)
+        ]
+    except (ValidationError, ValueError, TypeError):
+        return None
+    return direction, values
+
+
+class CursorPage:
+    """
+    Página obtida por paginação por cursor (keyset).
+
+    Attributes:
+        object_list (list): Registros da página.
+        next_cursor (str | None): Token da próxima página.
+        previous_cursor (str | None): Token da página anterior.
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+def _keyset_filter(fields, values, lookup: str) -> Q:
+    condition = Q()
+    for index, field in enumerate(fields):
+        equal = {name: value for name, value in zip(fields[:index], values)}
+        condition |= Q(**equal, **{f'{field}__{lookup}': values[index]})
+    return condition
+
+
+def paginate_by_cursor(queryset, fields, page_size: int, token: str = ''):
+    """
+    Pagina um QuerySet por cursor, sem OFFSET e sem COUNT.
+
+    A página é obtida filtrando os registros posteriores (ou anteriores)
+    ao cursor na ordem de `fields`, o que mantém o custo constante em
+    qualquer profundidade desde que exista um índice sobre esses campos.
+    O último campo deve ser único para que a ordem seja total. Um token
+    inválido leva à primeira página.
+
+    Args:
+        queryset (QuerySet): Registros a serem paginados.
+        fields (tuple): Campos de ordenação, em ordem crescente.
+        page_size (int): Quantidade de registros por página.
+        token (str): Token da página pedida; vazio para a primeira.
+
+    Returns:
+        CursorPage: A página pedida.
+    """
+    model_fields = [queryset.model._meta.get_field(name) for name in fields]
+    cursor = decode_cursor(token, model_fields) if token else None
+    direction, values = cursor or ('next', None)
+
+    if direction == 'previous':
+        queryset = queryset.filter(_keyset_filter(fields, values, 'lt'))
+        queryset = queryset.order_by(*(f'-{field}' for field in fields))
+    else:
+        if values is not None:
+            queryset = queryset.filter(_keyset_filter(fields, values, 'gt'))
+        queryset = queryset.order_by(*fields)
+
+    object_list = list(queryset[: page_size + 1])
+    has_more = len(object_list) > page_size
+    object_list = object_list[:page_size]
+    if direction == 'previous':
+        object_list.reverse()
+
+    def position(obj):
+        return [getattr(obj, field) for field in fields]
+
+    has_next = has_more if direction == 'next' else True
+    has_previous = values is not None if direction == 'next' else has_more
+    next_cursor = previous_cursor = None
+    if object_list and has_next:
+        next_cursor = encode_cursor(position(object_list[-1]), 'next')
+    if object_list and has_previous:
+        previous_cursor = encode_cursor(position(object_list[0]), 'previous')
+    return CursorPage(object_list, next_cursor, previous_cursor)
+
+
+class CursorPaginationMixin:
+    """
+    Mixin que adiciona a uma ListView um modo opcional de paginação por
+    cursor, ativado pelo parâmetro `cursor` na URL (vazio para a primeira
+    página).
+
+    Os links de navegação preservam os demais parâmetros da requisição,
+    como os filtros da listagem.
+
+    Attributes:
+        cursor_ordering (tuple): Campos da ordenação por cursor; o último
+        deve ser único.
+        cursor_param (str): Parâmetro da URL que carrega o cursor.
+    """
+
+    cursor_ordering = ('id',)
+    cursor_param = 'cursor'
+
+    def is_cursor_pagination(self) -> bool:
+        return self.cursor_param in self.request.GET
+
+    def paginate_queryset(self, queryset, page_size):
+        if not self.is_cursor_pagination():
+            return super().paginate_queryset(queryset, page_size)
+        page = paginate_by_cursor(
+            queryset,
+            self.cursor_ordering,
+            page_size,
+            self.request.GET.get(self.cursor_param, ''),
+        )
+        return None, page, page.object_list, page.has_other_pages()
+
+    def _get_cursor_query(self, cursor: str) -> str:
+        params = self.request.GET.copy()
+        params.pop('page', None)
+        params[self.cursor_param] = cursor
+        return params.urlencode()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['cursor_pagination'] = self.is_cursor_pagination()
+        page = context.get('page_obj')
+        if context['cursor_pagination'] and page is not None:
+            context['cursor_first_query'] = self._get_cursor_query('')
+            if page.has_previous():
+                context['cursor_previous_query'] = self._get_cursor_query(
+                    page.previous_cursor
+                )
+            if page.has_next():
+                context['cursor_next_query'] = self._get_cursor_query(
+                    page.next_cursor
+                )
+        return context
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginador que usa a estimativa do planejador do PostgreSQL no lugar
+    do `COUNT(*)` em listagens grandes.
+
+    Sem filtros, a estimativa vem de `pg_class.reltuples`; com filtros,
+    do `EXPLAIN` da consulta. Quando a estimativa não passa de
+    `estimate_threshold`, ou em outros bancos como o SQLite, a contagem
+    exata é usada. `is_estimated` indica se o total é aproximado.
+
+    Attributes:
+        estimate_threshold (int): Total a partir do qual a estimativa é
+        usada no lugar da contagem exata.
+        is_estimated (bool): Indica se `count` é uma estimativa.
+    """
+
+    estimate_threshold = 100_000
+    is_estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self._estimate_count()
+        if estimate is not None and estimate > self.estimate_threshold:
+            self.is_estimated = True
+            return estimate
+        return super().count
+
+    def _estimate_count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class '
+                    'WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]['Plan']['Plan Rows']
+
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
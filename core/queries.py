@@ -0,0 +1,80 @@
+import threading
+import time
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_active_counters = ContextVar('query_counters', default=())
+
+
+def _count_query(execute, sql, params, many, context):
+    counters = _active_counters.get()
+    if not counters:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        for counter in counters:
+            counter.add(duration)
+
+
+def install_query_counter(connection) -> None:
+    """
+    Instala na conexão o `execute_wrapper` que alimenta os `QueryCounter`
+    ativos no contexto atual.
+
+    O wrapper fica no início da lista, para que o `pop` feito ao fim de
+    outros `connection.execute_wrapper` não o remova.
+
+    Args:
+        connection (BaseDatabaseWrapper): Conexão com o banco.
+    """
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _count_query)
+
+
+@receiver(connection_created)
+def install_on_new_connection(sender, connection, **kwargs):
+    install_query_counter(connection)
+
+
+class QueryCounter:
+    """
+    Conta as consultas SQL e o tempo gasto nelas enquanto estiver ativo,
+    em todas as conexões configuradas.
+
+    Usa `execute_wrapper`, então funciona também com `DEBUG=False`. O
+    contador ativo fica em uma `ContextVar`, que é copiada para as threads
+    de `sync_to_async`: consultas feitas nelas, em outras conexões, também
+    são contadas, inclusive em views assíncronas.
+
+    Attributes:
+        count (int): Quantidade de consultas executadas.
+        duration (float): Tempo total das consultas, em segundos; consultas
+        em threads paralelas são somadas.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self._lock = threading.Lock()
+        self._token = None
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.duration += seconds
+
+    def __enter__(self):
+        for connection in connections.all(initialized_only=True):
+            install_query_counter(connection)
+        self._token = _active_counters.set((*_active_counters.get(), self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active_counters.reset(self._token)
+        self._token = None
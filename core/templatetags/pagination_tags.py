@@ -0,0 +1,45 @@
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag
+def elided_page_range(page_obj, on_each_side: int = 3, on_ends: int = 1):
+    """
+    Retorna apenas os números de página exibidos ao redor da página atual.
+
+    As páginas omitidas são representadas por `Paginator.ELLIPSIS`, de
+    forma que o template percorre poucos itens independentemente do total
+    de páginas.
+
+    Args:
+        page_obj (Page): Página atual.
+        on_each_side (int): Páginas exibidas de cada lado da atual.
+        on_ends (int): Páginas exibidas no início e no fim.
+
+    Returns:
+        list: Números de página e reticências a serem exibidos.
+    """
+    return list(
+        page_obj.paginator.get_elided_page_range(
+            page_obj.number, on_each_side=on_each_side, on_ends=on_ends
+        )
+    )
+
+
+@register.simple_tag(takes_context=True)
+def page_query(context, page_number) -> str:
+    """
+    Monta a query string de uma página preservando os filtros da
+    requisição atual.
+
+    Args:
+        context (Context): Contexto do template, com a requisição.
+        page_number (int): Número da página do link.
+
+    Returns:
+        str: Query string com os parâmetros atuais e a página informada.
+    """
+    params = context['request'].GET.copy()
+    params['page'] = page_number
+    return params.urlencode()
@@ -0,0 +1,120 @@
+from abc import ABC, abstractmethod
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import URLResolver, get_resolver, reverse
+
+from core.queries import QueryCounter
+
+
+class QueryCountScalingMixin(ABC):
+    """
+    Mixin de testes que acessa todas as URLs do projeto com poucos e com
+    muitos registros e falha quando o número de consultas de alguma view
+    cresce com a quantidade de registros (N+1).
+
+    A subclasse implementa `seed`, que cria registros em todas as
+    tabelas usadas pelas views. O parâmetro `pk` das URLs é preenchido com
+    o primeiro registro do modelo da view; outros parâmetros vêm de
+    `url_kwargs`.
+
+    Attributes:
+        exclude_url_names (set): URLs ignoradas, pelo nome.
+        exclude_namespaces (set): Namespaces ignorados, como o do admin.
+        url_kwargs (dict): Nome da URL -> parâmetros usados no `reverse`.
+        small_seed (int): Registros criados na primeira medição.
+        large_seed (int): Registros existentes na segunda medição; deve
+        passar do tamanho das páginas das listagens.
+    """
+
+    exclude_url_names = {'logout'}
+    exclude_namespaces = {'admin'}
+    url_kwargs = {}
+    small_seed = 1
+    large_seed = 15
+
+    @abstractmethod
+    def seed(self, rows: int) -> None:
+        """
+        Cria `rows` registros em cada tabela usada pelas views.
+
+        Args:
+            rows (int): Quantidade de registros a criar.
+        """
+
+    def _iter_patterns(self, patterns, namespace=''):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                if pattern.namespace in self.exclude_namespaces:
+                    continue
+                prefix = namespace
+                if pattern.namespace:
+                    prefix = f'{namespace}{pattern.namespace}:'
+                yield from self._iter_patterns(pattern.url_patterns, prefix)
+            elif pattern.name and pattern.name not in self.exclude_url_names:
+                yield f'{namespace}{pattern.name}', pattern
+
+    def _get_kwargs(self, name, pattern) -> dict:
+        kwargs = dict(self.url_kwargs.get(name, {}))
+        for key in pattern.pattern.converters:
+            if key in kwargs:
+                continue
+            model = getattr(
+                getattr(pattern.callback, 'view_class', None), 'model', None
+            )
+            if key != 'pk' or model is None:
+                self.fail(
+                    f'Informe o parâmetro {key!r} da URL {name!r} em '
+                    'url_kwargs ou ignore a URL em exclude_url_names.'
+                )
+            kwargs[key] = model.objects.order_by('pk').first().pk
+        return kwargs
+
+    def get_urls(self) -> dict:
+        """
+        Monta as URLs testadas.
+
+        Returns:
+            dict: Nome da URL -> caminho.
+        """
+        return {
+            name: reverse(name, kwargs=self._get_kwargs(name, pattern))
+            for name, pattern in self._iter_patterns(
+                get_resolver().url_patterns
+            )
+        }
+
+    def count_queries(self, url: str) -> int:
+        """
+        Acessa a URL com os caches limpos e conta as consultas executadas.
+
+        Args:
+            url (str): Caminho acessado.
+
+        Returns:
+            int: Quantidade de consultas executadas.
+        """
+        for cache in caches.all():
+            cache.clear()
+        with QueryCounter() as counter:
+            response = self.client.get(url)
+        self.assertLess(response.status_code, 400, url)
+        return counter.count
+
+    def test_numero_de_consultas_nao_cresce_com_os_registros(self):
+        """
+        Testa se nenhuma URL executa mais consultas com mais registros.
+        """
+        self.client.force_login(
+            User.objects.create_superuser(username='querycount')
+        )
+        self.seed(self.small_seed)
+        urls = self.get_urls()
+        expected = {
+            name: self.count_queries(url) for name, url in urls.items()
+        }
+
+        self.seed(self.large_seed - self.small_seed)
+        for name, url in urls.items():
+            with self.subTest(url=name):
+                self.assertEqual(self.count_queries(url), expected[name])
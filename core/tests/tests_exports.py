@@ -0,0 +1,68 @@
+from datetime import datetime
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from core.exports import stream_csv, stream_jsonl
+
+
+class TestsStreamExports(SimpleTestCase):
+    """
+    Testes para a geração das exportações em CSV e JSON Lines.
+    """
+
+    def test_stream_csv_gera_cabecalho_e_uma_linha_por_vez(self):
+        """
+        Testa se o CSV é gerado com o cabeçalho e uma linha por item,
+        com aspas quando necessário.
+        """
+        resultado = list(
+            stream_csv(('id', 'title'), [(1, 'Mouse'), (2, 'Teclado, ABNT')])
+        )
+        self.assertEqual(
+            resultado, ['id,title\r\n', '1,Mouse\r\n', '2,"Teclado, ABNT"\r\n']
+        )
+
+    def test_stream_csv_escapa_formulas(self):
+        """
+        Testa se textos que seriam interpretados como fórmula por
+        planilhas recebem um apóstrofo, sem alterar números.
+        """
+        rows = [
+            ('=HYPERLINK("http://x")', '+1', '-2', '@SUM(A1)', -3, 'Mouse')
+        ]
+        resultado = list(stream_csv(('a', 'b', 'c', 'd', 'e', 'f'), rows))
+        self.assertEqual(
+            resultado[1],
+            '"\'=HYPERLINK(""http://x"")",\'+1,\'-2,\'@SUM(A1),-3,Mouse\r\n',
+        )
+
+    def test_stream_jsonl_gera_um_objeto_por_linha(self):
+        """
+        Testa se cada linha vira um objeto JSON, com decimais, datas e
+        acentos preservados.
+        """
+        rows = [
+            (1, 'Teclado Mecânico', Decimal('185.00'), datetime(2024, 5, 1))
+        ]
+        resultado = list(stream_jsonl(('id', 'title', 'price', 'date'), rows))
+        self.assertEqual(
+            resultado,
+            [
+                '{"id": 1, "title": "Teclado Mecânico", "price": "185.00", '
+                '"date": "2024-05-01T00:00:00"}\n'
+            ],
+        )
+
+    def test_stream_e_preguicoso(self):
+        """
+        Testa se as linhas são lidas conforme o conteúdo é consumido.
+        """
+
+        def rows():
+            yield (1,)
+            raise AssertionError('Linha lida antes do necessário.')
+
+        stream = stream_csv(('id',), rows())
+        self.assertEqual(next(stream), 'id\r\n')
+        self.assertEqual(next(stream), '1\r\n')
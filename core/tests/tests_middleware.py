@@ -0,0 +1,237 @@
+from asgiref.sync import (
+    async_to_sync,
+    iscoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.middleware import (
+    ProfilerMiddleware,
+    PrometheusMiddleware,
+    QueryBudgetExceeded,
+    ServerTimingMiddleware,
+)
+from core.queries import QueryCounter
+from dashboards.metrics import get_dashboard_metric_calls
+
+
+def _select_in_thread():
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+    finally:
+        connections.close_all()
+
+
+class TestsQueryCounter(TestCase):
+    """
+    Testes para o contador de consultas usado pelos middlewares.
+    """
+
+    def test_conta_consultas_do_bloco(self):
+        """
+        Testa se as consultas feitas dentro do bloco são contadas e as
+        feitas depois dele não.
+        """
+        with QueryCounter() as counter:
+            User.objects.count()
+        User.objects.count()
+        self.assertEqual(counter.count, 1)
+        self.assertGreater(counter.duration, 0)
+
+    def test_contadores_aninhados_contam_a_mesma_consulta(self):
+        """
+        Testa se uma consulta é contada por todos os contadores ativos.
+        """
+        with QueryCounter() as outer:
+            with QueryCounter() as inner:
+                User.objects.count()
+            User.objects.count()
+        self.assertEqual((outer.count, inner.count), (2, 1))
+
+    def test_conta_consultas_feitas_em_outra_thread(self):
+        """
+        Testa se as consultas feitas com `sync_to_async`, em outra thread
+        e em outra conexão, também são contadas.
+        """
+        run = sync_to_async(_select_in_thread, thread_sensitive=False)
+        with QueryCounter() as counter:
+            async_to_sync(run)()
+        self.assertEqual(counter.count, 1)
+
+
+@override_settings(
+    QUERY_BUDGET_ENABLED=True,
+    QUERY_BUDGET_RAISE=False,
+    QUERY_BUDGET_DEFAULT=100,
+    QUERY_BUDGETS={'brand_list': 1},
+)
+class TestsQueryBudgetMiddleware(TestCase):
+    """
+    Testes para o middleware de orçamento de consultas.
+    """
+
+    def setUp(self):
+        """
+        Autentica um superusuário para acessar as listagens.
+        """
+        self.client.force_login(User.objects.create_superuser(username='a'))
+
+    def test_registra_aviso_quando_passa_do_orcamento(self):
+        """
+        Testa se o excesso de consultas é registrado no log, com a
+        quantidade de consultas e o orçamento.
+        """
+        with self.assertLogs('core.middleware', 'WARNING') as logs:
+            response = self.client.get(reverse('brand_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('acima do orçamento de 1', logs.output[0])
+
+    def test_usa_orcamento_padrao_para_outras_views(self):
+        """
+        Testa se views sem orçamento próprio usam o orçamento padrão.
+        """
+        with self.assertNoLogs('core.middleware', 'WARNING'):
+            self.client.get(reverse('category_list'))
+
+    @override_settings(QUERY_BUDGET_RAISE=True)
+    def test_levanta_erro_com_query_budget_raise(self):
+        """
+        Testa se o excesso levanta `QueryBudgetExceeded` quando
+        `QUERY_BUDGET_RAISE` está ativo.
+        """
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse('brand_list'))
+
+    @override_settings(QUERY_BUDGET_ENABLED=False)
+    def test_desativado_nao_verifica_orcamento(self):
+        """
+        Testa se o middleware não faz nada quando desativado.
+        """
+        with self.assertNoLogs('core.middleware', 'WARNING'):
+            self.client.get(reverse('brand_list'))
+
+
+class TestsServerTimingMiddleware(TestCase):
+    """
+    Testes para o cabeçalho `Server-Timing` e o perfil das requisições.
+    """
+
+    def setUp(self):
+        """
+        Autentica um usuário da equipe com acesso a todas as views.
+        """
+        self.user = User.objects.create_superuser(username='a')
+        self.client.force_login(self.user)
+
+    def _get_steps(self, response):
+        return {
+            entry.split(';')[0]
+            for entry in response['Server-Timing'].split(', ')
+        }
+
+    def test_listagem_informa_banco_template_e_total(self):
+        """
+        Testa se as views genéricas informam os tempos de banco,
+        template e total.
+        """
+        response = self.client.get(reverse('brand_list'))
+        self.assertEqual(
+            self._get_steps(response), {'db', 'template', 'total'}
+        )
+        self.assertIn('consultas"', response['Server-Timing'])
+
+    def test_dashboard_informa_tempo_das_metricas(self):
+        """
+        Testa se o dashboard informa o tempo gasto nas métricas.
+        """
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        response = self.client.get(reverse('home'))
+        self.assertIn('metrics', self._get_steps(response))
+        self.assertIn('template', self._get_steps(response))
+
+    def test_usuario_da_equipe_recebe_perfil_da_requisicao(self):
+        """
+        Testa se o parâmetro `profile` devolve o perfil da requisição
+        para usuários da equipe.
+        """
+        response = self.client.get(reverse('brand_list'), {'profile': '10'})
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertContains(response, 'function calls')
+        self.assertContains(response, 'called...')
+
+    def test_usuario_fora_da_equipe_ignora_o_parametro(self):
+        """
+        Testa se o parâmetro `profile` é ignorado para quem não é da
+        equipe.
+        """
+        self.user.is_staff = False
+        self.user.save()
+        response = self.client.get(reverse('brand_list'), {'profile': ''})
+        self.assertTemplateUsed(response, 'brand_list.html')
+
+
+class TestsAsyncMiddleware(TestCase):
+    """
+    Testes para os middlewares de instrumentação em requisições
+    assíncronas.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário da equipe com acesso a todas as views.
+        """
+        self.user = User.objects.create_superuser(username='a')
+
+    def test_middlewares_sao_corrotinas_com_get_response_assincrono(self):
+        """
+        Testa se os middlewares viram corrotinas quando o próximo da
+        cadeia é assíncrono, e continuam síncronos do contrário.
+        """
+
+        async def get_response(request):
+            return HttpResponse()
+
+        for middleware in (
+            PrometheusMiddleware,
+            ServerTimingMiddleware,
+            ProfilerMiddleware,
+        ):
+            with self.subTest(middleware=middleware.__name__):
+                self.assertTrue(iscoroutinefunction(middleware(get_response)))
+                self.assertFalse(iscoroutinefunction(middleware(HttpResponse)))
+
+    async def test_dashboard_assincrono_conta_consultas_das_threads(self):
+        """
+        Testa se o `Server-Timing` do dashboard assíncrono conta as
+        consultas das métricas, feitas em outras threads, ao menos uma
+        por métrica.
+        """
+        await sync_to_async(caches[settings.METRICS_CACHE_ALIAS].clear)()
+        await self.async_client.aforce_login(self.user)
+        with QueryCounter() as counter:
+            response = await self.async_client.get(reverse('home_async'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            f'desc="{counter.count} consultas"', response['Server-Timing']
+        )
+        metric_count = len(get_dashboard_metric_calls(None, None, 'day'))
+        self.assertGreaterEqual(counter.count, metric_count)
+
+    async def test_usuario_da_equipe_recebe_perfil_assincrono(self):
+        """
+        Testa se o parâmetro `profile` também devolve o perfil das
+        requisições assíncronas.
+        """
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(
+            reverse('home_async'), {'profile': '10'}
+        )
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertContains(response, 'function calls')
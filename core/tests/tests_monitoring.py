@@ -0,0 +1,150 @@
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from prometheus_client.mmap_dict import MmapedDict, mmap_key
+
+from brand.models import Brand
+from categories.models import Category
+from core.monitoring import get_worker_pids, render_metrics
+from inflows.models import Inflow
+from outflows.models import Outflow
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsPrometheusMetrics(TestCase):
+    """
+    Testes para o endpoint de métricas do Prometheus.
+    """
+
+    def _get_value(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_endpoint_retorna_formato_de_texto(self):
+        """
+        Testa se o endpoint responde no formato de exposição de texto,
+        com as estatísticas dos processos.
+        """
+        response = self.client.get(reverse('prometheus_metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertContains(
+            response,
+            f'sge_worker_resident_memory_bytes{{pid="{os.getpid()}"}}',
+        )
+
+    def test_requisicao_registra_duracao_e_consultas_por_url(self):
+        """
+        Testa se as requisições são registradas pelo nome da URL, com a
+        duração e as consultas SQL.
+        """
+        self.client.force_login(User.objects.create_superuser(username='a'))
+        labels = {'view': 'brand_list', 'method': 'GET'}
+        before = self._get_value(
+            'sge_http_request_duration_seconds_count', **labels
+        )
+        queries = self._get_value('sge_db_queries_total', view='brand_list')
+
+        self.client.get(reverse('brand_list'))
+
+        after = self._get_value(
+            'sge_http_request_duration_seconds_count', **labels
+        )
+        self.assertEqual(after, before + 1)
+        self.assertGreater(
+            self._get_value('sge_db_queries_total', view='brand_list'),
+            queries,
+        )
+
+    def test_movimentacoes_de_estoque_sao_contadas_apos_o_commit(self):
+        """
+        Testa se entradas e saídas incrementam os contadores de
+        movimentação apenas após o commit.
+        """
+        product = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=Brand.objects.create(name='Microsoft'),
+            category=Category.objects.create(name='Mouse'),
+            cost_price=80.00,
+            selling_price=120.00,
+        )
+        inflows = self._get_value('sge_stock_units_total', kind='inflow')
+        outflows = self._get_value('sge_stock_movements_total', kind='outflow')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Inflow.objects.create(
+                supplier=Supplier.objects.create(name='Ivan'),
+                product=product,
+                quantity=10,
+            )
+            Outflow.objects.create(product=product, quantity=3)
+            self.assertEqual(
+                self._get_value('sge_stock_units_total', kind='inflow'),
+                inflows,
+            )
+
+        self.assertEqual(
+            self._get_value('sge_stock_units_total', kind='inflow'),
+            inflows + 10,
+        )
+        self.assertEqual(
+            self._get_value('sge_stock_movements_total', kind='outflow'),
+            outflows + 1,
+        )
+
+    @override_settings(PROMETHEUS_METRICS_TOKEN='segredo')
+    def test_endpoint_com_token_exige_autorizacao(self):
+        """
+        Testa se o endpoint exige o token quando configurado.
+        """
+        url = reverse('prometheus_metrics')
+        self.assertEqual(self.client.get(url).status_code, 403)
+        response = self.client.get(
+            url, headers={'Authorization': 'Bearer segredo'}
+        )
+        self.assertEqual(response.status_code, 200)
+
+
+class TestsPrometheusMultiprocess(SimpleTestCase):
+    """
+    Testes para a agregação das métricas de vários workers.
+    """
+
+    def setUp(self):
+        """
+        Simula dois workers gravando um contador no diretório
+        compartilhado.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        key = mmap_key(
+            'sge_stock_movements',
+            'sge_stock_movements_total',
+            ['kind'],
+            ['outflow'],
+            'Movimentações de estoque registradas, por tipo.',
+        )
+        for pid, value in ((101, 2), (102, 3)):
+            path = os.path.join(self.directory.name, f'counter_{pid}.db')
+            values = MmapedDict(path)
+            values.write_value(key, value, 0)
+            values.close()
+
+    def test_soma_os_contadores_de_todos_os_workers(self):
+        """
+        Testa se os contadores dos workers são somados e se os PIDs vêm
+        dos arquivos do diretório.
+        """
+        environ = {'PROMETHEUS_MULTIPROC_DIR': self.directory.name}
+        with mock.patch.dict(os.environ, environ):
+            self.assertEqual(get_worker_pids(), [101, 102])
+            output = render_metrics().decode()
+        self.assertIn('sge_stock_movements_total{kind="outflow"} 5.0', output)
+
+    def tearDown(self):
+        """Remove o diretório compartilhado."""
+        self.directory.cleanup()
@@ -0,0 +1,200 @@
+from unittest import mock
+
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from core.pagination import (
+    EstimatedCountPaginator,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from products.models import Product
+
+
+class TestsCursor(TestCase):
+    """Testes para a codificação dos cursores de paginação."""
+
+    def test_encode_e_decode_retornam_a_mesma_posicao(self):
+        """Testa se um cursor decodificado retorna a posição original."""
+        token = encode_cursor(['Mouse', 10], 'next')
+        self.assertEqual(decode_cursor(token), ('next', ['Mouse', 10]))
+
+    def test_decode_de_token_invalido_retorna_none(self):
+        """Testa se tokens inválidos são ignorados."""
+        self.assertIsNone(decode_cursor('invalido'))
+        self.assertIsNone(decode_cursor(encode_cursor(['a'], 'lado')))
+        self.assertIsNone(decode_cursor('MTIz'))
+
+    def test_decode_converte_valores_pelos_campos(self):
+        """
+        Testa se os valores são convertidos pelos campos de ordenação e
+        se valores incompatíveis, nulos ou em excesso são rejeitados.
+        """
+        fields = [Product._meta.get_field(name) for name in ('title', 'id')]
+        token = encode_cursor(['Mouse', '10'], 'next')
+        self.assertEqual(decode_cursor(token, fields), ('next', ['Mouse', 10]))
+        for values in (['Mouse', 'abc'], [None, 10], ['Mouse', 10, 1]):
+            with self.subTest(values=values):
+                token = encode_cursor(values, 'next')
+                self.assertIsNone(decode_cursor(token, fields))
+
+
+class TestsPaginateByCursor(TestCase):
+    """Testes para a paginação por cursor."""
+
+    def setUp(self):
+        """Cria 7 produtos, alguns com o mesmo título."""
+        category = Category.objects.create(name='Mouse')
+        brand = Brand.objects.create(name='Microsoft')
+        for title in ['A', 'B', 'B', 'B', 'C', 'D', 'E']:
+            Product.objects.create(
+                title=title,
+                brand=brand,
+                category=category,
+                cost_price=1,
+                selling_price=2,
+            )
+        self.queryset = Product.objects.all()
+        self.fields = ('title', 'id')
+        self.expected = list(self.queryset.order_by('title', 'id'))
+
+    def _paginate(self, token=''):
+        return paginate_by_cursor(self.queryset, self.fields, 3, token)
+
+    def test_avanca_por_todas_as_paginas_sem_repetir_registros(self):
+        """
+        Testa se percorrer as páginas para frente retorna todos os
+        registros na ordem, inclusive com títulos repetidos.
+        """
+        pages = [self._paginate()]
+        while pages[-1].has_next():
+            pages.append(self._paginate(pages[-1].next_cursor))
+
+        self.assertEqual(
+            [product for page in pages for product in page], self.expected
+        )
+        self.assertFalse(pages[0].has_previous())
+        self.assertEqual(len(pages), 3)
+
+    def test_volta_para_a_pagina_anterior(self):
+        """Testa se o cursor anterior retorna a página anterior."""
+        first = self._paginate()
+        second = self._paginate(first.next_cursor)
+        back = self._paginate(second.previous_cursor)
+
+        self.assertEqual(back.object_list, first.object_list)
+        self.assertFalse(back.has_previous())
+        self.assertTrue(back.has_next())
+
+    def test_cada_pagina_executa_uma_unica_query(self):
+        """Testa se a página é obtida sem COUNT e com uma única query."""
+        token = self._paginate().next_cursor
+        with self.assertNumQueries(1):
+            self._paginate(token)
+
+    def test_cursor_invalido_retorna_primeira_pagina(self):
+        """Testa se um cursor inválido retorna a primeira página."""
+        page = self._paginate('invalido')
+        self.assertEqual(page.object_list, self.expected[:3])
+
+
+class TestsEstimatedCountPaginator(TestCase):
+    """Testes para o paginador com contagem estimada."""
+
+    def setUp(self):
+        """Cria 3 marcas para a paginação."""
+        for name in ['Dell', 'Lenovo', 'Microsoft']:
+            Brand.objects.create(name=name)
+        self.queryset = Brand.objects.all()
+
+    def test_sqlite_usa_contagem_exata(self):
+        """Testa se o SQLite não usa estimativa e conta exatamente."""
+        paginator = EstimatedCountPaginator(self.queryset, 2)
+        self.assertIsNone(paginator._estimate_count())
+        self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.is_estimated)
+
+    def test_estimativa_acima_do_limite_substitui_a_contagem(self):
+        """
+        Testa se uma estimativa acima do limite é usada como total,
+        sem executar COUNT.
+        """
+        paginator = EstimatedCountPaginator(self.queryset, 2)
+        with (
+            mock.patch.object(
+                paginator, '_estimate_count', return_value=500_000
+            ),
+            self.assertNumQueries(0),
+        ):
+            self.assertEqual(paginator.count, 500_000)
+        self.assertTrue(paginator.is_estimated)
+        self.assertEqual(paginator.num_pages, 250_000)
+
+    def test_estimativa_abaixo_do_limite_usa_contagem_exata(self):
+        """Testa se tabelas pequenas continuam com a contagem exata."""
+        paginator = EstimatedCountPaginator(self.queryset, 2)
+        with mock.patch.object(paginator, '_estimate_count', return_value=50):
+            self.assertEqual(paginator.count, 3)
+        self.assertFalse(paginator.is_estimated)
+
+    def test_postgresql_sem_filtro_usa_reltuples(self):
+        """
+        Testa se, no PostgreSQL, a listagem sem filtros consulta a
+        estimativa de linhas do pg_class.
+        """
+        cursor = mock.MagicMock()
+        cursor.__enter__.return_value.fetchone.return_value = (250_000,)
+        connection = mock.Mock(vendor='postgresql')
+        connection.cursor.return_value = cursor
+        paginator = EstimatedCountPaginator(self.queryset, 2)
+
+        with mock.patch(
+            'core.pagination.connections', {'default': connection}
+        ):
+            self.assertEqual(paginator._estimate_count(), 250_000)
+
+        sql = cursor.__enter__.return_value.execute.call_args.args[0]
+        self.assertIn('pg_class', sql)
+
+    def test_postgresql_com_filtro_usa_explain(self):
+        """
+        Testa se, no PostgreSQL, a listagem filtrada usa a estimativa
+        do EXPLAIN da consulta.
+        """
+        cursor = mock.MagicMock()
+        cursor.__enter__.return_value.fetchone.return_value = (
+            [{'Plan': {'Plan Rows': 120_000}}],
+        )
+        connection = mock.Mock(vendor='postgresql')
+        connection.cursor.return_value = cursor
+        paginator = EstimatedCountPaginator(
+            self.queryset.filter(name__istartswith='D'), 2
+        )
+
+        with mock.patch(
+            'core.pagination.connections', {'default': connection}
+        ):
+            self.assertEqual(paginator._estimate_count(), 120_000)
+
+        sql = cursor.__enter__.return_value.execute.call_args.args[0]
+        self.assertTrue(sql.startswith('EXPLAIN (FORMAT JSON)'))
+
+    def test_componente_exibe_indicador_de_estimativa(self):
+        """
+        Testa se o componente de paginação indica que o total
+        é estimado.
+        """
+        paginator = EstimatedCountPaginator(self.queryset, 2)
+        with mock.patch.object(
+            paginator, '_estimate_count', return_value=500_000
+        ):
+            html = render_to_string(
+                'components/_pagination.html',
+                {'page_obj': paginator.page(1)},
+                request=RequestFactory().get('/brands/list/'),
+            )
+        self.assertIn('Última (~)', html)
+        self.assertIn('~500000 registros', html)
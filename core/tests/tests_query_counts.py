@@ -0,0 +1,55 @@
+from itertools import count
+
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from core.testing import QueryCountScalingMixin
+from inflows.models import Inflow
+from outflows.models import Outflow
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsQueryCountScaling(QueryCountScalingMixin, TestCase):
+    """
+    Testes que garantem que nenhuma URL do projeto tem N+1.
+    """
+
+    # As métricas do dashboard assíncrono rodam em outras threads, fora
+    # da transação do teste. O endpoint de pedidos aceita apenas POST, e
+    # suas consultas são verificadas em outflows.tests.tests_orders.
+    exclude_url_names = QueryCountScalingMixin.exclude_url_names | {
+        'home_async',
+        'sales_order_create',
+    }
+    url_kwargs = {'metric_api': {'metric': 'product_metrics'}}
+
+    def setUp(self):
+        """
+        Prepara o contador usado para gerar nomes únicos.
+        """
+        self.sequence = count()
+
+    def seed(self, rows):
+        """
+        Cria `rows` registros de cada modelo, com marcas, categorias e
+        fornecedores distintos por produto.
+        """
+        for _ in range(rows):
+            index = next(self.sequence)
+            product = Product.objects.create(
+                title=f'Produto {index}',
+                brand=Brand.objects.create(name=f'Marca {index}'),
+                category=Category.objects.create(name=f'Categoria {index}'),
+                serie_number=f'SN{index}',
+                cost_price=10.00,
+                selling_price=15.00,
+                quantity=100,
+            )
+            Inflow.objects.create(
+                supplier=Supplier.objects.create(name=f'Fornecedor {index}'),
+                product=product,
+                quantity=10,
+            )
+            Outflow.objects.create(product=product, quantity=1)
@@ -0,0 +1,57 @@
+from django.core.paginator import Paginator
+from django.template.loader import render_to_string
+from django.test import RequestFactory, TestCase
+
+from core.templatetags.pagination_tags import elided_page_range
+
+
+class TestsPaginationTags(TestCase):
+    """Testes para as template tags e o componente de paginação."""
+
+    def setUp(self):
+        """Cria um paginador com 100 mil páginas."""
+        self.paginator = Paginator(range(1_000_000), 10)
+        self.factory = RequestFactory()
+
+    def _render(self, page_number, query=''):
+        request = self.factory.get(f'/products/list/?{query}')
+        return render_to_string(
+            'components/_pagination.html',
+            {'page_obj': self.paginator.page(page_number)},
+            request=request,
+        )
+
+    def test_elided_page_range_retorna_apenas_paginas_proximas(self):
+        """
+        Testa se apenas as páginas próximas da atual, a primeira e a
+        última são retornadas.
+        """
+        page_range = elided_page_range(self.paginator.page(50_000))
+        ellipsis = self.paginator.ELLIPSIS
+        self.assertEqual(
+            page_range,
+            [1, ellipsis, *range(49_997, 50_004), ellipsis, 100_000],
+        )
+
+    def test_componente_exibe_reticencias_e_pagina_ativa(self):
+        """
+        Testa se o componente exibe as reticências e destaca a
+        página atual.
+        """
+        html = self._render(50_000)
+        self.assertEqual(html.count('…'), 2)
+        self.assertInHTML(
+            '<li class="page-item active">'
+            '<a class="page-link" href="?page=50000">50000</a></li>',
+            html,
+        )
+
+    def test_componente_preserva_filtros_nos_links(self):
+        """
+        Testa se os links das páginas preservam os filtros da requisição.
+        """
+        html = self._render(3, 'title=Mouse&brand=2&page=3')
+        self.assertIn('href="?title=Mouse&amp;brand=2&amp;page=4"', html)
+        self.assertIn('href="?title=Mouse&amp;brand=2&amp;page=1"', html)
+        self.assertIn('href="?title=Mouse&amp;brand=2&amp;page=100000"', html)
+        self.assertNotIn('page=3&amp;page', html)
@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase
+
+from core.timing import ServerTimings, collect_timings, timed, track_time
+
+
+class TestsTiming(SimpleTestCase):
+    """
+    Testes para a coleta de tempos do cabeçalho `Server-Timing`.
+    """
+
+    def test_track_time_soma_a_etapa_da_requisicao(self):
+        """
+        Testa se o tempo do bloco é somado à etapa informada.
+        """
+        with collect_timings() as timings:
+            with track_time('metrics'):
+                pass
+            with track_time('metrics'):
+                pass
+        self.assertEqual(list(timings.durations), ['metrics'])
+
+    def test_blocos_aninhados_da_mesma_etapa_contam_uma_vez(self):
+        """
+        Testa se um bloco dentro de outro da mesma etapa não é somado
+        em dobro.
+        """
+
+        @timed('metrics')
+        def inner():
+            return 'ok'
+
+        with collect_timings() as timings:
+            with track_time('metrics'):
+                self.assertEqual(inner(), 'ok')
+                self.assertEqual(dict(timings.durations), {})
+        self.assertEqual(list(timings.durations), ['metrics'])
+
+    def test_timed_fora_de_requisicao_nao_faz_nada(self):
+        """
+        Testa se funções decoradas funcionam fora de uma requisição
+        instrumentada.
+        """
+        self.assertEqual(timed('metrics')(lambda: 42)(), 42)
+
+    def test_as_header_formata_em_milissegundos(self):
+        """
+        Testa se o cabeçalho traz as durações em milissegundos e as
+        descrições das etapas.
+        """
+        timings = ServerTimings()
+        timings.add('db', 0.0125, '3 consultas')
+        timings.add('total', 0.05)
+        esperado = 'db;dur=12.5;desc="3 consultas", total;dur=50.0'
+        self.assertEqual(timings.as_header(), esperado)
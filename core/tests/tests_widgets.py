@@ -0,0 +1,77 @@
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from inflows.forms import InflowForm
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsAutocompleteSelect(TestCase):
+    """
+    Testes para o widget de select com autocomplete.
+    """
+
+    def setUp(self):
+        """
+        Cria produtos e um fornecedor para os formulários de entrada.
+        """
+        brand = Brand.objects.create(name='Microsoft')
+        category = Category.objects.create(name='Mouse')
+        self.products = [
+            Product.objects.create(
+                title=f'Mouse {index:02d}',
+                brand=brand,
+                category=category,
+                cost_price=80.00,
+                selling_price=120.00,
+            )
+            for index in range(5)
+        ]
+        self.supplier = Supplier.objects.create(name='Ivan')
+
+    def test_formulario_vazio_nao_consulta_o_banco(self):
+        """
+        Testa se o formulário sem valores é renderizado sem consultar
+        produtos nem fornecedores.
+        """
+        with self.assertNumQueries(0):
+            html = str(InflowForm())
+        self.assertNotIn('Mouse 00', html)
+        self.assertIn('data-autocomplete-url="/products/autocomplete/"', html)
+        self.assertIn('data-autocomplete-url="/suppliers/autocomplete/"', html)
+
+    def test_formulario_renderiza_apenas_a_opcao_selecionada(self):
+        """
+        Testa se apenas o produto selecionado é renderizado como opção.
+        """
+        form = InflowForm(
+            initial={'product': self.products[2].pk},
+        )
+        html = str(form['product'])
+        self.assertIn('Mouse 02', html)
+        self.assertIn('selected', html)
+        self.assertNotIn('Mouse 01', html)
+
+    def test_formulario_ignora_valor_invalido(self):
+        """
+        Testa se um valor inválido não quebra a renderização do campo.
+        """
+        form = InflowForm(data={'product': 'abc'})
+        self.assertFalse(form.is_valid())
+        self.assertNotIn('Mouse', str(form['product']))
+
+    def test_validacao_faz_uma_consulta_por_campo(self):
+        """
+        Testa se a validação busca produto e fornecedor apenas pela chave
+        primária, com uma consulta para cada.
+        """
+        form = InflowForm(
+            data={
+                'supplier': self.supplier.pk,
+                'product': self.products[0].pk,
+                'quantity': 3,
+            }
+        )
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid())
@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+_current_timings = ContextVar('server_timings', default=None)
+_active_steps = ContextVar('server_timing_steps', default=frozenset())
+
+
+class ServerTimings:
+    """
+    Acumula, por requisição, o tempo gasto em cada etapa (banco,
+    templates, métricas...), exposto no cabeçalho `Server-Timing`.
+
+    Attributes:
+        durations (dict): Etapa -> tempo acumulado, em segundos.
+        descriptions (dict): Etapa -> descrição exibida no cabeçalho.
+    """
+
+    def __init__(self):
+        self.durations = defaultdict(float)
+        self.descriptions = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, description: str = '') -> None:
+        with self._lock:
+            self.durations[name] += seconds
+            if description:
+                self.descriptions[name] = description
+
+    def as_header(self) -> str:
+        """
+        Formata as etapas no padrão do cabeçalho `Server-Timing`.
+
+        Returns:
+            str: Valor do cabeçalho, com as durações em milissegundos.
+        """
+        entries = []
+        for name, seconds in self.durations.items():
+            entry = f'{name};dur={seconds * 1000:.1f}'
+            if name in self.descriptions:
+                entry += f';desc="{self.descriptions[name]}"'
+            entries.append(entry)
+        return ', '.join(entries)
+
+
+@contextmanager
+def collect_timings():
+    """
+    Ativa um `ServerTimings` para o contexto atual, usado por
+    `track_time` e `timed`.
+
+    Yields:
+        ServerTimings: Acumulador da requisição.
+    """
+    timings = ServerTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def track_time(name: str):
+    """
+    Soma a duração do bloco à etapa `name` da requisição atual.
+
+    Fora de uma requisição instrumentada não faz nada. Blocos aninhados
+    da mesma etapa são contados uma única vez; blocos em threads
+    paralelas são somados.
+
+    Args:
+        name (str): Nome da etapa no cabeçalho `Server-Timing`.
+    """
+    timings = _current_timings.get()
+    active = _active_steps.get()
+    if timings is None or name in active:
+        yield
+        return
+    token = _active_steps.set(active | {name})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active_steps.reset(token)
+        timings.add(name, time.perf_counter() - start)
+
+
+def timed(name: str):
+    """
+    Decorador que soma a duração da função à etapa `name`.
+
+    Args:
+        name (str): Nome da etapa no cabeçalho `Server-Timing`.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with track_time(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
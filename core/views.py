@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.contrib.auth.mixins import (
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+)
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.views import View
+from django.views.decorators.http import require_safe
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from core.monitoring import render_metrics
+
+AUTOCOMPLETE_LIMIT = 20
+
+
+class AutocompleteView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    View base para endpoints de autocomplete em JSON.
+
+    Recebe o termo no parâmetro `q` e responde com
+    `{"results": [{"id": ..., "text": ...}]}`, com no máximo `limit`
+    itens. Basta que o usuário tenha uma das permissões de
+    `permission_required`, já que o endpoint atende formulários de apps
+    diferentes.
+
+    Attributes:
+        limit (int): Quantidade máxima de itens retornados.
+        search_param (str): Parâmetro da URL que carrega o termo.
+    """
+
+    limit = AUTOCOMPLETE_LIMIT
+    search_param = 'q'
+
+    def has_permission(self) -> bool:
+        return any(
+            self.request.user.has_perm(permission)
+            for permission in self.get_permission_required()
+        )
+
+    def get_results(self, term: str) -> list:
+        """
+        Busca os itens que correspondem ao termo. As subclasses
+        sobrescrevem este método; por padrão, nenhum item é devolvido.
+
+        Args:
+            term (str): Termo digitado, sem espaços nas pontas.
+
+        Returns:
+            list: Pares (id, texto), na ordem em que devem ser exibidos.
+        """
+        return []
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get(self.search_param, '').strip()
+        results = [
+            {'id': pk, 'text': text}
+            for pk, text in self.get_results(term)[: self.limit]
+        ]
+        return JsonResponse({'results': results})
+
+
+@require_safe
+def prometheus_metrics(request):
+    """
+    Expõe as métricas da aplicação no formato de texto do Prometheus.
+
+    Quando `PROMETHEUS_METRICS_TOKEN` está configurado, a requisição deve
+    enviar o cabeçalho `Authorization: Bearer <token>`.
+
+    Args:
+        request (HttpRequest): Requisição do coletor.
+
+    Returns:
+        HttpResponse: Métricas no formato de exposição de texto.
+    """
+    token = settings.PROMETHEUS_METRICS_TOKEN
+    if token and request.headers.get('Authorization') != f'Bearer {token}':
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
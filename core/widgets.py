@@ -0,0 +1,55 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+
+class AutocompleteSelect(forms.Select):
+    """
+    Select que carrega as opções sob demanda de um endpoint de
+    autocomplete, em vez de renderizar a tabela inteira em `<option>`.
+
+    Apenas a opção selecionada é renderizada, buscada com uma única
+    consulta pela chave primária; as demais chegam conforme o usuário
+    digita no campo de busca. A validação continua a cargo do
+    `ModelChoiceField`, que também faz uma única consulta pela chave.
+
+    Attributes:
+        url (str): URL do endpoint de autocomplete.
+    """
+
+    template_name = 'widgets/autocomplete_select.html'
+
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context['widget']['url'] = str(self.url)
+        return context
+
+    def _get_selected_choices(self, value) -> list:
+        field = self.choices.field
+        choices = []
+        if field.empty_label is not None:
+            choices.append(('', field.empty_label))
+        selected = [item for item in value if item]
+        if not selected:
+            return choices
+        key = field.to_field_name or 'pk'
+        try:
+            queryset = field.queryset.filter(**{f'{key}__in': selected})
+            choices.extend(
+                (getattr(obj, key), field.label_from_instance(obj))
+                for obj in queryset
+            )
+        except (ValueError, TypeError, ValidationError):
+            pass
+        return choices
+
+    def optgroups(self, name, value, attrs=None):
+        all_choices = self.choices
+        self.choices = self._get_selected_choices(value)
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = all_choices
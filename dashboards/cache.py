@@ -0,0 +1,85 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+METRICS_VERSION_KEY = 'metrics:version'
+METRICS_LOCK_TIMEOUT = 30
+METRICS_LOCK_POLL_INTERVAL = 0.05
+
+
+def _get_cache():
+    return caches[settings.METRICS_CACHE_ALIAS]
+
+
+def get_metrics_version() -> int:
+    """
+    Retorna a versão atual das métricas em cache.
+
+    A versão inicial é baseada no relógio, evitando que uma versão
+    removida do cache volte a apontar para valores antigos.
+
+    Returns:
+        int: Versão usada na composição das chaves de cache.
+    """
+    cache = _get_cache()
+    version = cache.get(METRICS_VERSION_KEY)
+    if version is None:
+        cache.add(METRICS_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(METRICS_VERSION_KEY)
+    return version
+
+
+def bump_metrics_version() -> None:
+    """
+    Invalida todas as métricas em cache incrementando a versão.
+    """
+    cache = _get_cache()
+    try:
+        cache.incr(METRICS_VERSION_KEY)
+    except ValueError:
+        cache.add(METRICS_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_cached_metric(metric, *args):
+    """
+    Retorna o resultado de uma função de métrica a partir do cache.
+
+    Em caso de ausência, apenas o processo que obtiver a trava recalcula
+    a métrica; os demais aguardam o valor ser gravado, evitando que vários
+    workers refaçam a mesma consulta ao mesmo tempo. Se a trava expirar
+    sem valor gravado, a métrica é calculada diretamente.
+
+    Args:
+        metric (callable): Função de métrica de `dashboards.metrics`.
+        *args: Argumentos repassados para a função de métrica.
+
+    Returns:
+        Any: Resultado da função de métrica.
+    """
+    cache = _get_cache()
+    version = get_metrics_version()
+    key = ':'.join(['metrics', metric.__name__, *map(str, args)])
+
+    value = cache.get(key, version=version)
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, True, METRICS_LOCK_TIMEOUT, version=version):
+        try:
+            value = metric(*args)
+            cache.set(key, value, version=version)
+        finally:
+            cache.delete(lock_key, version=version)
+        return value
+
+    deadline = time.monotonic() + METRICS_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(METRICS_LOCK_POLL_INTERVAL)
+        value = cache.get(key, version=version)
+        if value is not None:
+            return value
+        if cache.get(lock_key, version=version) is None:
+            break
+    return metric(*args)
@@ -0,0 +1,147 @@
+from django import forms
+from django.core.exceptions import ValidationError
+
+from dashboards.metrics import DEFAULT_SALES_WINDOW_DAYS, get_sales_window
+
+MAX_CUSTOM_PERIOD_DAYS = 3 * 365
+
+
+class DashboardPeriodForm(forms.Form):
+    """
+    Formulário para escolher o período e a granularidade dos gráficos
+    de vendas do dashboard.
+
+    Attributes:
+        period (ChoiceField): Janela de dias ou período personalizado.
+        start_date (DateField): Data inicial do período personalizado.
+        end_date (DateField): Data final do período personalizado.
+        granularity (ChoiceField): Agrupamento diário, semanal ou mensal.
+    """
+
+    PERIOD_CHOICES = [
+        ('7', 'Últimos 7 dias'),
+        ('30', 'Últimos 30 dias'),
+        ('90', 'Últimos 90 dias'),
+        ('365', 'Últimos 365 dias'),
+        ('custom', 'Personalizado'),
+    ]
+    GRANULARITY_CHOICES = [
+        ('day', 'Diário'),
+        ('week', 'Semanal'),
+        ('month', 'Mensal'),
+    ]
+
+    period = forms.ChoiceField(
+        choices=PERIOD_CHOICES,
+        required=False,
+        label='Período',
+        widget=forms.Select(attrs={'class': 'form-select'}),
+    )
+    start_date = forms.DateField(
+        required=False,
+        label='De',
+        widget=forms.DateInput(
+            attrs={'class': 'form-control', 'type': 'date'}
+        ),
+    )
+    end_date = forms.DateField(
+        required=False,
+        label='Até',
+        widget=forms.DateInput(
+            attrs={'class': 'form-control', 'type': 'date'}
+        ),
+    )
+    granularity = forms.ChoiceField(
+        choices=GRANULARITY_CHOICES,
+        required=False,
+        label='Agrupamento',
+        widget=forms.Select(attrs={'class': 'form-select'}),
+    )
+
+    def clean(self) -> dict:
+        cleaned_data = super().clean()
+        if cleaned_data.get('period') != 'custom':
+            return cleaned_data
+
+        start_date = cleaned_data.get('start_date')
+        end_date = cleaned_data.get('end_date')
+        if not start_date or not end_date:
+            raise ValidationError(
+                'Informe as datas inicial e final do período personalizado.'
+            )
+        if start_date > end_date:
+            raise ValidationError(
+                'A data inicial deve ser anterior ou igual à data final.'
+            )
+        if (end_date - start_date).days >= MAX_CUSTOM_PERIOD_DAYS:
+            raise ValidationError(
+                f'O período personalizado deve ter no máximo '
+                f'{MAX_CUSTOM_PERIOD_DAYS} dias.'
+            )
+        return cleaned_data
+
+    def get_period(self) -> tuple:
+        """
+        Retorna o período escolhido, usando os valores padrão quando o
+        formulário não foi enviado ou é inválido.
+
+        Returns:
+            tuple: Data inicial, data final e granularidade.
+        """
+        if not self.is_bound or not self.is_valid():
+            return (*get_sales_window(), 'day')
+
+        period = self.cleaned_data.get('period')
+        granularity = self.cleaned_data.get('granularity') or 'day'
+        if period == 'custom':
+            return (
+                self.cleaned_data['start_date'],
+                self.cleaned_data['end_date'],
+                granularity,
+            )
+        days = int(period) if period else DEFAULT_SALES_WINDOW_DAYS
+        return (*get_sales_window(days), granularity)
+
+
+class RankingForm(forms.Form):
+    """
+    Formulário para configurar o relatório de ranking de produtos.
+
+    Attributes:
+        days (IntegerField): Janela, em dias, considerada no ranking e
+        usada para definir produtos sem saída.
+        top (IntegerField): Quantidade de produtos em cada lista.
+    """
+
+    DEFAULT_DAYS = 30
+    DEFAULT_TOP = 10
+
+    days = forms.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=MAX_CUSTOM_PERIOD_DAYS,
+        label='Dias',
+        widget=forms.NumberInput(attrs={'class': 'form-control'}),
+    )
+    top = forms.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=100,
+        label='Quantidade',
+        widget=forms.NumberInput(attrs={'class': 'form-control'}),
+    )
+
+    def get_values(self) -> tuple:
+        """
+        Retorna a janela em dias e a quantidade de produtos, usando os
+        valores padrão quando o formulário não foi enviado ou é inválido.
+
+        Returns:
+            tuple: Quantidade de dias e de produtos por lista.
+        """
+        if not self.is_bound or not self.is_valid():
+            return self.DEFAULT_DAYS, self.DEFAULT_TOP
+        return (
+            self.cleaned_data.get('days') or self.DEFAULT_DAYS,
+            self.cleaned_data.get('top') or self.DEFAULT_TOP,
+        )
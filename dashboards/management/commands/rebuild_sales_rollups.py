@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from dashboards.rollups import rebuild_sales_rollups
+
+
+class Command(BaseCommand):
+    """
+    Comando que recalcula a consolidação diária de vendas.
+
+    Útil após importações em massa ou correções manuais de saídas, que
+    não passam pelo signal responsável por manter a consolidação.
+    """
+
+    help = 'Recalcula a consolidação diária de vendas a partir das saídas.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Quantidade de registros por inserção em lote.',
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_sales_rollups(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'{total} registros de consolidação criados.')
+        )
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from dashboards.snapshots import refresh_dashboard_snapshot
+
+
+class Command(BaseCommand):
+    """
+    Comando que pré-calcula as métricas do dashboard.
+
+    Pode ser executado pelo cron ou, com `--interval`, como um processo
+    contínuo que grava um novo snapshot a cada intervalo.
+    """
+
+    help = 'Calcula as métricas do dashboard e grava um novo snapshot.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Segundos entre atualizações; 0 executa uma única vez.',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=10,
+            help='Quantidade de snapshots mantidos no banco.',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        if options['keep'] < 1:
+            raise CommandError('--keep deve ser ao menos 1.')
+        try:
+            while True:
+                close_old_connections()
+                snapshot = refresh_dashboard_snapshot(keep=options['keep'])
+                self.stdout.write(self.style.SUCCESS(f'{snapshot} gravado.'))
+                if not interval:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            self.stdout.write('Atualização do dashboard interrompida.')
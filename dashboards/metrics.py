@@ -1,22 +1,54 @@
-from django.db.models import F, Sum
+from datetime import timedelta
+
+from django.db.models import (
+    Count,
+    DecimalField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
 from django.utils import timezone
 from django.utils.formats import number_format
 
 from brand.models import Brand
 from categories.models import Category
+from core.timing import timed
+from dashboards.rollups import get_total_rollups
 from outflows.models import Outflow
 from products.models import Product
 
+DEFAULT_SALES_WINDOW_DAYS = 7
+
+OTHERS_LABEL = 'Outros'
+
+# Fatias exibidas nos gráficos de produtos antes do agrupamento em "Outros".
+PRODUCT_CHART_TOP = 10
+
+SALES_GRANULARITIES = {
+    'day': TruncDay,
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+
 
+@timed('metrics')
 def get_product_metrics() -> dict:
-    products = Product.objects.all()
-    total_cost_price = sum(
-        product.cost_price * product.quantity for product in products
-    )
-    total_selling_price = sum(
-        product.selling_price * product.quantity for product in products
+    totals = Product.objects.aggregate(
+        total_cost_price=Sum(
+            F('cost_price') * F('quantity'), output_field=DecimalField()
+        ),
+        total_selling_price=Sum(
+            F('selling_price') * F('quantity'), output_field=DecimalField()
+        ),
+        total_quantity=Sum('quantity'),
     )
-    total_quantity = sum(product.quantity for product in products)
+    total_cost_price = totals['total_cost_price'] or 0
+    total_selling_price = totals['total_selling_price'] or 0
+    total_quantity = totals['total_quantity'] or 0
     total_profit = total_selling_price - total_cost_price
 
     return dict(
@@ -33,22 +65,23 @@ def get_product_metrics() -> dict:
     )
 
 
+@timed('metrics')
 def get_sales_metrics() -> dict:
-    total_sales = Outflow.objects.count()
-    total_products_sold = (
-        Outflow.objects.aggregate(total_products_sold=Sum('quantity'))[
-            'total_products_sold'
-        ]
-        or 0
-    )
-    total_sales_value = sum(
-        outflow.quantity * outflow.product.selling_price
-        for outflow in Outflow.objects.all()
-    )
-    total_sales_cost = sum(
-        outflow.quantity * outflow.product.cost_price
-        for outflow in Outflow.objects.all()
+    totals = Outflow.objects.aggregate(
+        total_sales=Count('id'),
+        total_products_sold=Sum('quantity'),
+        total_sales_value=Sum(
+            F('unit_selling_price') * F('quantity'),
+            output_field=DecimalField(),
+        ),
+        total_sales_cost=Sum(
+            F('unit_cost_price') * F('quantity'), output_field=DecimalField()
+        ),
     )
+    total_sales = totals['total_sales']
+    total_products_sold = totals['total_products_sold'] or 0
+    total_sales_value = totals['total_sales_value'] or 0
+    total_sales_cost = totals['total_sales_cost'] or 0
     total_sales_profit = total_sales_value - total_sales_cost
 
     return dict(
@@ -63,46 +96,175 @@ def get_sales_metrics() -> dict:
     )
 
 
-def get_daily_sales_data() -> dict:
-    today = timezone.now().date()
-    dates = [str(today - timezone.timedelta(days=i)) for i in range(6, -1, -1)]
-    values = list()
+def get_sales_window(days: int = DEFAULT_SALES_WINDOW_DAYS) -> tuple:
+    end_date = timezone.localdate()
+    start_date = end_date - timedelta(days=days - 1)
+    return start_date, end_date
+
+
+def _get_period_starts(start_date, end_date, granularity: str) -> list:
+    if granularity == 'week':
+        current = start_date - timedelta(days=start_date.weekday())
+    elif granularity == 'month':
+        current = start_date.replace(day=1)
+    else:
+        current = start_date
+
+    periods = list()
+    while current <= end_date:
+        periods.append(current)
+        if granularity == 'month':
+            current = (current.replace(day=28) + timedelta(days=4)).replace(
+                day=1
+            )
+        elif granularity == 'week':
+            current += timedelta(days=7)
+        else:
+            current += timedelta(days=1)
+    return periods
+
+
+def _get_sales_series(
+    field: str, start_date, end_date, granularity: str
+) -> tuple:
+    if start_date is None or end_date is None:
+        start_date, end_date = get_sales_window()
+    trunc = SALES_GRANULARITIES[granularity]
+    totals = dict(
+        get_total_rollups()
+        .filter(date__gte=start_date, date__lte=end_date)
+        .annotate(period=trunc('date'))
+        .values('period')
+        .annotate(total=Sum(field))
+        .values_list('period', 'total')
+        .order_by()
+    )
+    periods = _get_period_starts(start_date, end_date, granularity)
+    dates = [str(period) for period in periods]
+    return dates, [totals.get(period, 0) for period in periods]
+
+
+@timed('metrics')
+def get_daily_sales_data(
+    start_date=None, end_date=None, granularity: str = 'day'
+) -> dict:
+    dates, totals = _get_sales_series(
+        'revenue', start_date, end_date, granularity
+    )
+    return dict(dates=dates, values=[float(total) for total in totals])
+
+
+@timed('metrics')
+def get_daily_sales_quantity_data(
+    start_date=None, end_date=None, granularity: str = 'day'
+) -> dict:
+    dates, totals = _get_sales_series(
+        'count', start_date, end_date, granularity
+    )
+    return dict(dates=dates, values=totals)
+
+
+def _get_product_count_by(model, top: int | None = None) -> dict:
+    counts = model.objects.annotate(
+        total_products=Count('products')
+    ).values_list('name', 'total_products')
+    if top is None:
+        return dict(counts)
 
-    for date in dates:
-        sales_total = (
-            Outflow.objects.filter(created_at__date=date).aggregate(
-                total_sales=Sum(F('product__selling_price') * F('quantity'))
-            )['total_sales']
-            or 0
+    counts = list(counts.order_by('-total_products', 'name'))
+    product_count = dict(counts[:top])
+    others = sum(total for _, total in counts[top:])
+    if others:
+        # Um registro chamado "Outros" entre os primeiros é somado ao
+        # grupo, em vez de ter a sua contagem sobrescrita.
+        product_count[OTHERS_LABEL] = (
+            product_count.get(OTHERS_LABEL, 0) + others
         )
-        values.append(float(sales_total))
+    return product_count
 
-    return dict(dates=dates, values=values)
 
+@timed('metrics')
+def get_graphic_product_category_metric(top: int | None = None) -> dict:
+    return _get_product_count_by(Category, top)
 
-def get_daily_sales_quantity_data() -> dict:
-    today = timezone.now().date()
-    dates = [str(today - timezone.timedelta(days=i)) for i in range(6, -1, -1)]
-    quantities = list()
 
-    for date in dates:
-        sales_quantity = Outflow.objects.filter(created_at__date=date).count()
-        quantities.append(sales_quantity)
+@timed('metrics')
+def get_graphic_product_brand_metric(top: int | None = None) -> dict:
+    return _get_product_count_by(Brand, top)
 
-    return dict(dates=dates, values=quantities)
 
+@timed('metrics')
+def get_best_sellers(
+    order_by: str = 'units', top: int = 10, days: int | None = None
+) -> list:
+    outflows = Outflow.objects.all()
+    if days is not None:
+        outflows = outflows.filter(
+            created_at__gte=timezone.now() - timedelta(days=days)
+        )
+    return list(
+        outflows.values('product', title=F('product__title'))
+        .annotate(
+            units=Sum('quantity'),
+            revenue=Sum(
+                F('unit_selling_price') * F('quantity'),
+                output_field=DecimalField(),
+            ),
+            sales=Count('id'),
+        )
+        .order_by(f'-{order_by}', 'title')[:top]
+    )
 
-def get_graphic_product_category_metric() -> dict:
-    categories = Category.objects.all()
-    return {
-        category.name: Product.objects.filter(category=category).count()
-        for category in categories
-    }
+
+@timed('metrics')
+def get_dead_stock(days: int = 30, top: int = 10) -> list:
+    since = timezone.now() - timedelta(days=days)
+    product_outflows = Outflow.objects.filter(product=OuterRef('pk'))
+    return list(
+        Product.objects.filter(quantity__gt=0)
+        .annotate(
+            last_sale=Subquery(
+                product_outflows.order_by('-created_at').values('created_at')[
+                    :1
+                ]
+            ),
+            stock_cost=ExpressionWrapper(
+                F('cost_price') * F('quantity'), output_field=DecimalField()
+            ),
+        )
+        .filter(~Exists(product_outflows.filter(created_at__gte=since)))
+        .order_by(F('last_sale').asc(nulls_first=True), '-stock_cost')
+        .values('id', 'title', 'quantity', 'stock_cost', 'last_sale')[:top]
+    )
 
 
-def get_graphic_product_brand_metric() -> dict:
-    brands = Brand.objects.all()
+def get_dashboard_metric_calls(start_date, end_date, granularity) -> dict:
+    """
+    Relaciona cada métrica do dashboard com a função e os argumentos
+    usados para calculá-la, junto do valor exibido caso ela falhe.
+    """
+    empty_series = dict(dates=[], values=[])
     return {
-        brand.name: Product.objects.filter(brand=brand).count()
-        for brand in brands
+        'product_metrics': (get_product_metrics, (), {}),
+        'sales_metrics': (get_sales_metrics, (), {}),
+        'daily_sales_data': (
+            get_daily_sales_data,
+            (start_date, end_date, granularity),
+            empty_series,
+        ),
+        'daily_sales_quantity_data': (
+            get_daily_sales_quantity_data,
+            (start_date, end_date, granularity),
+            empty_series,
+        ),
+        'product_count_by_category': (
+            get_graphic_product_category_metric,
+            (PRODUCT_CHART_TOP,),
+            {},
+        ),
+        'product_count_by_brand': (
+            get_graphic_product_brand_metric,
+            (PRODUCT_CHART_TOP,),
+            {},
+        ),
     }
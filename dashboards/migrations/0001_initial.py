@@ -0,0 +1,115 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ('brand', '0001_initial'),
+        ('categories', '0001_initial'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySalesRollup',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('date', models.DateField()),
+                ('units', models.IntegerField(default=0)),
+                (
+                    'revenue',
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=20
+                    ),
+                ),
+                (
+                    'cost',
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=20
+                    ),
+                ),
+                ('count', models.IntegerField(default=0)),
+                (
+                    'brand',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='daily_sales_rollups',
+                        to='brand.brand',
+                    ),
+                ),
+                (
+                    'category',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='daily_sales_rollups',
+                        to='categories.category',
+                    ),
+                ),
+                (
+                    'product',
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='daily_sales_rollups',
+                        to='products.product',
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['date'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailysalesrollup',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ('brand__isnull', True),
+                    ('category__isnull', True),
+                    ('product__isnull', True),
+                ),
+                fields=('date',),
+                name='unique_daily_sales_rollup_total',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysalesrollup',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('product__isnull', False)),
+                fields=('date', 'product'),
+                name='unique_daily_sales_rollup_product',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysalesrollup',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('category__isnull', False)),
+                fields=('date', 'category'),
+                name='unique_daily_sales_rollup_category',
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='dailysalesrollup',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('brand__isnull', False)),
+                fields=('date', 'brand'),
+                name='unique_daily_sales_rollup_brand',
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('dashboards', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSnapshot',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('data', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-pk'],
+            },
+        ),
+    ]
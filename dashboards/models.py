@@ -1 +1,129 @@
-# Create your models here.
+from django.db import models
+from django.db.models import Q
+
+from brand.models import Brand
+from categories.models import Category
+from products.models import Product
+
+
+class DailySalesRollup(models.Model):
+    """
+    Modelo que consolida as saídas de estoque por dia.
+
+    Cada registro acumula as vendas de um dia em uma única dimensão: sem
+    dimensão (total do dia), por produto, por categoria ou por marca. Os
+    valores são mantidos pelo signal de criação de saídas e podem ser
+    recalculados com o comando `rebuild_sales_rollups`.
+
+    Attributes:
+        date (date): Dia das vendas, no fuso horário do projeto.
+        product (Product, optional): Produto consolidado no registro.
+        category (Category, optional): Categoria consolidada no registro.
+        brand (Brand, optional): Marca consolidada no registro.
+        units (int): Quantidade de unidades vendidas.
+        revenue (Decimal): Valor total das vendas.
+        cost (Decimal): Custo total das vendas.
+        count (int): Número de saídas registradas.
+    """
+
+    date = models.DateField()
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='daily_sales_rollups',
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='daily_sales_rollups',
+    )
+    brand = models.ForeignKey(
+        Brand,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='daily_sales_rollups',
+    )
+    units = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    cost = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    def __str__(self) -> str:
+        """Retorna o dia e a dimensão consolidada no registro."""
+        dimension = self.product or self.category or self.brand or 'Total'
+        return f'{self.date} - {dimension}'
+
+    class Meta:
+        """
+        Metadados para a configuração do modelo DailySalesRollup.
+
+        Attributes:
+            ordering (list): Define a ordenação padrão pelo campo 'date'.
+            constraints (list): Garante um único registro por dia para
+            cada dimensão.
+        """
+
+        ordering = ['date']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date'],
+                condition=Q(
+                    product__isnull=True,
+                    category__isnull=True,
+                    brand__isnull=True,
+                ),
+                name='unique_daily_sales_rollup_total',
+            ),
+            models.UniqueConstraint(
+                fields=['date', 'product'],
+                condition=Q(product__isnull=False),
+                name='unique_daily_sales_rollup_product',
+            ),
+            models.UniqueConstraint(
+                fields=['date', 'category'],
+                condition=Q(category__isnull=False),
+                name='unique_daily_sales_rollup_category',
+            ),
+            models.UniqueConstraint(
+                fields=['date', 'brand'],
+                condition=Q(brand__isnull=False),
+                name='unique_daily_sales_rollup_brand',
+            ),
+        ]
+
+
+class DashboardSnapshot(models.Model):
+    """
+    Modelo que armazena todas as métricas do dashboard pré-calculadas.
+
+    Os registros são gerados pelo comando `refresh_dashboard` e o mais
+    recente é lido pela página inicial em uma única consulta.
+
+    Attributes:
+        data (dict): Período usado no cálculo e resultado de cada métrica.
+        created_at (datetime): Data e hora em que as métricas foram
+        calculadas.
+    """
+
+    data = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        """Retorna a data e hora de criação do snapshot."""
+        return f'Snapshot {self.created_at:%d/%m/%Y %H:%M:%S}'
+
+    class Meta:
+        """
+        Metadados para a configuração do modelo DashboardSnapshot.
+
+        Attributes:
+            ordering (list): Define a ordenação padrão do mais recente
+            para o mais antigo.
+        """
+
+        ordering = ['-pk']
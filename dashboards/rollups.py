@@ -0,0 +1,192 @@
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from dashboards.cache import bump_metrics_version
+from dashboards.models import DailySalesRollup
+from outflows.models import Outflow
+
+ROLLUP_DIMENSIONS = {
+    'product_id': 'product',
+    'category_id': 'product__category',
+    'brand_id': 'product__brand',
+}
+
+
+def get_total_rollups():
+    """
+    Retorna os registros de consolidação sem dimensão (total do dia).
+
+    Returns:
+        QuerySet: Registros de DailySalesRollup com os totais diários.
+    """
+    return DailySalesRollup.objects.filter(
+        product__isnull=True, category__isnull=True, brand__isnull=True
+    )
+
+
+def _rollup_lookups(outflow, date) -> list:
+    empty = {dimension: None for dimension in ROLLUP_DIMENSIONS}
+    product = outflow.product
+    return [
+        dict(empty, date=date),
+        dict(empty, date=date, product_id=product.id),
+        dict(empty, date=date, category_id=product.category_id),
+        dict(empty, date=date, brand_id=product.brand_id),
+    ]
+
+
+def _group_rollups(outflows) -> dict:
+    totals = {}
+    for outflow in outflows:
+        date = timezone.localdate(outflow.created_at)
+        values = (
+            outflow.quantity,
+            outflow.quantity * (outflow.unit_selling_price or 0),
+            outflow.quantity * (outflow.unit_cost_price or 0),
+            1,
+        )
+        for lookup in _rollup_lookups(outflow, date):
+            key = tuple(lookup.items())
+            current = totals.get(key, (0, 0, 0, 0))
+            totals[key] = tuple(map(sum, zip(current, values)))
+    return totals
+
+
+def unregister_outflow(outflow) -> None:
+    """
+    Retira uma saída dos registros de consolidação do seu dia.
+
+    Usada quando a saída é excluída ou antes de acumular a sua nova
+    versão, quando ela é alterada. Os registros são decrementados com
+    `F()` e os que ficam sem saídas são removidos, como se nunca
+    tivessem sido criados.
+
+    Args:
+        outflow (Outflow): A saída, com os valores que foram acumulados.
+    """
+    with transaction.atomic():
+        for key, totals in _group_rollups([outflow]).items():
+            units, revenue, cost, count = totals
+            rollups = DailySalesRollup.objects.filter(**dict(key))
+            rollups.update(
+                units=F('units') - units,
+                revenue=F('revenue') - revenue,
+                cost=F('cost') - cost,
+                count=F('count') - count,
+            )
+            rollups.filter(count__lte=0).delete()
+
+
+def register_outflow(outflow) -> None:
+    """
+    Acumula uma saída nos registros de consolidação do seu dia.
+
+    Args:
+        outflow (Outflow): A saída que foi criada.
+    """
+    register_outflows([outflow])
+
+
+def register_outflows(outflows) -> None:
+    """
+    Acumula saídas nos registros de consolidação dos seus dias.
+
+    As saídas são agrupadas por registro (total do dia, produto, categoria
+    e marca), e cada registro é atualizado uma única vez com `F()` dentro
+    de uma única transação. Quando o registro ainda não existe ele é
+    criado, e uma criação concorrente do mesmo registro é tratada
+    repetindo a atualização.
+
+    Args:
+        outflows (Iterable[Outflow]): As saídas que foram criadas, com o
+        produto carregado.
+    """
+    with transaction.atomic():
+        for key, totals in _group_rollups(outflows).items():
+            lookup = dict(key)
+            units, revenue, cost, count = totals
+            rollups = DailySalesRollup.objects.filter(**lookup)
+            increments = dict(
+                units=F('units') + units,
+                revenue=F('revenue') + revenue,
+                cost=F('cost') + cost,
+                count=F('count') + count,
+            )
+            if rollups.update(**increments):
+                continue
+            try:
+                with transaction.atomic():
+                    DailySalesRollup.objects.create(
+                        units=units,
+                        revenue=revenue,
+                        cost=cost,
+                        count=count,
+                        **lookup,
+                    )
+            except IntegrityError:
+                rollups.update(**increments)
+
+
+def rebuild_sales_rollups(batch_size: int = 1000) -> int:
+    """
+    Recalcula todos os registros de consolidação a partir das saídas.
+
+    Os registros existentes são removidos e recriados com uma consulta
+    agrupada por dia para cada dimensão, dentro de uma única transação.
+    Após o commit, as métricas em cache são invalidadas.
+
+    Args:
+        batch_size (int): Quantidade de registros por inserção em lote.
+
+    Returns:
+        int: Quantidade de registros de consolidação criados.
+    """
+    outflows = Outflow.objects.annotate(day=TruncDate('created_at'))
+    groupings = [{}] + [
+        {key: value} for key, value in ROLLUP_DIMENSIONS.items()
+    ]
+    total = 0
+
+    with transaction.atomic():
+        DailySalesRollup.objects.all().delete()
+        for grouping in groupings:
+            rows = (
+                outflows.values('day', *grouping.values())
+                .annotate(
+                    total_units=Sum('quantity'),
+                    total_revenue=Sum(
+                        F('unit_selling_price') * F('quantity'),
+                        output_field=DecimalField(),
+                    ),
+                    total_cost=Sum(
+                        F('unit_cost_price') * F('quantity'),
+                        output_field=DecimalField(),
+                    ),
+                    total_count=Count('id'),
+                )
+                .order_by()
+            )
+            rollups = (
+                DailySalesRollup(
+                    date=row['day'],
+                    units=row['total_units'],
+                    revenue=row['total_revenue'] or 0,
+                    cost=row['total_cost'] or 0,
+                    count=row['total_count'],
+                    **{
+                        field: row[lookup]
+                        for field, lookup in grouping.items()
+                    },
+                )
+                for row in rows.iterator(chunk_size=batch_size)
+            )
+            while batch := list(islice(rollups, batch_size)):
+                DailySalesRollup.objects.bulk_create(batch)
+                total += len(batch)
+        transaction.on_commit(bump_metrics_version)
+
+    return total
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.cache import bump_metrics_version
+from inflows.models import Inflow
+from outflows.models import Outflow
+from products.models import Product
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Inflow)
+@receiver(post_save, sender=Outflow)
+@receiver(post_save, sender=Brand)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=Inflow)
+@receiver(post_delete, sender=Outflow)
+@receiver(post_delete, sender=Brand)
+@receiver(post_delete, sender=Category)
+def invalidate_metrics_cache(sender, **kwargs):
+    """
+    Invalida as métricas em cache quando o estoque ou os cadastros mudam.
+
+    A versão é incrementada imediatamente e novamente após o commit da
+    transação, para que uma métrica recalculada antes do commit, ainda com
+    os dados antigos, não permaneça válida.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    bump_metrics_version()
+    transaction.on_commit(bump_metrics_version)
@@ -0,0 +1,66 @@
+from dashboards.metrics import get_dashboard_metric_calls, get_sales_window
+from dashboards.models import DashboardSnapshot
+
+
+def _serialize_period(start_date, end_date, granularity) -> list:
+    return [str(start_date), str(end_date), granularity]
+
+
+def refresh_dashboard_snapshot(keep: int = 10) -> DashboardSnapshot:
+    """
+    Calcula todas as métricas do dashboard e grava um novo snapshot.
+
+    As métricas usam o período padrão do dashboard. Apenas os `keep`
+    snapshots mais recentes, pela ordem das chaves, são mantidos; o novo
+    snapshot está sempre entre eles.
+
+    Args:
+        keep (int): Quantidade de snapshots mantidos no banco, ao menos 1.
+
+    Returns:
+        DashboardSnapshot: O snapshot criado.
+
+    Raises:
+        ValueError: Se `keep` for menor que 1.
+    """
+    if keep < 1:
+        raise ValueError('Mantenha ao menos 1 snapshot.')
+    start_date, end_date = get_sales_window()
+    granularity = 'day'
+    metric_calls = get_dashboard_metric_calls(
+        start_date, end_date, granularity
+    )
+    snapshot = DashboardSnapshot.objects.create(
+        data={
+            'period': _serialize_period(start_date, end_date, granularity),
+            'metrics': {
+                name: metric(*args)
+                for name, (metric, args, _) in metric_calls.items()
+            },
+        }
+    )
+    stale = DashboardSnapshot.objects.order_by('-pk').values_list(
+        'pk', flat=True
+    )[keep:]
+    DashboardSnapshot.objects.filter(pk__in=list(stale)).delete()
+    return snapshot
+
+
+def get_latest_snapshot(start_date, end_date, granularity):
+    """
+    Retorna o snapshot mais recente se ele corresponder ao período pedido.
+
+    Args:
+        start_date (date): Data inicial do período.
+        end_date (date): Data final do período.
+        granularity (str): Agrupamento dos gráficos de vendas.
+
+    Returns:
+        DashboardSnapshot | None: O snapshot mais recente, ou None quando
+        não há snapshot ou ele foi calculado para outro período.
+    """
+    snapshot = DashboardSnapshot.objects.order_by('-pk').first()
+    period = _serialize_period(start_date, end_date, granularity)
+    if snapshot is not None and snapshot.data['period'] == period:
+        return snapshot
+    return None
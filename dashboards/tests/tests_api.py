@@ -0,0 +1,166 @@
+from http import HTTPStatus
+
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.metrics import get_product_metrics
+from outflows.models import Outflow
+from products.models import Product
+
+
+class MetricsApiTests(TestCase):
+    def setUp(self):
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpass'
+        )
+        self.user.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=['view_product', 'view_inflow', 'view_outflow']
+            )
+        )
+        self.client.login(username='testuser', password='testpass')
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.product = Product.objects.create(
+            title='Product 1',
+            cost_price=100.0,
+            selling_price=150.0,
+            quantity=10,
+            category=self.category,
+            brand=self.brand,
+        )
+        Outflow.objects.create(product=self.product, quantity=2)
+
+    def test_metrics_api_returns_every_metric(self):
+        response = self.client.get(reverse('metrics_api'))
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            set(response.json()),
+            {
+                'product_metrics',
+                'sales_metrics',
+                'daily_sales_data',
+                'daily_sales_quantity_data',
+                'product_count_by_category',
+                'product_count_by_brand',
+            },
+        )
+        self.assertTrue(response.has_header('ETag'))
+        self.assertFalse(response['ETag'].startswith('W/'))
+
+    def test_metric_api_returns_single_metric(self):
+        response = self.client.get(
+            reverse('metric_api', kwargs={'metric': 'product_metrics'})
+        )
+        self.assertEqual(response.json(), get_product_metrics())
+
+    def test_metric_api_accepts_period_parameters(self):
+        response = self.client.get(
+            reverse('metric_api', kwargs={'metric': 'daily_sales_data'}),
+            {'period': '30', 'granularity': 'day'},
+        )
+        self.assertEqual(len(response.json()['dates']), 30)
+
+    def test_metric_api_unknown_metric_returns_404(self):
+        response = self.client.get(
+            reverse('metric_api', kwargs={'metric': 'unknown'})
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_metrics_api_returns_304_when_nothing_changed(self):
+        etag = self.client.get(reverse('metrics_api'))['ETag']
+
+        # Sessão, usuário e as permissões do usuário e dos grupos.
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse('metrics_api'), headers={'if-none-match': etag}
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_metrics_api_changes_etag_after_stock_change(self):
+        etag = self.client.get(reverse('metrics_api'))['ETag']
+
+        Outflow.objects.create(product=self.product, quantity=1)
+        response = self.client.get(
+            reverse('metrics_api'), headers={'if-none-match': etag}
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_metrics_api_etag_depends_on_period(self):
+        etag = self.client.get(reverse('metrics_api'))['ETag']
+        response = self.client.get(
+            reverse('metrics_api'),
+            {'period': '90'},
+            headers={'if-none-match': etag},
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_metrics_api_unauthenticated(self):
+        self.client.logout()
+        response = self.client.get(reverse('metrics_api'))
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertTrue(response.url.startswith('/login/'))
+
+    def test_metrics_api_without_permissions_hides_every_metric(self):
+        self.user.user_permissions.clear()
+
+        response = self.client.get(reverse('metrics_api'))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.json(), {})
+
+    def test_metrics_api_returns_only_permitted_metrics(self):
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename='view_product')
+        )
+
+        response = self.client.get(reverse('metrics_api'))
+
+        self.assertEqual(
+            set(response.json()),
+            {'product_count_by_category', 'product_count_by_brand'},
+        )
+
+    def test_metric_api_without_permission_returns_403(self):
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename='view_product')
+        )
+
+        for metric in ('sales_metrics', 'daily_sales_data', 'product_metrics'):
+            with self.subTest(metric=metric):
+                response = self.client.get(
+                    reverse('metric_api', kwargs={'metric': metric})
+                )
+                self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_metric_api_without_permission_ignores_etag(self):
+        url = reverse('metric_api', kwargs={'metric': 'sales_metrics'})
+        etag = self.client.get(url)['ETag']
+        self.user.user_permissions.clear()
+
+        response = self.client.get(url, headers={'if-none-match': etag})
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_metrics_api_etag_depends_on_permissions(self):
+        etag = self.client.get(reverse('metrics_api'))['ETag']
+        self.user.user_permissions.set(
+            Permission.objects.filter(codename='view_product')
+        )
+
+        response = self.client.get(
+            reverse('metrics_api'), headers={'if-none-match': etag}
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotIn('sales_metrics', response.json())
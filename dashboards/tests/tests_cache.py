@@ -0,0 +1,113 @@
+import threading
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards import cache as metrics_cache
+from dashboards.cache import (
+    get_cached_metric,
+    get_metrics_version,
+)
+from dashboards.metrics import get_product_metrics
+from products.models import Product
+
+
+class TestsMetricsCache(TestCase):
+    def setUp(self):
+        self.cache = caches[settings.METRICS_CACHE_ALIAS]
+        self.cache.clear()
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.product = Product.objects.create(
+            title='Product 1',
+            cost_price=100.0,
+            selling_price=150.0,
+            quantity=10,
+            category=self.category,
+            brand=self.brand,
+        )
+
+    def test_cached_metric_does_not_query_twice(self):
+        first = get_cached_metric(get_product_metrics)
+        with self.assertNumQueries(0):
+            second = get_cached_metric(get_product_metrics)
+        self.assertEqual(first, second)
+
+    def test_cached_metric_key_includes_arguments(self):
+        metric = mock.Mock(side_effect=lambda days: days * 2)
+        metric.__name__ = 'metric'
+        self.assertEqual(get_cached_metric(metric, 7), 14)
+        self.assertEqual(get_cached_metric(metric, 30), 60)
+        self.assertEqual(get_cached_metric(metric, 7), 14)
+        self.assertEqual(metric.call_count, 2)
+
+    def test_save_invalidates_cached_metrics(self):
+        version = get_metrics_version()
+        get_cached_metric(get_product_metrics)
+
+        self.product.quantity = 20
+        self.product.save()
+
+        self.assertGreater(get_metrics_version(), version)
+        metrics = get_cached_metric(get_product_metrics)
+        self.assertEqual(metrics['total_quantity'], 20)
+
+    def test_delete_invalidates_cached_metrics(self):
+        get_cached_metric(get_product_metrics)
+        self.product.delete()
+        metrics = get_cached_metric(get_product_metrics)
+        self.assertEqual(metrics['total_quantity'], 0)
+
+    def test_brand_and_category_changes_invalidate_cached_metrics(self):
+        version = get_metrics_version()
+        Brand.objects.create(name='Brand B')
+        self.assertGreater(get_metrics_version(), version)
+
+        version = get_metrics_version()
+        self.category.name = 'Informática'
+        self.category.save()
+        self.assertGreater(get_metrics_version(), version)
+
+    def test_waits_for_worker_holding_the_lock(self):
+        version = get_metrics_version()
+        key = 'metrics:metric'
+        self.cache.add(f'{key}:lock', True, version=version)
+        metric = mock.Mock(return_value='recalculado')
+        metric.__name__ = 'metric'
+
+        timer = threading.Timer(
+            0.1,
+            self.cache.set,
+            args=(key, 'calculado'),
+            kwargs={'version': version},
+        )
+        timer.start()
+        value = get_cached_metric(metric)
+        timer.join()
+
+        self.assertEqual(value, 'calculado')
+        metric.assert_not_called()
+
+    def test_computes_directly_when_lock_is_released_without_value(self):
+        version = get_metrics_version()
+        self.cache.add('metrics:metric:lock', True, version=version)
+        metric = mock.Mock(return_value='calculado')
+        metric.__name__ = 'metric'
+
+        timer = threading.Timer(
+            0.1,
+            self.cache.delete,
+            args=('metrics:metric:lock',),
+            kwargs={'version': version},
+        )
+        with mock.patch.object(metrics_cache, 'METRICS_LOCK_TIMEOUT', 5):
+            timer.start()
+            value = get_cached_metric(metric)
+            timer.join()
+
+        self.assertEqual(value, 'calculado')
+        metric.assert_called_once_with()
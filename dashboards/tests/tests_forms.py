@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.test import TestCase
+from django.utils import timezone
+
+from dashboards.forms import DashboardPeriodForm
+
+
+class TestsFormsDashboardPeriod(TestCase):
+    """Testes para o formulário de período do dashboard."""
+
+    def test_form_sem_dados_retorna_ultimos_7_dias(self):
+        """
+        Testa se o formulário não enviado retorna a janela padrão
+        de 7 dias com agrupamento diário.
+        """
+        start_date, end_date, granularity = DashboardPeriodForm().get_period()
+        self.assertEqual(end_date, timezone.localdate())
+        self.assertEqual((end_date - start_date).days, 6)
+        self.assertEqual(granularity, 'day')
+
+    def test_form_com_janela_de_90_dias_e_agrupamento_semanal(self):
+        """Testa se a janela e o agrupamento escolhidos são retornados."""
+        form = DashboardPeriodForm(
+            data={'period': '90', 'granularity': 'week'}
+        )
+        start_date, end_date, granularity = form.get_period()
+        self.assertEqual((end_date - start_date).days, 89)
+        self.assertEqual(granularity, 'week')
+
+    def test_form_com_periodo_personalizado(self):
+        """Testa se o período personalizado retorna as datas informadas."""
+        form = DashboardPeriodForm(
+            data={
+                'period': 'custom',
+                'start_date': '2025-01-01',
+                'end_date': '2025-03-31',
+                'granularity': 'month',
+            }
+        )
+        self.assertEqual(
+            form.get_period(),
+            (date(2025, 1, 1), date(2025, 3, 31), 'month'),
+        )
+
+    def test_form_com_periodo_personalizado_invertido_retorna_invalido(self):
+        """
+        Testa se o formulário retorna inválido quando a data inicial é
+        posterior à data final.
+        """
+        form = DashboardPeriodForm(
+            data={
+                'period': 'custom',
+                'start_date': '2025-03-31',
+                'end_date': '2025-01-01',
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual((form.get_period()[1] - form.get_period()[0]).days, 6)
+
+    def test_form_com_periodo_personalizado_sem_datas_retorna_invalido(self):
+        """
+        Testa se o formulário retorna inválido quando o período
+        personalizado não possui datas.
+        """
+        form = DashboardPeriodForm(data={'period': 'custom'})
+        self.assertFalse(form.is_valid())
@@ -1,3 +1,6 @@
+import tracemalloc
+from datetime import date
+
 from django.contrib.auth.models import User
 from django.test import TestCase
 from django.utils import timezone
@@ -5,12 +8,14 @@ from django.utils import timezone
 from brand.models import Brand
 from categories.models import Category
 from dashboards.metrics import (
+    OTHERS_LABEL,
     get_daily_sales_data,
     get_daily_sales_quantity_data,
     get_graphic_product_brand_metric,
     get_graphic_product_category_metric,
     get_product_metrics,
     get_sales_metrics,
+    get_sales_window,
 )
 from inflows.models import Inflow
 from outflows.models import Outflow
@@ -72,6 +77,20 @@ class TestsMetrics(TestCase):
         self.assertEqual(metrics['total_quantity'], 27)
         self.assertEqual(metrics['total_profit'], '1.800,00')
 
+    def test_get_product_metrics_uses_single_query(self):
+        with self.assertNumQueries(1):
+            get_product_metrics()
+
+    def test_get_product_metrics_without_products(self):
+        Outflow.objects.all().delete()
+        Inflow.objects.all().delete()
+        Product.objects.all().delete()
+        metrics = get_product_metrics()
+        self.assertEqual(metrics['total_cost_price'], '0,00')
+        self.assertEqual(metrics['total_selling_price'], '0,00')
+        self.assertEqual(metrics['total_quantity'], 0)
+        self.assertEqual(metrics['total_profit'], '0,00')
+
     def test_get_sales_metrics(self):
         metrics = get_sales_metrics()
         self.assertEqual(metrics['total_sales'], 2)
@@ -79,18 +98,60 @@ class TestsMetrics(TestCase):
         self.assertEqual(metrics['total_sales_value'], '600,00')
         self.assertEqual(metrics['total_sales_profit'], '200,00')
 
+    def test_get_sales_metrics_uses_single_query(self):
+        with self.assertNumQueries(1):
+            get_sales_metrics()
+
+    def test_get_sales_metrics_keeps_prices_from_sale_time(self):
+        Product.objects.update(cost_price=1.0, selling_price=2.0)
+        metrics = get_sales_metrics()
+        self.assertEqual(metrics['total_sales_value'], '600,00')
+        self.assertEqual(metrics['total_sales_profit'], '200,00')
+
     def test_get_daily_sales_data(self):
         data = get_daily_sales_data()
-        today = timezone.now().date()
+        today = timezone.localdate()
         self.assertIn(str(today), data['dates'])
         self.assertEqual(len(data['values']), 7)
 
     def test_get_daily_sales_quantity_data(self):
         data = get_daily_sales_quantity_data()
-        today = timezone.now().date()
+        today = timezone.localdate()
         self.assertIn(str(today), data['dates'])
         self.assertEqual(len(data['values']), 7)
 
+    def test_get_daily_sales_data_fills_missing_days_with_zero(self):
+        start_date, end_date = get_sales_window(30)
+        data = get_daily_sales_data(start_date, end_date)
+        self.assertEqual(len(data['dates']), 30)
+        self.assertEqual(data['dates'][-1], str(timezone.localdate()))
+        self.assertEqual(data['values'][-1], 600.0)
+        self.assertEqual(sum(data['values']), 600.0)
+
+    def test_get_daily_sales_data_uses_single_query_for_a_year(self):
+        start_date, end_date = get_sales_window(365)
+        with self.assertNumQueries(1):
+            data = get_daily_sales_data(start_date, end_date)
+        self.assertEqual(len(data['values']), 365)
+
+    def test_get_daily_sales_quantity_data_by_week(self):
+        start_date, end_date = get_sales_window(90)
+        data = get_daily_sales_quantity_data(start_date, end_date, 'week')
+        for week in data['dates']:
+            self.assertEqual(date.fromisoformat(week).weekday(), 0)
+        self.assertEqual(data['values'][-1], 2)
+        self.assertEqual(sum(data['values']), 2)
+
+    def test_get_daily_sales_data_by_month(self):
+        data = get_daily_sales_data(
+            date(2025, 11, 15), date(2026, 2, 10), 'month'
+        )
+        self.assertEqual(
+            data['dates'],
+            ['2025-11-01', '2025-12-01', '2026-01-01', '2026-02-01'],
+        )
+        self.assertEqual(data['values'], [0, 0, 0, 0])
+
     def test_get_graphic_product_category_metric(self):
         metrics = get_graphic_product_category_metric()
         self.assertEqual(metrics[self.category.name], 2)
@@ -98,3 +159,105 @@ class TestsMetrics(TestCase):
     def test_get_graphic_product_brand_metric(self):
         metrics = get_graphic_product_brand_metric()
         self.assertEqual(metrics[self.brand.name], 2)
+
+    def test_get_graphic_product_metrics_include_empty_groups(self):
+        Category.objects.create(name='Books')
+        Brand.objects.create(name='Brand B')
+        self.assertEqual(
+            get_graphic_product_category_metric(),
+            {'Books': 0, 'Electronics': 2},
+        )
+        self.assertEqual(
+            get_graphic_product_brand_metric(),
+            {'Brand A': 2, 'Brand B': 0},
+        )
+
+    def test_get_graphic_product_metrics_use_single_query(self):
+        for index in range(20):
+            Category.objects.create(name=f'Category {index}')
+            Brand.objects.create(name=f'Brand {index}')
+
+        with self.assertNumQueries(1):
+            get_graphic_product_category_metric()
+        with self.assertNumQueries(1):
+            get_graphic_product_brand_metric(top=5)
+
+    def test_get_graphic_product_brand_metric_groups_others(self):
+        brand_b = Brand.objects.create(name='Brand B')
+        brand_c = Brand.objects.create(name='Brand C')
+        for brand, total in ((brand_b, 3), (brand_c, 1)):
+            for index in range(total):
+                Product.objects.create(
+                    title=f'{brand.name} {index}',
+                    cost_price=10.0,
+                    selling_price=15.0,
+                    category=self.category,
+                    brand=brand,
+                )
+
+        metrics = get_graphic_product_brand_metric(top=1)
+
+        self.assertEqual(metrics, {'Brand B': 3, OTHERS_LABEL: 3})
+
+    def test_get_graphic_product_brand_metric_merges_brand_named_others(self):
+        brand_others = Brand.objects.create(name=OTHERS_LABEL)
+        brand_c = Brand.objects.create(name='Brand C')
+        for brand, total in ((brand_others, 3), (brand_c, 1)):
+            for index in range(total):
+                Product.objects.create(
+                    title=f'{brand.name} {index}',
+                    cost_price=10.0,
+                    selling_price=15.0,
+                    category=self.category,
+                    brand=brand,
+                )
+
+        metrics = get_graphic_product_brand_metric(top=2)
+
+        self.assertEqual(metrics, {OTHERS_LABEL: 4, 'Brand A': 2})
+        self.assertEqual(sum(metrics.values()), Product.objects.count())
+
+    def test_get_graphic_product_category_metric_without_others(self):
+        metrics = get_graphic_product_category_metric(top=5)
+        self.assertEqual(metrics, {'Electronics': 2})
+
+
+class BenchmarkProductMetrics(TestCase):
+    """
+    Compara o pico de memória de get_product_metrics para catálogos de
+    tamanhos diferentes, garantindo que o cálculo não carrega os produtos.
+    """
+
+    def setUp(self):
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+
+    def _create_products(self, total):
+        Product.objects.bulk_create(
+            Product(
+                title=f'Product {index}',
+                cost_price=10.0,
+                selling_price=15.0,
+                quantity=2,
+                category=self.category,
+                brand=self.brand,
+            )
+            for index in range(total)
+        )
+
+    def _peak_memory(self):
+        tracemalloc.start()
+        get_product_metrics()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    def test_memory_does_not_grow_with_catalog_size(self):
+        self._create_products(10)
+        small_catalog_peak = self._peak_memory()
+
+        self._create_products(5000)
+        large_catalog_peak = self._peak_memory()
+
+        self.assertLess(large_catalog_peak, small_catalog_peak * 2)
+        self.assertEqual(get_product_metrics()['total_quantity'], 10020)
@@ -0,0 +1,126 @@
+from datetime import timedelta
+from decimal import Decimal
+from http import HTTPStatus
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.metrics import get_best_sellers, get_dead_stock
+from outflows.models import Outflow
+from products.models import Product
+
+
+class RankingTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.cheap = self._create_product('Cheap', 10.0, 100)
+        self.expensive = self._create_product('Expensive', 1000.0, 100)
+        self.stale = self._create_product('Stale', 50.0, 10)
+        self.never_sold = self._create_product('Never Sold', 20.0, 5)
+        self._create_product('Out Of Stock', 20.0, 0)
+
+        Outflow.objects.create(product=self.cheap, quantity=10)
+        Outflow.objects.create(product=self.cheap, quantity=5)
+        Outflow.objects.create(product=self.expensive, quantity=2)
+        old_outflow = Outflow.objects.create(product=self.stale, quantity=1)
+        Outflow.objects.filter(pk=old_outflow.pk).update(
+            created_at=timezone.now() - timedelta(days=90)
+        )
+
+    def _create_product(self, title, price, quantity):
+        return Product.objects.create(
+            title=title,
+            cost_price=price / 2,
+            selling_price=price,
+            quantity=quantity,
+            category=self.category,
+            brand=self.brand,
+        )
+
+    def test_get_best_sellers_by_units(self):
+        with self.assertNumQueries(1):
+            best_sellers = get_best_sellers('units', top=2)
+
+        self.assertEqual(
+            [(row['title'], row['units']) for row in best_sellers],
+            [('Cheap', 15), ('Expensive', 2)],
+        )
+        self.assertEqual(best_sellers[0]['sales'], 2)
+
+    def test_get_best_sellers_by_revenue(self):
+        best_sellers = get_best_sellers('revenue', top=1)
+        self.assertEqual(best_sellers[0]['title'], 'Expensive')
+        self.assertEqual(best_sellers[0]['revenue'], Decimal('2000.00'))
+
+    def test_get_best_sellers_within_days(self):
+        titles = [row['title'] for row in get_best_sellers(days=30)]
+        self.assertNotIn('Stale', titles)
+        titles = [row['title'] for row in get_best_sellers()]
+        self.assertIn('Stale', titles)
+
+    def test_get_dead_stock(self):
+        with self.assertNumQueries(1):
+            dead_stock = get_dead_stock(days=30)
+
+        self.assertEqual(
+            [row['title'] for row in dead_stock], ['Never Sold', 'Stale']
+        )
+        self.assertIsNone(dead_stock[0]['last_sale'])
+        self.assertEqual(dead_stock[1]['stock_cost'], Decimal('225.00'))
+
+    def test_get_dead_stock_with_larger_window(self):
+        titles = [row['title'] for row in get_dead_stock(days=120)]
+        self.assertEqual(titles, ['Never Sold'])
+
+
+class RankingViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser', password='testpass'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='view_outflow')
+        )
+        self.client.login(username='testuser', password='testpass')
+
+    def test_ranking_view_returns_report(self):
+        product = Product.objects.create(
+            title='Mouse Sem Fio',
+            cost_price=80.0,
+            selling_price=120.0,
+            quantity=10,
+            category=Category.objects.create(name='Mouse'),
+            brand=Brand.objects.create(name='Microsoft'),
+        )
+        Outflow.objects.create(product=product, quantity=3)
+
+        response = self.client.get(reverse('ranking'), {'days': 7, 'top': 5})
+
+        self.assertContains(response, 'Mouse Sem Fio')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, 'ranking.html')
+        self.assertEqual(response.context['days'], 7)
+        self.assertIn('best_sellers_by_units', response.context)
+        self.assertIn('best_sellers_by_revenue', response.context)
+        self.assertIn('dead_stock', response.context)
+
+    def test_ranking_view_invalid_parameters_use_defaults(self):
+        response = self.client.get(reverse('ranking'), {'days': 0})
+        self.assertEqual(response.context['days'], 30)
+
+    def test_ranking_view_user_sem_permissao_retorna_bloqueado(self):
+        User.objects.create_user(username='test2', password='12345')
+        self.client.login(username='test2', password='12345')
+        response = self.client.get(reverse('ranking'))
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_ranking_view_unauthenticated(self):
+        self.client.logout()
+        response = self.client.get(reverse('ranking'))
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertTrue(response.url.startswith('/login/'))
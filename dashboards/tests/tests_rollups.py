@@ -0,0 +1,137 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.cache import get_metrics_version
+from dashboards.metrics import (
+    get_daily_sales_data,
+    get_daily_sales_quantity_data,
+)
+from dashboards.models import DailySalesRollup
+from dashboards.rollups import get_total_rollups, rebuild_sales_rollups
+from outflows.models import Outflow
+from products.models import Product
+
+
+class TestsDailySalesRollup(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.product1 = Product.objects.create(
+            title='Product 1',
+            cost_price=100.0,
+            selling_price=150.0,
+            quantity=10,
+            category=self.category,
+            brand=self.brand,
+        )
+        self.product2 = Product.objects.create(
+            title='Product 2',
+            cost_price=200.0,
+            selling_price=300.0,
+            quantity=5,
+            category=self.category,
+            brand=self.brand,
+        )
+        Outflow.objects.create(product=self.product1, quantity=2)
+        Outflow.objects.create(product=self.product2, quantity=1)
+        Outflow.objects.create(product=self.product1, quantity=1)
+
+    def _snapshot(self):
+        return sorted(
+            DailySalesRollup.objects.values_list(
+                'date',
+                'product',
+                'category',
+                'brand',
+                'units',
+                'revenue',
+                'cost',
+                'count',
+            ),
+            key=str,
+        )
+
+    def test_outflow_updates_total_rollup(self):
+        total = get_total_rollups().get(date=timezone.localdate())
+        self.assertEqual(total.units, 4)
+        self.assertEqual(total.revenue, Decimal('750.00'))
+        self.assertEqual(total.cost, Decimal('500.00'))
+        self.assertEqual(total.count, 3)
+
+    def test_outflow_updates_dimension_rollups(self):
+        product_rollup = DailySalesRollup.objects.get(product=self.product1)
+        self.assertEqual(product_rollup.units, 3)
+        self.assertEqual(product_rollup.count, 2)
+
+        category_rollup = DailySalesRollup.objects.get(category=self.category)
+        brand_rollup = DailySalesRollup.objects.get(brand=self.brand)
+        self.assertEqual(category_rollup.revenue, Decimal('750.00'))
+        self.assertEqual(brand_rollup.revenue, Decimal('750.00'))
+        self.assertEqual(DailySalesRollup.objects.count(), 5)
+
+    def test_rebuild_matches_incremental_rollups(self):
+        expected = self._snapshot()
+        DailySalesRollup.objects.all().delete()
+
+        total = rebuild_sales_rollups()
+
+        self.assertEqual(total, 5)
+        self.assertEqual(self._snapshot(), expected)
+
+    def _assert_matches_rebuild(self):
+        incremental = self._snapshot()
+        rebuild_sales_rollups()
+        self.assertEqual(incremental, self._snapshot())
+
+    def test_updated_outflow_replaces_its_rollup_values(self):
+        outflow = Outflow.objects.get(product=self.product2)
+        outflow.product = self.product1
+        outflow.quantity = 4
+        outflow.save()
+
+        product_rollup = DailySalesRollup.objects.get(product=self.product1)
+        self.assertEqual(product_rollup.units, 7)
+        self.assertEqual(product_rollup.count, 3)
+        self.assertFalse(
+            DailySalesRollup.objects.filter(product=self.product2).exists()
+        )
+        self._assert_matches_rebuild()
+
+    def test_deleted_outflow_is_removed_from_rollups(self):
+        Outflow.objects.filter(product=self.product1).first().delete()
+
+        total = get_total_rollups().get(date=timezone.localdate())
+        self.assertEqual(total.count, 2)
+        self._assert_matches_rebuild()
+
+    def test_deleting_every_outflow_empties_rollups(self):
+        Outflow.objects.all().delete()
+        self.assertFalse(DailySalesRollup.objects.exists())
+
+    def test_rebuild_invalidates_cached_metrics(self):
+        version = get_metrics_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            rebuild_sales_rollups()
+        self.assertNotEqual(get_metrics_version(), version)
+
+    def test_rebuild_command(self):
+        DailySalesRollup.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_sales_rollups', batch_size=2, stdout=out)
+        self.assertIn('5 registros', out.getvalue())
+        self.assertEqual(DailySalesRollup.objects.count(), 5)
+
+    def test_daily_sales_charts_read_rollups_in_single_query(self):
+        with self.assertNumQueries(1):
+            sales_data = get_daily_sales_data()
+        with self.assertNumQueries(1):
+            quantity_data = get_daily_sales_quantity_data()
+
+        self.assertEqual(sum(sales_data['values']), 750.0)
+        self.assertEqual(sum(quantity_data['values']), 3)
@@ -0,0 +1,138 @@
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.metrics import get_product_metrics, get_sales_window
+from dashboards.models import DashboardSnapshot
+from dashboards.snapshots import (
+    get_latest_snapshot,
+    refresh_dashboard_snapshot,
+)
+from outflows.models import Outflow
+from products.models import Product
+
+
+class DashboardSnapshotTests(TestCase):
+    def setUp(self):
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpass'
+        )
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.product = Product.objects.create(
+            title='Product 1',
+            cost_price=100.0,
+            selling_price=150.0,
+            quantity=10,
+            category=self.category,
+            brand=self.brand,
+        )
+        Outflow.objects.create(product=self.product, quantity=2)
+
+    def test_refresh_stores_every_metric(self):
+        snapshot = refresh_dashboard_snapshot()
+        start_date, end_date = get_sales_window()
+
+        self.assertEqual(
+            snapshot.data['period'], [str(start_date), str(end_date), 'day']
+        )
+        self.assertEqual(
+            snapshot.data['metrics']['product_metrics'],
+            get_product_metrics(),
+        )
+        self.assertEqual(len(snapshot.data['metrics']), 6)
+
+    def test_refresh_keeps_only_recent_snapshots(self):
+        for _ in range(4):
+            latest = refresh_dashboard_snapshot(keep=2)
+        self.assertEqual(DashboardSnapshot.objects.count(), 2)
+        self.assertEqual(DashboardSnapshot.objects.first(), latest)
+
+    def test_refresh_keeps_recent_snapshots_with_gaps_in_pks(self):
+        refresh_dashboard_snapshot()
+        second = refresh_dashboard_snapshot()
+        gap = DashboardSnapshot.objects.create(pk=second.pk + 10, data={})
+        latest = refresh_dashboard_snapshot(keep=3)
+
+        self.assertEqual(
+            list(DashboardSnapshot.objects.all()), [latest, gap, second]
+        )
+
+    def test_refresh_rejects_keep_below_one(self):
+        with self.assertRaises(ValueError):
+            refresh_dashboard_snapshot(keep=0)
+        self.assertFalse(DashboardSnapshot.objects.exists())
+
+    def test_get_latest_snapshot_uses_single_query(self):
+        refresh_dashboard_snapshot()
+        latest = refresh_dashboard_snapshot()
+        start_date, end_date = get_sales_window()
+
+        with self.assertNumQueries(1):
+            snapshot = get_latest_snapshot(start_date, end_date, 'day')
+
+        self.assertEqual(snapshot, latest)
+
+    def test_get_latest_snapshot_ignores_other_periods(self):
+        refresh_dashboard_snapshot()
+        start_date, end_date = get_sales_window(30)
+        self.assertIsNone(get_latest_snapshot(start_date, end_date, 'day'))
+        self.assertIsNone(get_latest_snapshot(*get_sales_window(), 'week'))
+
+    def test_refresh_dashboard_command(self):
+        out = StringIO()
+        call_command('refresh_dashboard', stdout=out)
+        self.assertIn('gravado', out.getvalue())
+        self.assertEqual(DashboardSnapshot.objects.count(), 1)
+
+    def test_refresh_dashboard_command_rejects_keep_below_one(self):
+        with self.assertRaises(CommandError):
+            call_command('refresh_dashboard', keep=0, stdout=StringIO())
+        self.assertFalse(DashboardSnapshot.objects.exists())
+
+    def test_refresh_dashboard_command_with_interval(self):
+        out = StringIO()
+        with mock.patch(
+            'dashboards.management.commands.refresh_dashboard.time.sleep',
+            side_effect=[None, KeyboardInterrupt],
+        ) as sleep:
+            call_command('refresh_dashboard', interval=60, stdout=out)
+
+        sleep.assert_called_with(60)
+        self.assertEqual(DashboardSnapshot.objects.count(), 2)
+        self.assertIn('interrompida', out.getvalue())
+
+    def test_home_reads_snapshot(self):
+        snapshot = refresh_dashboard_snapshot()
+        self.client.login(username='testuser', password='testpass')
+
+        with mock.patch('dashboards.views.get_cached_metric') as metric:
+            response = self.client.get(reverse('home'))
+
+        metric.assert_not_called()
+        self.assertEqual(response.context['snapshot'], snapshot)
+        self.assertEqual(
+            response.context['product_metrics'],
+            snapshot.data['metrics']['product_metrics'],
+        )
+        self.assertContains(response, 'Métricas atualizadas há')
+
+    def test_home_falls_back_to_live_metrics(self):
+        refresh_dashboard_snapshot()
+        self.client.login(username='testuser', password='testpass')
+
+        response = self.client.get(reverse('home'), {'period': '30'})
+
+        self.assertIsNone(response.context['snapshot'])
+        self.assertEqual(
+            response.context['product_metrics'], get_product_metrics()
+        )
@@ -1,18 +1,24 @@
 import json
+import time
+from unittest import mock
 
-from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
+from django.test import Client, TestCase, TransactionTestCase
 from django.urls import reverse
 
 from brand.models import Brand
 from categories.models import Category
 from dashboards.metrics import (
+    PRODUCT_CHART_TOP,
     get_daily_sales_data,
     get_daily_sales_quantity_data,
     get_graphic_product_brand_metric,
     get_graphic_product_category_metric,
     get_product_metrics,
     get_sales_metrics,
+    get_sales_window,
 )
 from inflows.models import Inflow
 from outflows.models import Outflow
@@ -87,11 +93,25 @@ class HomeViewTests(TestCase):
         )
         self.assertEqual(
             response.context['product_count_by_category'],
-            json.dumps(get_graphic_product_category_metric()),
+            json.dumps(get_graphic_product_category_metric(PRODUCT_CHART_TOP)),
         )
         self.assertEqual(
             response.context['product_count_by_brand'],
-            json.dumps(get_graphic_product_brand_metric()),
+            json.dumps(get_graphic_product_brand_metric(PRODUCT_CHART_TOP)),
+        )
+
+    def test_home_view_with_period_filter(self):
+        self.client.login(username='testuser', password='testpass')
+
+        response = self.client.get(
+            reverse('home'), {'period': '30', 'granularity': 'week'}
+        )
+        self.assertEqual(response.status_code, 200)
+        start_date, end_date = get_sales_window(30)
+        self.assertEqual(response.context['start_date'], start_date)
+        self.assertEqual(
+            response.context['daily_sales_data'],
+            json.dumps(get_daily_sales_data(start_date, end_date, 'week')),
         )
 
     def test_home_view_unauthenticated(self):
@@ -99,3 +119,109 @@ class HomeViewTests(TestCase):
         self.assertRedirects(
             response, f'{reverse("login")}?next={reverse("home")}'
         )
+
+
+class HomeAsyncViewTests(TransactionTestCase):
+    def setUp(self):
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        self.user = User.objects.create_user(
+            username='testuser', password='testpass'
+        )
+        self.category = Category.objects.create(name='Electronics')
+        self.brand = Brand.objects.create(name='Brand A')
+        self.product = Product.objects.create(
+            title='Product 1',
+            cost_price=100.0,
+            selling_price=150.0,
+            quantity=10,
+            category=self.category,
+            brand=self.brand,
+        )
+        Outflow.objects.create(product=self.product, quantity=2)
+        self.product.refresh_from_db()
+
+    async def test_home_async_view_filter_form_submits_to_itself(self):
+        permission = await Permission.objects.aget(codename='view_outflow')
+        await self.user.user_permissions.aadd(permission)
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(reverse('home_async'))
+
+        self.assertContains(
+            response, f'<form method="get" action="{reverse("home_async")}"'
+        )
+
+    async def test_home_async_view_authenticated(self):
+        await self.async_client.aforce_login(self.user)
+
+        response = await self.async_client.get(reverse('home_async'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'home.html')
+        self.assertEqual(response.context['unavailable_metrics'], [])
+        self.assertEqual(
+            response.context['product_metrics']['total_quantity'],
+            self.product.quantity,
+        )
+        self.assertEqual(response.context['sales_metrics']['total_sales'], 1)
+        self.assertEqual(
+            json.loads(response.context['product_count_by_brand']),
+            {'Brand A': 1},
+        )
+
+    async def test_home_async_view_degrades_slow_metric(self):
+        def slow_metric(top):
+            time.sleep(1)
+            return {'Brand A': 1}
+
+        slow_metric.__name__ = 'get_graphic_product_brand_metric'
+        await self.async_client.aforce_login(self.user)
+
+        with (
+            mock.patch(
+                'dashboards.metrics.get_graphic_product_brand_metric',
+                slow_metric,
+            ),
+            self.settings(DASHBOARD_METRIC_TIMEOUT=0.2),
+            self.assertLogs('dashboards.views', 'WARNING'),
+        ):
+            response = await self.async_client.get(reverse('home_async'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context['unavailable_metrics'],
+            ['product_count_by_brand'],
+        )
+        self.assertEqual(response.context['product_count_by_brand'], '{}')
+        self.assertContains(response, 'Algumas métricas')
+
+    async def test_home_async_view_degrades_failing_metric(self):
+        await self.async_client.aforce_login(self.user)
+
+        with (
+            mock.patch(
+                'dashboards.metrics.get_sales_metrics',
+                mock.Mock(
+                    side_effect=RuntimeError, __name__='get_sales_metrics'
+                ),
+            ),
+            self.assertLogs('dashboards.views', 'WARNING'),
+        ):
+            response = await self.async_client.get(reverse('home_async'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context['unavailable_metrics'], ['sales_metrics']
+        )
+        self.assertEqual(
+            response.context['product_metrics']['total_quantity'],
+            self.product.quantity,
+        )
+
+    async def test_home_async_view_unauthenticated(self):
+        response = await self.async_client.get(reverse('home_async'))
+        self.assertRedirects(
+            response,
+            f'{reverse("login")}?next={reverse("home_async")}',
+            fetch_redirect_response=False,
+        )
@@ -4,4 +4,12 @@ from dashboards import views
 
 urlpatterns = [
     path('', views.home, name='home'),
+    path('async/', views.home_async, name='home_async'),
+    path('reports/ranking/', views.ranking, name='ranking'),
+    path('api/metrics/', views.metrics_api, name='metrics_api'),
+    path(
+        'api/metrics/<slug:metric>/',
+        views.metrics_api,
+        name='metric_api',
+    ),
 ]
@@ -1,27 +1,257 @@
+import asyncio
 import json
+import logging
+from functools import wraps
 
-from django.contrib.auth.decorators import login_required
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import (
+    login_required,
+    permission_required,
+)
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import PermissionDenied
+from django.db import connections
+from django.http import Http404, JsonResponse
 from django.shortcuts import render
+from django.template.response import TemplateResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_safe
 
 from dashboards import metrics
+from dashboards.cache import get_cached_metric, get_metrics_version
+from dashboards.forms import DashboardPeriodForm, RankingForm
+from dashboards.snapshots import get_latest_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Permissões exigidas para cada métrica da API, as mesmas que exibem a
+# métrica no dashboard (home.html).
+METRIC_PERMISSIONS = {
+    'product_metrics': ('products.view_product', 'inflows.view_inflow'),
+    'sales_metrics': ('outflows.view_outflow',),
+    'daily_sales_data': ('outflows.view_outflow',),
+    'daily_sales_quantity_data': ('outflows.view_outflow',),
+    'product_count_by_category': ('products.view_product',),
+    'product_count_by_brand': ('products.view_product',),
+}
+
+
+def _get_home_context(period_form, start_date, end_date, results) -> dict:
+    return {
+        'period_form': period_form,
+        'start_date': start_date,
+        'end_date': end_date,
+        'product_metrics': results['product_metrics'],
+        'sales_metrics': results['sales_metrics'],
+        'daily_sales_data': json.dumps(results['daily_sales_data']),
+        'daily_sales_quantity_data': json.dumps(
+            results['daily_sales_quantity_data']
+        ),
+        'product_count_by_category': json.dumps(
+            results['product_count_by_category']
+        ),
+        'product_count_by_brand': json.dumps(
+            results['product_count_by_brand']
+        ),
+    }
 
 
 @login_required(login_url='login')
 def home(request):
-    product_metrics = metrics.get_product_metrics()
-    sales_metrics = metrics.get_sales_metrics()
-    daily_sales_data = metrics.get_daily_sales_data()
-    daily_sales_quantity_data = metrics.get_daily_sales_quantity_data()
-    product_count_by_category = metrics.get_graphic_product_category_metric()
-    product_count_by_brand = metrics.get_graphic_product_brand_metric()
+    period_form = DashboardPeriodForm(request.GET or None)
+    start_date, end_date, granularity = period_form.get_period()
+    snapshot = get_latest_snapshot(start_date, end_date, granularity)
+    if snapshot is not None:
+        results = snapshot.data['metrics']
+    else:
+        metric_calls = metrics.get_dashboard_metric_calls(
+            start_date, end_date, granularity
+        )
+        results = {
+            name: get_cached_metric(metric, *args)
+            for name, (metric, args, _) in metric_calls.items()
+        }
+
+    template_name = 'home.html'
+    context = _get_home_context(period_form, start_date, end_date, results)
+    context['snapshot'] = snapshot
+    return TemplateResponse(request, template_name, context)
+
+
+def _get_cached_metric_in_thread(metric, *args):
+    try:
+        return get_cached_metric(metric, *args)
+    finally:
+        connections.close_all()
+
+
+async def _get_metric_with_timeout(metric, args):
+    return await asyncio.wait_for(
+        sync_to_async(_get_cached_metric_in_thread, thread_sensitive=False)(
+            metric, *args
+        ),
+        timeout=settings.DASHBOARD_METRIC_TIMEOUT,
+    )
+
+
+async def home_async(request):
+    """
+    Versão assíncrona do dashboard.
+
+    As métricas são calculadas em paralelo, cada uma em sua própria thread
+    e conexão com o banco, e a página é renderizada quando todas terminam.
+    Uma métrica que falha ou ultrapassa `DASHBOARD_METRIC_TIMEOUT` segundos
+    é exibida vazia e listada em `unavailable_metrics`, sem derrubar a
+    página; a consulta em andamento não é interrompida, apenas ignorada.
+    Quando existe um snapshot para o período pedido, ele é usado no lugar
+    do cálculo.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path(), 'login')
+
+    period_form = DashboardPeriodForm(request.GET or None)
+    start_date, end_date, granularity = period_form.get_period()
+    snapshot = await sync_to_async(get_latest_snapshot)(
+        start_date, end_date, granularity
+    )
+    if snapshot is not None:
+        context = _get_home_context(
+            period_form, start_date, end_date, snapshot.data['metrics']
+        )
+        context['snapshot'] = snapshot
+        return await sync_to_async(render)(request, 'home.html', context)
+
+    metric_calls = metrics.get_dashboard_metric_calls(
+        start_date, end_date, granularity
+    )
+    values = await asyncio.gather(
+        *(
+            _get_metric_with_timeout(metric, args)
+            for metric, args, _ in metric_calls.values()
+        ),
+        return_exceptions=True,
+    )
+
+    results = dict()
+    unavailable_metrics = list()
+    for (name, (_, _, default)), value in zip(metric_calls.items(), values):
+        if isinstance(value, Exception):
+            logger.warning('Métrica %s indisponível: %r', name, value)
+            unavailable_metrics.append(name)
+            results[name] = default
+        else:
+            results[name] = value
 
     template_name = 'home.html'
+    context = _get_home_context(period_form, start_date, end_date, results)
+    context['unavailable_metrics'] = unavailable_metrics
+    return await sync_to_async(render)(request, template_name, context)
+
+
+def _get_visible_metrics(user) -> list:
+    return [
+        name
+        for name, permissions in METRIC_PERMISSIONS.items()
+        if user.has_perms(permissions)
+    ]
+
+
+def _metric_permission_required(view):
+    """
+    Recusa com 403 a métrica pedida sem as permissões de
+    `METRIC_PERMISSIONS`, antes de a ETag ser comparada.
+    """
+
+    @wraps(view)
+    def wrapper(request, metric=None):
+        permissions = METRIC_PERMISSIONS.get(metric, ())
+        if not request.user.has_perms(permissions):
+            raise PermissionDenied
+        return view(request, metric)
+
+    return wrapper
+
+
+def _get_metrics_etag(request, metric=None) -> str:
+    """
+    Gera a ETag da API de métricas a partir da versão do cache, que é
+    incrementada a cada alteração de estoque, do período solicitado e,
+    sem `metric`, das métricas visíveis para o usuário.
+    """
+    period_form = DashboardPeriodForm(request.GET or None)
+    start_date, end_date, granularity = period_form.get_period()
+    return '-'.join(
+        [
+            str(get_metrics_version()),
+            metric or '+'.join(_get_visible_metrics(request.user)),
+            str(start_date),
+            str(end_date),
+            granularity,
+        ]
+    )
+
+
+@login_required(login_url='login')
+@require_safe
+@_metric_permission_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_get_metrics_etag)
+def metrics_api(request, metric=None):
+    """
+    Expõe as métricas do dashboard em JSON.
+
+    Sem o argumento `metric` retorna todas as métricas que o usuário pode
+    ver; com ele, apenas a métrica solicitada, ou 403 se o usuário não
+    tiver as permissões exigidas por ela (`METRIC_PERMISSIONS`). Aceita
+    os mesmos parâmetros de período do dashboard. A resposta possui uma
+    ETag forte e requisições com `If-None-Match` correspondente recebem
+    304, sem recalcular nada.
+    """
+    period_form = DashboardPeriodForm(request.GET or None)
+    start_date, end_date, granularity = period_form.get_period()
+    metric_calls = metrics.get_dashboard_metric_calls(
+        start_date, end_date, granularity
+    )
+
+    if metric is None:
+        visible_metrics = _get_visible_metrics(request.user)
+        data = {
+            name: get_cached_metric(function, *args)
+            for name, (function, args, _) in metric_calls.items()
+            if name in visible_metrics
+        }
+    elif metric in metric_calls:
+        function, args, _ = metric_calls[metric]
+        data = get_cached_metric(function, *args)
+    else:
+        raise Http404('Métrica não encontrada.')
+
+    return JsonResponse(data)
+
+
+@login_required(login_url='login')
+@permission_required('outflows.view_outflow', raise_exception=True)
+def ranking(request):
+    """
+    Relatório com os produtos mais vendidos e os produtos sem saída.
+
+    Os mais vendidos são ordenados por unidades e por receita dentro da
+    janela de dias escolhida; os produtos parados são os que possuem
+    estoque e nenhuma saída nessa janela.
+    """
+    ranking_form = RankingForm(request.GET or None)
+    days, top = ranking_form.get_values()
+
+    template_name = 'ranking.html'
     context = {
-        'product_metrics': product_metrics,
-        'sales_metrics': sales_metrics,
-        'daily_sales_data': json.dumps(daily_sales_data),
-        'daily_sales_quantity_data': json.dumps(daily_sales_quantity_data),
-        'product_count_by_category': json.dumps(product_count_by_category),
-        'product_count_by_brand': json.dumps(product_count_by_brand),
+        'ranking_form': ranking_form,
+        'days': days,
+        'best_sellers_by_units': metrics.get_best_sellers('units', top, days),
+        'best_sellers_by_revenue': metrics.get_best_sellers(
+            'revenue', top, days
+        ),
+        'dead_stock': metrics.get_dead_stock(days, top),
     }
-    return render(request, template_name, context)
+    return TemplateResponse(request, template_name, context)
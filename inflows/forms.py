@@ -1,9 +1,13 @@
 from django import forms
+from django.urls import reverse_lazy
 
+from core.forms import AutocompleteModelFormMixin
+from core.widgets import AutocompleteSelect
 from inflows.models import Inflow
+from inflows.receipts import parse_receipt
 
 
-class InflowForm(forms.ModelForm):
+class InflowForm(AutocompleteModelFormMixin, forms.ModelForm):
     """
     Formulário para a criação de entradas.
 
@@ -22,8 +26,14 @@ class InflowForm(forms.ModelForm):
         model = Inflow
         fields = ['supplier', 'product', 'quantity', 'description']
         widgets = {
-            'supplier': forms.Select(attrs={'class': 'form-control'}),
-            'product': forms.Select(attrs={'class': 'form-control'}),
+            'supplier': AutocompleteSelect(
+                reverse_lazy('supplier_autocomplete'),
+                attrs={'class': 'form-control'},
+            ),
+            'product': AutocompleteSelect(
+                reverse_lazy('product_autocomplete'),
+                attrs={'class': 'form-control'},
+            ),
             'quantity': forms.NumberInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(
                 attrs={'class': 'form-control', 'rows': 3}
@@ -35,3 +45,33 @@ class InflowForm(forms.ModelForm):
             'quantity': 'Quantidade',
             'description': 'Descrição',
         }
+
+
+class InflowReceiptForm(forms.Form):
+    """
+    Formulário para o recebimento de mercadorias em lote.
+
+    Attributes:
+        file (FileField): Arquivo CSV ou JSON com as linhas do recebimento.
+    """
+
+    file = forms.FileField(
+        label='Arquivo',
+        help_text=(
+            'CSV ou JSON com as colunas supplier (nome do fornecedor), '
+            'product (número de série ou título), quantity e, '
+            'opcionalmente, description.'
+        ),
+        widget=forms.ClearableFileInput(
+            attrs={'class': 'form-control', 'accept': '.csv,.json,.jsonl'}
+        ),
+    )
+
+    def clean_file(self) -> list:
+        """
+        Lê as linhas do arquivo enviado.
+
+        Returns:
+            list: Pares (número da linha, dados da linha).
+        """
+        return parse_receipt(self.cleaned_data['file'])
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 
 from products.models import Product
 from suppliers.models import Supplier
@@ -38,6 +38,14 @@ class Inflow(models.Model):
         """
         return str(self.product)
 
+    def save(self, *args, **kwargs):
+        """
+        Salva a entrada em uma transação, para que a atualização do estoque
+        feita pelos signals seja gravada junto com ela.
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
     class Meta:
         """
         Configurações do modelo no banco de dados.
@@ -0,0 +1,201 @@
+import csv
+import io
+import json
+from collections import Counter, defaultdict
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from core.monitoring import record_stock_movement
+from dashboards.cache import bump_metrics_version
+from inflows.models import Inflow
+from products.models import Product
+from suppliers.models import Supplier
+
+RECEIPT_BATCH_SIZE = 500
+RECEIPT_COLUMNS = ('supplier', 'product', 'quantity')
+
+
+def _read_csv(text: str) -> list:
+    try:
+        dialect = csv.Sniffer().sniff(text.partition('\n')[0], ',;')
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
+    missing = set(RECEIPT_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValidationError(
+            f'Colunas obrigatórias ausentes: {", ".join(sorted(missing))}.'
+        )
+    return [(reader.line_num, row) for row in reader]
+
+
+def _read_json(text: str) -> list:
+    try:
+        if text.lstrip().startswith('['):
+            items = enumerate(json.loads(text), start=1)
+        else:
+            items = [
+                (number, json.loads(line))
+                for number, line in enumerate(text.splitlines(), start=1)
+                if line.strip()
+            ]
+    except ValueError as error:
+        raise ValidationError(f'JSON inválido: {error}.') from error
+    return list(items)
+
+
+def parse_receipt(file) -> list:
+    """
+    Lê as linhas de um arquivo de recebimento.
+
+    Arquivos `.json` podem conter uma lista de objetos ou um objeto por
+    linha (JSON Lines); os demais são lidos como CSV, separado por vírgula
+    ou ponto e vírgula, com cabeçalho. Cada linha deve ter `supplier`
+    (nome do fornecedor), `product` (número de série ou título do
+    produto), `quantity` e, opcionalmente, `description`.
+
+    Args:
+        file (UploadedFile): Arquivo enviado, codificado em UTF-8.
+
+    Returns:
+        list: Pares (número da linha no arquivo, dados da linha).
+
+    Raises:
+        ValidationError: Se o arquivo não puder ser lido.
+    """
+    try:
+        text = file.read().decode('utf-8-sig')
+    except UnicodeDecodeError as error:
+        raise ValidationError('O arquivo deve estar em UTF-8.') from error
+    if file.name.lower().endswith('.json'):
+        rows = _read_json(text)
+    else:
+        rows = _read_csv(text)
+    if not rows:
+        raise ValidationError('O arquivo não tem linhas.')
+    return rows
+
+
+def _clean_row(row) -> tuple:
+    if not isinstance(row, dict):
+        raise ValidationError('formato inválido.')
+    supplier = str(row.get('supplier') or '').strip()
+    product = str(row.get('product') or '').strip()
+    if not supplier or not product:
+        raise ValidationError('informe o fornecedor e o produto.')
+    quantity = row.get('quantity')
+    if isinstance(quantity, str) and quantity.strip().isdigit():
+        quantity = int(quantity)
+    if type(quantity) is not int or quantity <= 0:
+        raise ValidationError('a quantidade deve ser um inteiro positivo.')
+    description = str(row.get('description') or '').strip() or None
+    return supplier, product, quantity, description
+
+
+def _find_products(references) -> dict:
+    by_serie_number, by_title = defaultdict(set), defaultdict(set)
+    rows = Product.objects.filter(
+        Q(serie_number__in=references) | Q(title__in=references)
+    ).values_list('id', 'serie_number', 'title')
+    for pk, serie_number, title in rows:
+        by_serie_number[serie_number].add(pk)
+        by_title[title].add(pk)
+    return {
+        reference: by_serie_number.get(reference) or by_title.get(reference)
+        for reference in references
+    }
+
+
+def _batches(items, size: int):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def receive_inflows(rows, batch_size: int = RECEIPT_BATCH_SIZE) -> tuple:
+    """
+    Registra as entradas de um recebimento de mercadorias.
+
+    Fornecedores e produtos de todas as linhas são carregados com uma
+    consulta por tabela: fornecedores pelo nome, com `in_bulk`, e produtos
+    pelo número de série ou, na falta dele, pelo título. Linhas inválidas
+    são relatadas e não impedem o registro das demais.
+
+    As entradas são gravadas com `bulk_create` em lotes de `batch_size`, e
+    o estoque recebe a soma das entradas de cada produto com `F()`, em um
+    único UPDATE por lote de produtos, dentro de uma única transação. Como
+    o `bulk_create` não dispara os signals de `Inflow`, a invalidação das
+    métricas em cache e as métricas do Prometheus também são feitas aqui.
+
+    Args:
+        rows (list): Pares (número da linha, dados da linha), como os
+        devolvidos por `parse_receipt`.
+        batch_size (int): Quantidade de registros por inserção e por
+        atualização de estoque.
+
+    Returns:
+        tuple: A lista de entradas criadas e a lista de erros, como pares
+        (número da linha, mensagem).
+    """
+    cleaned, errors = [], []
+    for number, row in rows:
+        try:
+            cleaned.append((number, *_clean_row(row)))
+        except ValidationError as error:
+            errors.append((number, error.messages[0]))
+
+    suppliers = Supplier.objects.only('name').in_bulk(
+        {supplier for _, supplier, _, _, _ in cleaned}, field_name='name'
+    )
+    products = _find_products({product for _, _, product, _, _ in cleaned})
+
+    inflows = []
+    for number, supplier, product, quantity, description in cleaned:
+        if supplier not in suppliers:
+            errors.append((number, f'fornecedor "{supplier}" não encontrado.'))
+        elif not products[product]:
+            errors.append((number, f'produto "{product}" não encontrado.'))
+        elif len(products[product]) > 1:
+            errors.append(
+                (number, f'mais de um produto corresponde a "{product}".')
+            )
+        else:
+            (product_id,) = products[product]
+            inflows.append(
+                Inflow(
+                    supplier=suppliers[supplier],
+                    product_id=product_id,
+                    quantity=quantity,
+                    description=description,
+                )
+            )
+    errors.sort()
+
+    totals = Counter()
+    for inflow in inflows:
+        totals[inflow.product_id] += inflow.quantity
+
+    with transaction.atomic():
+        Inflow.objects.bulk_create(inflows, batch_size=batch_size)
+        now = timezone.now()
+        for batch in _batches(sorted(totals.items()), batch_size):
+            increments = Case(
+                *(When(pk=pk, then=Value(total)) for pk, total in batch),
+                output_field=IntegerField(),
+            )
+            Product.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                quantity=F('quantity') + increments, updated_at=now
+            )
+        if inflows:
+            transaction.on_commit(bump_metrics_version)
+            transaction.on_commit(
+                lambda: record_stock_movement(
+                    'inflow', totals.total(), len(inflows)
+                )
+            )
+
+    return inflows, errors
@@ -1,6 +1,9 @@
+from django.db import transaction
+from django.db.models import F
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from core.monitoring import record_stock_movement
 from inflows.models import Inflow
 
 
@@ -13,7 +16,13 @@ def update_product_quantity(sender, instance, created, **kwargs):
     Este signal é acionado após a criação de uma nova instância do modelo
     Inflow. Se a instância foi criada e sua quantidade é maior que zero,
     a quantidade do produto associado é incrementada pela quantidade
-    da nova entrada e o produto é salvo.
+    da nova entrada.
+
+    A atualização é feita no banco com `F()` (`SET quantity = quantity +
+    n`), gravando apenas a quantidade e a data de atualização, para que
+    movimentações simultâneas do mesmo produto não percam atualizações.
+    Como `Inflow.save` roda em uma transação, o estoque é atualizado
+    junto com a entrada.
 
     Args:
         sender (Model): O modelo que enviou o sinal.
@@ -25,5 +34,27 @@ def update_product_quantity(sender, instance, created, **kwargs):
     if created:
         if instance.quantity > 0:
             product = instance.product
-            product.quantity += instance.quantity
-            product.save()
+            product.quantity = F('quantity') + instance.quantity
+            product.save(update_fields=['quantity', 'updated_at'])
+            product.refresh_from_db(fields=['quantity'])
+
+
+@receiver(post_save, sender=Inflow)
+def count_stock_movement(sender, instance, created, **kwargs):
+    """
+    Contabiliza a nova entrada nas métricas do Prometheus.
+
+    A contagem é feita apenas após o commit da transação, para que
+    entradas desfeitas não sejam contadas.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Inflow): A instância do modelo Inflow que foi criada.
+        created (bool): Indica se a instância foi criada (True)
+        ou atualizada (False).
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    if created:
+        transaction.on_commit(
+            lambda: record_stock_movement('inflow', instance.quantity)
+        )
@@ -0,0 +1,174 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from inflows.models import Inflow
+from inflows.receipts import parse_receipt, receive_inflows
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsParseReceipt(TestCase):
+    """
+    Testes para a leitura dos arquivos de recebimento.
+    """
+
+    def _parse(self, name, content):
+        return parse_receipt(SimpleUploadedFile(name, content.encode()))
+
+    def test_csv_retorna_linhas_numeradas(self):
+        """
+        Testa se o CSV é lido com o número da linha no arquivo.
+        """
+        resultado = self._parse(
+            'recebimento.csv',
+            'supplier;product;quantity\nIvan;MS01;5\nIvan;TC01;2\n',
+        )
+        self.assertEqual(
+            [(linha, dados['product']) for linha, dados in resultado],
+            [(2, 'MS01'), (3, 'TC01')],
+        )
+
+    def test_json_aceita_lista_e_json_lines(self):
+        """
+        Testa se o JSON é lido tanto como lista quanto como um objeto
+        por linha.
+        """
+        linha = {'supplier': 'Ivan', 'product': 'MS01', 'quantity': 5}
+        lista = self._parse('recebimento.json', json.dumps([linha, linha]))
+        linhas = self._parse(
+            'recebimento.json', f'{json.dumps(linha)}\n\n{json.dumps(linha)}'
+        )
+        self.assertEqual(lista, [(1, linha), (2, linha)])
+        self.assertEqual(linhas, [(1, linha), (3, linha)])
+
+    def test_arquivo_invalido_levanta_erro(self):
+        """
+        Testa se colunas ausentes, JSON inválido e arquivos vazios são
+        recusados.
+        """
+        arquivos = [
+            ('recebimento.csv', 'supplier,quantity\nIvan,5\n'),
+            ('recebimento.json', '[{"supplier": '),
+            ('recebimento.csv', 'supplier,product,quantity\n'),
+        ]
+        for name, content in arquivos:
+            with self.subTest(name=name, content=content):
+                with self.assertRaises(ValidationError):
+                    self._parse(name, content)
+
+
+class TestsReceiveInflows(TestCase):
+    """
+    Testes para o registro de entradas em lote.
+    """
+
+    def setUp(self):
+        """
+        Cria um fornecedor e produtos com e sem número de série.
+        """
+        brand = Brand.objects.create(name='Microsoft')
+        category = Category.objects.create(name='Periféricos')
+        self.supplier = Supplier.objects.create(name='Ivan')
+        self.mouse = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=brand,
+            category=category,
+            serie_number='MS01',
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=1,
+        )
+        self.keyboard = Product.objects.create(
+            title='Teclado Mecânico',
+            brand=brand,
+            category=category,
+            cost_price=110.00,
+            selling_price=185.00,
+        )
+
+    def _row(self, product, quantity=1, supplier='Ivan'):
+        return {'supplier': supplier, 'product': product, 'quantity': quantity}
+
+    def test_recebimento_registra_entradas_e_soma_estoque(self):
+        """
+        Testa se as entradas são registradas e o estoque de cada produto
+        recebe a soma das suas linhas.
+        """
+        rows = [
+            (1, self._row('MS01', 2)),
+            (2, self._row('Teclado Mecânico', '3')),
+            (3, self._row('MS01', 4)),
+        ]
+        inflows, errors = receive_inflows(rows)
+
+        self.mouse.refresh_from_db()
+        self.keyboard.refresh_from_db()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(inflows), 3)
+        self.assertEqual(Inflow.objects.filter(product=self.mouse).count(), 2)
+        self.assertEqual(self.mouse.quantity, 7)
+        self.assertEqual(self.keyboard.quantity, 3)
+
+    def test_recebimento_tem_consultas_constantes(self):
+        """
+        Testa se a quantidade de consultas não depende da quantidade de
+        linhas nem de produtos, dentro de um lote.
+        """
+        rows = [(number, self._row('MS01')) for number in range(100)]
+        rows.append((100, self._row('Teclado Mecânico')))
+
+        # Fornecedores, produtos, savepoint, INSERT, UPDATE e release.
+        with self.assertNumQueries(6):
+            receive_inflows(rows)
+
+        self.mouse.refresh_from_db()
+        self.assertEqual(self.mouse.quantity, 101)
+
+    def test_recebimento_em_lotes(self):
+        """
+        Testa se lotes menores que o arquivo registram todas as linhas.
+        """
+        rows = [(1, self._row('MS01')), (2, self._row('Teclado Mecânico'))]
+        rows += [(3, self._row('MS01'))]
+        inflows, _ = receive_inflows(rows, batch_size=1)
+
+        self.mouse.refresh_from_db()
+        self.keyboard.refresh_from_db()
+        self.assertEqual(Inflow.objects.count(), 3)
+        self.assertEqual(self.mouse.quantity, 3)
+        self.assertEqual(self.keyboard.quantity, 1)
+
+    def test_recebimento_relata_erros_sem_abortar(self):
+        """
+        Testa se as linhas inválidas são relatadas com o número da linha
+        e não impedem o registro das válidas.
+        """
+        Product.objects.create(
+            title='Teclado Mecânico',
+            brand=self.mouse.brand,
+            category=self.mouse.category,
+            cost_price=110.00,
+            selling_price=185.00,
+        )
+        rows = [
+            (2, self._row('MS01', 5)),
+            (3, self._row('MS01', supplier='Desconhecido')),
+            (4, self._row('XPTO')),
+            (5, self._row('Teclado Mecânico')),
+            (6, self._row('MS01', 0)),
+            (7, self._row('')),
+            (8, 'texto'),
+        ]
+        inflows, errors = receive_inflows(rows)
+
+        self.mouse.refresh_from_db()
+        self.assertEqual(len(inflows), 1)
+        self.assertEqual(self.mouse.quantity, 6)
+        self.assertEqual([linha for linha, _ in errors], [3, 4, 5, 6, 7, 8])
+        self.assertIn('Desconhecido', errors[0][1])
+        self.assertIn('mais de um produto', errors[2][1])
@@ -56,3 +56,20 @@ class TestsUrlsInflow(TestCase):
         esperado = views.InflowDetailView
         resultado = resolve(reverse('inflow_detail', kwargs={'pk': 1}))
         self.assertIs(esperado, resultado.func.view_class)
+
+    def test_url_inflow_export_possui_a_url_correta(self):
+        """
+        Testa se a URL de exportação está correta.
+        """
+        esperado = '/inflows/export/'
+        resultado = reverse('inflow_export')
+        self.assertEqual(esperado, resultado)
+
+    def test_url_inflow_export_retorna_a_view_export_inflow(self):
+        """
+        Testa se a URL de exportação retorna a view correta
+        (InflowExportView).
+        """
+        esperado = views.InflowExportView
+        resultado = resolve(reverse('inflow_export'))
+        self.assertIs(esperado, resultado.func.view_class)
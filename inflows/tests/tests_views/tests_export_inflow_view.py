@@ -0,0 +1,72 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from inflows.models import Inflow
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsInflowExportView(TestCase):
+    """
+    Testes para a exportação de entradas.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão para visualizar entradas e entradas
+        de dois produtos.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='view_inflow')
+        )
+        self.client.login(username='testuser', password='12345')
+        brand = Brand.objects.create(name='Microsoft')
+        category = Category.objects.create(name='Periféricos')
+        supplier = Supplier.objects.create(name='Ivan')
+        for title in ('Mouse Sem Fio', 'Teclado Mecânico'):
+            product = Product.objects.create(
+                title=title,
+                brand=brand,
+                category=category,
+                cost_price=80.00,
+                selling_price=120.00,
+            )
+            Inflow.objects.create(
+                supplier=supplier, product=product, quantity=10
+            )
+
+    def _export(self, **params):
+        response = self.client.get(reverse('inflow_export'), params)
+        content = b''.join(response.streaming_content).decode()
+        return response, content
+
+    def test_export_csv_retorna_todos_os_registros(self):
+        """
+        Testa se a exportação em CSV traz o cabeçalho e todas as entradas.
+        """
+        response, content = self._export()
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('entradas.csv', response['Content-Disposition'])
+        self.assertEqual(len(content.splitlines()), 3)
+
+    def test_export_respeita_o_filtro_por_produto(self):
+        """
+        Testa se a exportação usa o mesmo filtro por produto da listagem.
+        """
+        _, content = self._export(product='Tecl', format='jsonl')
+
+        linhas = [json.loads(linha) for linha in content.splitlines()]
+        self.assertEqual(len(linhas), 1)
+        self.assertEqual(linhas[0]['product'], 'Teclado Mecânico')
+        self.assertEqual(linhas[0]['supplier'], 'Ivan')
+        self.assertEqual(linhas[0]['quantity'], 10)
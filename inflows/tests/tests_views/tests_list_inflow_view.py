@@ -115,6 +115,17 @@ class TestsListInflowView(TestCase):
         self.assertContains(response, 'Mouse')
         self.assertNotContains(response, 'Teclado')
 
+    def test_list_view_retorna_context_com_busca_aproximada(self):
+        """
+        Testa se a busca aproximada (`fuzzy`) encontra as entradas
+        do produto mesmo com erro de digitação no termo.
+        """
+        response = self.client.get(
+            reverse('inflow_list'), {'product': 'Teclao', 'fuzzy': '1'}
+        )
+        self.assertContains(response, 'Teclado')
+        self.assertNotContains(response, 'Mouse Sem Fio')
+
     def test_list_view_retorna_context_e_quantidade_de_itens(self):
         """
         Testa se o contexto da view contém a lista de entradas
@@ -153,3 +164,21 @@ class TestsListInflowView(TestCase):
         response = self.client.get(reverse('inflow_list'))
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
+
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de entradas executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        with self.assertNumQueries(6):
+            self.client.get(reverse('inflow_list'))
+
+        for index in range(10):
+            Inflow.objects.create(
+                supplier=Supplier.objects.create(name=f'Fornecedor {index}'),
+                product=self.inflow_mouse.product,
+                quantity=1,
+            )
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('inflow_list'))
+        self.assertEqual(len(response.context['inflows']), 10)
@@ -0,0 +1,123 @@
+from http import HTTPStatus
+
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.cache import get_cached_metric
+from dashboards.metrics import get_product_metrics
+from inflows.models import Inflow
+from products.models import Product
+from suppliers.models import Supplier
+
+
+class TestsInflowReceiptView(TestCase):
+    """
+    Testes para a view de recebimento de entradas em lote.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão para registrar entradas, um
+        fornecedor e um produto.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='add_inflow')
+        )
+        self.client.login(username='testuser', password='12345')
+        Supplier.objects.create(name='Ivan')
+        self.product = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=Brand.objects.create(name='Microsoft'),
+            category=Category.objects.create(name='Mouse'),
+            serie_number='MS01',
+            cost_price=80.00,
+            selling_price=120.00,
+        )
+        self.url = reverse('inflow_receipt')
+
+    def _post(self, content, name='recebimento.csv'):
+        file = SimpleUploadedFile(name, content.encode())
+        return self.client.post(self.url, data={'file': file})
+
+    def test_receipt_view_retorna_status_code_200_e_template(self):
+        """
+        Testa se a página de recebimento está acessível.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, 'inflow_receipt.html')
+
+    def test_receipt_view_registra_linhas_validas_e_lista_erros(self):
+        """
+        Testa se as linhas válidas são registradas e os erros das demais
+        são exibidos com o número da linha.
+        """
+        response = self._post(
+            'supplier,product,quantity\nIvan,MS01,5\nIvan,XPTO,1\n'
+        )
+
+        self.product.refresh_from_db()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.context['created'], 1)
+        self.assertEqual(
+            response.context['errors'], [(3, 'produto "XPTO" não encontrado.')]
+        )
+        self.assertEqual(Inflow.objects.count(), 1)
+        self.assertEqual(self.product.quantity, 5)
+
+    def test_receipt_view_invalida_metricas_em_cache(self):
+        """
+        Testa se o recebimento invalida as métricas de produtos em cache e
+        a ETag da API de métricas, mesmo sem disparar os signals de
+        Inflow.
+        """
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        self.user.user_permissions.add(
+            *Permission.objects.filter(
+                codename__in=['view_product', 'view_inflow']
+            )
+        )
+        url = reverse('metric_api', kwargs={'metric': 'product_metrics'})
+        etag = self.client.get(url)['ETag']
+        metrics = get_cached_metric(get_product_metrics)
+        self.assertEqual(metrics['total_quantity'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._post('supplier,product,quantity\nIvan,MS01,5\n')
+
+        response = self.client.get(url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['total_quantity'], 5)
+        metrics = get_cached_metric(get_product_metrics)
+        self.assertEqual(metrics['total_quantity'], 5)
+
+    def test_receipt_view_arquivo_invalido_retorna_erro_no_formulario(self):
+        """
+        Testa se um arquivo ilegível volta com o erro no formulário, sem
+        registrar entradas.
+        """
+        response = self._post('[{', name='recebimento.json')
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('file', response.context['form'].errors)
+        self.assertNotIn('created', response.context)
+        self.assertEqual(Inflow.objects.count(), 0)
+
+    def test_receipt_view_sem_permissao_retorna_bloqueado(self):
+        """
+        Testa se um usuário sem permissão para registrar entradas recebe
+        403.
+        """
+        self.user.user_permissions.clear()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
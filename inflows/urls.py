@@ -8,11 +8,21 @@ urlpatterns = [
         views.InflowListView.as_view(),
         name='inflow_list',
     ),
+    path(
+        'inflows/export/',
+        views.InflowExportView.as_view(),
+        name='inflow_export',
+    ),
     path(
         'inflows/create/',
         views.InflowCreateView.as_view(),
         name='inflow_create',
     ),
+    path(
+        'inflows/receipt/',
+        views.InflowReceiptView.as_view(),
+        name='inflow_receipt',
+    ),
     path(
         'inflows/<int:pk>/detail/',
         views.InflowDetailView.as_view(),
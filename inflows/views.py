@@ -6,11 +6,17 @@ from django.urls import reverse_lazy
 from django.views.generic import (
     CreateView,
     DetailView,
+    FormView,
     ListView,
 )
 
-from inflows.forms import InflowForm
+from core.exports import StreamingExportMixin
+from core.pagination import EstimatedCountPaginator
+from inflows.forms import InflowForm, InflowReceiptForm
 from inflows.models import Inflow
+from inflows.receipts import receive_inflows
+from products.models import Product
+from products.search import get_similar_products
 
 
 class InflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
@@ -25,6 +31,7 @@ class InflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         template_name: O template a ser renderizado para a lista de entradas.
         context_object_name: O nome do contexto a ser utilizado no template.
         paginate_by: Número de entradas a serem exibidas por página.
+        paginator_class: Paginador que estima o total em listagens grandes.
         permission_required: Permissão necessária para acessar a view.
     """
 
@@ -32,22 +39,59 @@ class InflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     template_name = 'inflow_list.html'
     context_object_name = 'inflows'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
     permission_required = 'inflows.view_inflow'
 
     def get_queryset(self):
         """
         Obtém a lista de entradas, aplicando filtro pelo nome caso fornecido.
 
+        Com o parâmetro `fuzzy`, o nome é buscado de forma aproximada no
+        título e no número de série dos produtos. Produto e fornecedor vêm
+        na mesma consulta, apenas com as colunas exibidas na listagem.
+
         Returns:
             QuerySet: Lista de entradas filtradas pelo nome (se fornecido).
         """
-        queryset = super().get_queryset()
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related('product', 'supplier')
+            .only('quantity', 'created_at', 'product__title', 'supplier__name')
+        )
         product = self.request.GET.get('product')
-        if product:
+        if product and self.request.GET.get('fuzzy'):
+            similar = get_similar_products(Product.objects.all(), product)
+            queryset = queryset.filter(product__in=[pk for pk, _ in similar])
+        elif product:
             queryset = queryset.filter(product__title__istartswith=product)
         return queryset
 
 
+class InflowExportView(StreamingExportMixin, InflowListView):
+    """
+    View para exportar entradas em CSV ou JSON Lines.
+
+    Exporta todas as entradas da listagem, com os mesmos filtros da URL.
+
+    Attributes:
+        export_fields: Colunas exportadas e os campos de origem.
+        export_filename: Nome do arquivo baixado, sem extensão.
+    """
+
+    export_fields = (
+        ('id', 'id'),
+        ('created_at', 'created_at'),
+        ('supplier', 'supplier__name'),
+        ('product_id', 'product_id'),
+        ('product', 'product__title'),
+        ('serie_number', 'product__serie_number'),
+        ('quantity', 'quantity'),
+        ('description', 'description'),
+    )
+    export_filename = 'entradas'
+
+
 class InflowCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, CreateView
 ):
@@ -73,6 +117,42 @@ class InflowCreateView(
     permission_required = 'inflows.add_inflow'
 
 
+class InflowReceiptView(LoginRequiredMixin, PermissionRequiredMixin, FormView):
+    """
+    View para o recebimento de mercadorias em lote.
+
+    Recebe um arquivo CSV ou JSON com várias entradas e registra todas as
+    linhas válidas de uma vez, com `receive_inflows`. A página é exibida
+    novamente com a quantidade de entradas registradas e os erros de cada
+    linha recusada.
+
+    Attributes:
+        template_name: O template a ser renderizado para o recebimento.
+        form_class: O formulário a ser utilizado para o envio do arquivo.
+        permission_required: Permissão necessária para acessar a view.
+    """
+
+    template_name = 'inflow_receipt.html'
+    form_class = InflowReceiptForm
+    permission_required = 'inflows.add_inflow'
+
+    def form_valid(self, form):
+        """
+        Registra as entradas do arquivo e exibe o resultado.
+
+        Args:
+            form (InflowReceiptForm): Formulário com as linhas do arquivo.
+
+        Returns:
+            HttpResponse: A página de recebimento com o resultado.
+        """
+        inflows, errors = receive_inflows(form.cleaned_data['file'])
+        context = self.get_context_data(
+            form=self.form_class(), created=len(inflows), errors=errors
+        )
+        return self.render_to_response(context)
+
+
 class InflowDetailView(
     LoginRequiredMixin, PermissionRequiredMixin, DetailView
 ):
@@ -1,6 +1,8 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.http import HttpResponseRedirect
 
-from outflows.models import Outflow
+from outflows.forms import OutflowAdminForm
+from outflows.models import InsufficientStockError, Outflow, SalesOrder
 
 
 class OutflowAdmin(admin.ModelAdmin):
@@ -11,12 +13,18 @@ class OutflowAdmin(admin.ModelAdmin):
     painel de administração do Django. Permite que os administradores
     visualizem e gerenciem saídas de forma eficiente.
 
+    Saídas que o estoque não comporta são recusadas pelo formulário; se o
+    estoque mudar entre a validação e a gravação, o erro do decremento é
+    exibido como mensagem, sem gravar a saída.
+
     Attributes:
+        form (ModelForm): Formulário que verifica o estoque do produto.
         list_display (tuple): Campos a serem exibidos na lista de saídas.
         search_fields (tuple): Campos nos quais é possível realizar buscas
         no painel de administração.
     """
 
+    form = OutflowAdminForm
     list_display = (
         'product',
         'quantity',
@@ -25,5 +33,51 @@ class OutflowAdmin(admin.ModelAdmin):
     )
     search_fields = ('product__title',)
 
+    def changeform_view(
+        self, request, object_id=None, form_url='', extra_context=None
+    ):
+        try:
+            return super().changeform_view(
+                request, object_id, form_url, extra_context
+            )
+        except InsufficientStockError as error:
+            self.message_user(request, str(error), messages.ERROR)
+            return HttpResponseRedirect(request.get_full_path())
+
+
+class OutflowInline(admin.TabularInline):
+    """
+    Exibe as saídas de um pedido de venda na página do pedido.
+    """
+
+    model = Outflow
+    fields = ('product', 'quantity', 'unit_selling_price')
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+
+class SalesOrderAdmin(admin.ModelAdmin):
+    """
+    Configuração do painel de administração para o modelo SalesOrder.
+
+    Os pedidos são registrados pelo endpoint de pedidos de venda; no painel
+    eles e suas saídas podem apenas ser consultados.
+
+    Attributes:
+        list_display (tuple): Campos a serem exibidos na lista de pedidos.
+        inlines (list): Saídas exibidas na página do pedido.
+    """
+
+    list_display = (
+        '__str__',
+        'created_at',
+    )
+    inlines = [OutflowInline]
+
+    def has_add_permission(self, request):
+        return False
+
 
 admin.site.register(Outflow, OutflowAdmin)
+admin.site.register(SalesOrder, SalesOrderAdmin)
@@ -2,11 +2,14 @@ from typing import Any
 
 from django import forms
 from django.core.exceptions import ValidationError
+from django.urls import reverse_lazy
 
-from outflows.models import Outflow
+from core.forms import AutocompleteModelFormMixin
+from core.widgets import AutocompleteSelect
+from outflows.models import InsufficientStockError, Outflow
 
 
-class OutflowForm(forms.ModelForm):
+class OutflowForm(AutocompleteModelFormMixin, forms.ModelForm):
     """
     Formulário para a criação de saídas.
 
@@ -25,7 +28,10 @@ class OutflowForm(forms.ModelForm):
         model = Outflow
         fields = ['product', 'quantity', 'description']
         widgets = {
-            'product': forms.Select(attrs={'class': 'form-control'}),
+            'product': AutocompleteSelect(
+                reverse_lazy('product_autocomplete'),
+                attrs={'class': 'form-control'},
+            ),
             'quantity': forms.NumberInput(attrs={'class': 'form-control'}),
             'description': forms.Textarea(
                 attrs={'class': 'form-control', 'rows': 3}
@@ -45,3 +51,32 @@ class OutflowForm(forms.ModelForm):
                 f'A quantidade disponível em estoque para o produto {product.title} é de {product.quantity} unidades.'  # noqa: E501
             )
         return quantity
+
+
+class OutflowAdminForm(forms.ModelForm):
+    """
+    Formulário das saídas no painel de administração.
+
+    Ao criar uma saída, verifica se o estoque do produto a comporta, para
+    que o erro seja exibido no formulário em vez de interromper a
+    gravação com `InsufficientStockError`.
+    """
+
+    class Meta:
+        model = Outflow
+        fields = '__all__'
+
+    def clean(self) -> dict:
+        cleaned_data = super().clean()
+        product = cleaned_data.get('product')
+        quantity = cleaned_data.get('quantity')
+        if (
+            self.instance._state.adding
+            and product is not None
+            and quantity is not None
+            and quantity > product.quantity
+        ):
+            self.add_error(
+                'quantity', str(InsufficientStockError(product, quantity))
+            )
+        return cleaned_data
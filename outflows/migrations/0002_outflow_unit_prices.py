@@ -0,0 +1,26 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('outflows', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outflow',
+            name='unit_cost_price',
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=20, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name='outflow',
+            name='unit_selling_price',
+            field=models.DecimalField(
+                blank=True, decimal_places=2, max_digits=20, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:52
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_unit_prices(apps, schema_editor):
+    Outflow = apps.get_model('outflows', 'Outflow')
+    Product = apps.get_model('products', 'Product')
+    product = Product.objects.filter(pk=OuterRef('product_id'))
+    Outflow.objects.filter(unit_selling_price__isnull=True).update(
+        unit_selling_price=Subquery(product.values('selling_price')[:1])
+    )
+    Outflow.objects.filter(unit_cost_price__isnull=True).update(
+        unit_cost_price=Subquery(product.values('cost_price')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('outflows', '0002_outflow_unit_prices'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_unit_prices, migrations.RunPython.noop),
+    ]
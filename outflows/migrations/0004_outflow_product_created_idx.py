@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 02:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('outflows', '0003_backfill_outflow_unit_prices'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='outflow',
+            index=models.Index(
+                fields=['product', 'created_at'],
+                name='outflow_product_created_idx',
+            ),
+        ),
+    ]
@@ -1,17 +1,77 @@
-from django.db import models
+from django.db import models, transaction
 
 from products.models import Product
 
 
+class InsufficientStockError(Exception):
+    """
+    Erro levantado quando o estoque do produto não comporta a saída.
+
+    Attributes:
+        product (Product): Produto da saída.
+        quantity (int): Quantidade solicitada.
+    """
+
+    def __init__(self, product, quantity):
+        self.product = product
+        self.quantity = quantity
+        super().__init__(
+            f'O estoque do produto {product.title} não comporta a saída '
+            f'de {quantity} unidades.'
+        )
+
+
+class SalesOrder(models.Model):
+    """
+    Modelo que representa um pedido de venda com várias saídas.
+
+    Attributes:
+        description (str, optional): Descrição opcional sobre o pedido.
+        created_at (datetime): Data e hora de criação do registro.
+        updated_at (datetime): Data e hora da última atualização
+        do registro.
+    """
+
+    description = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        """
+        Retorna o identificador do pedido de venda.
+
+        Returns:
+            str: Número do pedido.
+        """
+        return f'Pedido {self.pk}'
+
+    class Meta:
+        """
+        Configurações do modelo no banco de dados.
+
+        Attributes:
+            ordering (list): Define a ordenação padrão pela data
+            de criação, da mais recente para a mais antiga.
+        """
+
+        ordering = ['-created_at']
+
+
 class Outflow(models.Model):
     """
     Modelo que representa a saída de produtos do estoque.
 
     Attributes:
         product (Product): Produto que está sendo retirado do estoque.
+        order (SalesOrder, optional): Pedido de venda da saída, quando ela
+        foi registrada como uma linha de pedido.
         quantity (int): Quantidade do produto retirada.
         description (str, optional): Descrição opcional sobre a saída
         do produto.
+        unit_selling_price (Decimal, optional): Preço de venda unitário do
+        produto no momento da saída.
+        unit_cost_price (Decimal, optional): Preço de custo unitário do
+        produto no momento da saída.
         created_at (datetime): Data e hora de criação do registro.
         updated_at (datetime): Data e hora da última atualização
         do registro.
@@ -20,8 +80,21 @@ class Outflow(models.Model):
     product = models.ForeignKey(
         Product, on_delete=models.PROTECT, related_name='outflows'
     )
+    order = models.ForeignKey(
+        SalesOrder,
+        on_delete=models.PROTECT,
+        related_name='outflows',
+        null=True,
+        blank=True,
+    )
     quantity = models.IntegerField()
     description = models.TextField(null=True, blank=True)
+    unit_selling_price = models.DecimalField(
+        max_digits=20, decimal_places=2, null=True, blank=True
+    )
+    unit_cost_price = models.DecimalField(
+        max_digits=20, decimal_places=2, null=True, blank=True
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -34,6 +107,14 @@ class Outflow(models.Model):
         """
         return str(self.product)
 
+    def save(self, *args, **kwargs):
+        """
+        Salva a saída em uma transação, para que a atualização do estoque
+        feita pelos signals seja gravada junto com ela.
+        """
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+
     class Meta:
         """
         Configurações do modelo no banco de dados.
@@ -41,6 +122,14 @@ class Outflow(models.Model):
         Attributes:
             ordering (list): Define a ordenação padrão pela data
             de criação, da mais recente para a mais antiga.
+            indexes (list): Índice por produto e data de criação, usado
+            nos rankings de vendas por produto.
         """
 
         ordering = ['-created_at']
+        indexes = [
+            models.Index(
+                fields=['product', 'created_at'],
+                name='outflow_product_created_idx',
+            ),
+        ]
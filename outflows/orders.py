@@ -0,0 +1,126 @@
+from collections import Counter
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.monitoring import record_stock_movement
+from dashboards.cache import bump_metrics_version
+from dashboards.rollups import register_outflows
+from outflows.models import InsufficientStockError, Outflow, SalesOrder
+from products.models import Product
+
+MAX_ORDER_LINES = 200
+
+
+def _parse_lines(lines) -> list:
+    if not isinstance(lines, list) or not lines:
+        raise ValidationError('Informe ao menos uma linha no pedido.')
+    if len(lines) > MAX_ORDER_LINES:
+        raise ValidationError(
+            f'O pedido pode ter no máximo {MAX_ORDER_LINES} linhas.'
+        )
+    parsed = []
+    for number, line in enumerate(lines, start=1):
+        if not isinstance(line, dict):
+            raise ValidationError(f'Linha {number}: formato inválido.')
+        product, quantity = line.get('product'), line.get('quantity')
+        if type(product) is not int or type(quantity) is not int:
+            raise ValidationError(
+                f'Linha {number}: produto e quantidade devem ser inteiros.'
+            )
+        if quantity <= 0:
+            raise ValidationError(
+                f'Linha {number}: a quantidade deve ser maior que zero.'
+            )
+        description = line.get('description')
+        if description is not None and not isinstance(description, str):
+            raise ValidationError(
+                f'Linha {number}: a descrição deve ser um texto.'
+            )
+        parsed.append((product, quantity, description))
+    return parsed
+
+
+def create_sales_order(lines, description: str | None = None) -> tuple:
+    """
+    Registra um pedido de venda com uma saída para cada linha.
+
+    Os produtos são carregados em uma única consulta, e o estoque de cada
+    produto é decrementado uma única vez pela soma das suas linhas, com o
+    mesmo `UPDATE ... WHERE quantity >= n` usado pelas saídas avulsas. As
+    saídas são gravadas com `bulk_create`, que não dispara os signals de
+    `Outflow`: os preços unitários, a consolidação diária de vendas, a
+    invalidação das métricas em cache e as métricas do Prometheus são
+    tratados aqui. Tudo roda em uma única transação, de modo que um
+    produto sem estoque desfaz o pedido inteiro.
+
+    Args:
+        lines (list): Linhas do pedido, cada uma um dicionário com
+        `product` (id do produto), `quantity` e, opcionalmente,
+        `description`.
+        description (str, optional): Descrição do pedido.
+
+    Returns:
+        tuple: O pedido criado (SalesOrder) e a lista das suas saídas,
+        na ordem das linhas.
+
+    Raises:
+        ValidationError: Se as linhas ou as descrições forem inválidas ou
+        se as linhas referenciarem produtos inexistentes.
+        InsufficientStockError: Se o estoque de algum produto não
+        comportar a soma das suas linhas.
+    """
+    if description is not None and not isinstance(description, str):
+        raise ValidationError('A descrição do pedido deve ser um texto.')
+    parsed = _parse_lines(lines)
+    products = Product.objects.only(
+        'title',
+        'selling_price',
+        'cost_price',
+        'category_id',
+        'brand_id',
+    ).in_bulk({product_id for product_id, _, _ in parsed})
+    missing = sorted({pk for pk, _, _ in parsed} - products.keys())
+    if missing:
+        raise ValidationError(
+            f'Produtos não encontrados: {", ".join(map(str, missing))}.'
+        )
+
+    totals = Counter()
+    for product_id, quantity, _ in parsed:
+        totals[product_id] += quantity
+
+    with transaction.atomic():
+        now = timezone.now()
+        # Em ordem de id, para que pedidos simultâneos bloqueiem os
+        # produtos na mesma ordem e não entrem em deadlock.
+        for product_id, quantity in sorted(totals.items()):
+            updated = Product.objects.filter(
+                pk=product_id, quantity__gte=quantity
+            ).update(quantity=F('quantity') - quantity, updated_at=now)
+            if not updated:
+                raise InsufficientStockError(products[product_id], quantity)
+
+        order = SalesOrder.objects.create(description=description)
+        outflows = Outflow.objects.bulk_create(
+            Outflow(
+                order=order,
+                product=products[product_id],
+                quantity=quantity,
+                description=line_description,
+                unit_selling_price=products[product_id].selling_price,
+                unit_cost_price=products[product_id].cost_price,
+            )
+            for product_id, quantity, line_description in parsed
+        )
+        register_outflows(outflows)
+        transaction.on_commit(bump_metrics_version)
+        transaction.on_commit(
+            lambda: record_stock_movement(
+                'outflow', totals.total(), len(outflows)
+            )
+        )
+
+    return order, outflows
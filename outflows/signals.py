@@ -1,7 +1,36 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
-from outflows.models import Outflow
+from core.monitoring import record_stock_movement
+from dashboards.rollups import register_outflow, unregister_outflow
+from outflows.models import InsufficientStockError, Outflow
+from products.models import Product
+
+
+@receiver(pre_save, sender=Outflow)
+def snapshot_product_prices(sender, instance, **kwargs):
+    """
+    Registra os preços do produto na saída antes de ela ser criada.
+
+    Os preços de venda e de custo do produto são copiados para a saída no
+    momento da criação, permitindo que as métricas de vendas sejam
+    calculadas apenas com as colunas de Outflow e que os valores históricos
+    não mudem quando o preço do produto for alterado.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Outflow): A instância do modelo Outflow que será salva.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    if instance._state.adding:
+        product = instance.product
+        if instance.unit_selling_price is None:
+            instance.unit_selling_price = product.selling_price
+        if instance.unit_cost_price is None:
+            instance.unit_cost_price = product.cost_price
 
 
 @receiver(post_save, sender=Outflow)
@@ -12,7 +41,14 @@ def update_product_quantity(sender, instance, created, **kwargs):
     Este signal é acionado após a criação de uma nova instância do modelo
     Outflow. Se a instância foi criada e sua quantidade é maior que zero,
     a quantidade do produto associado é decrementada pela quantidade
-    da nova saída e o produto é salvo.
+    da nova saída.
+
+    O decremento é um único `UPDATE ... SET quantity = quantity - n WHERE
+    quantity >= n`, que grava apenas a quantidade e a data de atualização:
+    saídas simultâneas do mesmo produto não perdem atualizações nem deixam
+    o estoque negativo. Se nenhuma linha for atualizada, o estoque não
+    comporta a saída e `InsufficientStockError` é levantado; como
+    `Outflow.save` roda em uma transação, a saída é desfeita.
 
     Args:
         sender (Model): O modelo que enviou o sinal.
@@ -24,5 +60,93 @@ def update_product_quantity(sender, instance, created, **kwargs):
     if created:
         if instance.quantity > 0:
             product = instance.product
-            product.quantity -= instance.quantity
-            product.save()
+            updated = Product.objects.filter(
+                pk=product.pk, quantity__gte=instance.quantity
+            ).update(
+                quantity=F('quantity') - instance.quantity,
+                updated_at=timezone.now(),
+            )
+            if not updated:
+                raise InsufficientStockError(product, instance.quantity)
+            product.refresh_from_db(fields=['quantity'])
+
+
+@receiver(pre_save, sender=Outflow)
+def load_previous_outflow(sender, instance, **kwargs):
+    """
+    Carrega a versão gravada de uma saída que será alterada.
+
+    A versão anterior é guardada na instância para que
+    `update_daily_sales_rollup` retire da consolidação os valores antigos
+    antes de acumular os novos.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Outflow): A instância do modelo Outflow que será salva.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    instance._previous_outflow = None
+    if not instance._state.adding:
+        instance._previous_outflow = (
+            Outflow.objects.select_related('product')
+            .filter(pk=instance.pk)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Outflow)
+def update_daily_sales_rollup(sender, instance, created, **kwargs):
+    """
+    Mantém a consolidação diária de vendas de acordo com a saída.
+
+    Este signal é acionado após a gravação de uma instância do modelo
+    Outflow e atualiza os registros de DailySalesRollup do dia da saída,
+    usados pelos gráficos de vendas do dashboard. Quando a saída é
+    alterada, os valores anteriores são retirados antes de os novos
+    serem acumulados; tudo roda na transação de `Outflow.save`.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Outflow): A instância do modelo Outflow que foi salva.
+        created (bool): Indica se a instância foi criada (True)
+        ou atualizada (False).
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    previous = getattr(instance, '_previous_outflow', None)
+    if not created and previous is not None:
+        unregister_outflow(previous)
+    register_outflow(instance)
+
+
+@receiver(post_delete, sender=Outflow)
+def remove_from_daily_sales_rollup(sender, instance, **kwargs):
+    """
+    Retira a saída excluída da consolidação diária de vendas.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Outflow): A instância do modelo Outflow que foi excluída.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    unregister_outflow(instance)
+
+
+@receiver(post_save, sender=Outflow)
+def count_stock_movement(sender, instance, created, **kwargs):
+    """
+    Contabiliza a nova saída nas métricas do Prometheus.
+
+    A contagem é feita apenas após o commit da transação, para que
+    saídas desfeitas não sejam contadas.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        instance (Outflow): A instância do modelo Outflow que foi criada.
+        created (bool): Indica se a instância foi criada (True)
+        ou atualizada (False).
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    if created:
+        transaction.on_commit(
+            lambda: record_stock_movement('outflow', instance.quantity)
+        )
@@ -0,0 +1,70 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.contrib.messages import get_messages
+from django.forms import ModelForm
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from outflows.forms import OutflowAdminForm
+from outflows.models import Outflow
+from products.models import Product
+
+
+class TestsOutflowAdmin(TestCase):
+    """Testes para o cadastro de saídas no painel de administração."""
+
+    def setUp(self):
+        """Autentica um superusuário e cria um produto com 5 unidades."""
+        self.client.force_login(User.objects.create_superuser(username='a'))
+        self.product = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=Brand.objects.create(name='Microsoft'),
+            category=Category.objects.create(name='Mouse'),
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=5,
+        )
+
+    def _add_outflow(self, quantity):
+        return self.client.post(
+            reverse('admin:outflows_outflow_add'),
+            {'product': self.product.pk, 'quantity': quantity},
+        )
+
+    def test_admin_cria_saida_dentro_do_estoque(self):
+        """
+        Testa se a saída é criada e o estoque decrementado quando há
+        estoque suficiente.
+        """
+        response = self._add_outflow(3)
+        self.assertEqual(response.status_code, 302)
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 2)
+
+    def test_admin_exibe_erro_de_estoque_no_formulario(self):
+        """
+        Testa se uma saída acima do estoque é recusada com um erro no
+        campo de quantidade, em vez de um erro 500.
+        """
+        response = self._add_outflow(6)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'não comporta a saída',
+            response.context['adminform'].form.errors['quantity'][0],
+        )
+        self.assertFalse(Outflow.objects.exists())
+
+    def test_admin_exibe_mensagem_quando_estoque_muda_na_gravacao(self):
+        """
+        Testa se o erro do decremento, quando o estoque muda depois da
+        validação, é exibido como mensagem e desfaz a saída.
+        """
+        with mock.patch.object(OutflowAdminForm, 'clean', ModelForm.clean):
+            response = self._add_outflow(6)
+        self.assertEqual(response.status_code, 302)
+        messages = list(get_messages(response.wsgi_request))
+        self.assertIn('não comporta a saída', str(messages[0]))
+        self.assertFalse(Outflow.objects.exists())
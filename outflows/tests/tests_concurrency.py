@@ -0,0 +1,92 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase
+
+from brand.models import Brand
+from categories.models import Category
+from outflows.models import InsufficientStockError, Outflow
+from products.models import Product
+
+STRESS_THREADS = 16
+STRESS_OUTFLOWS = 2000
+# O SQLite serializa as escritas e recusa, em vez de esperar, transações
+# concorrentes; uma carga menor basta para reproduzir perdas de atualização.
+SQLITE_STRESS_THREADS = 4
+SQLITE_STRESS_OUTFLOWS = 300
+MAX_ATTEMPTS = 1000
+
+
+class TestsConcurrentOutflows(TransactionTestCase):
+    """
+    Teste de carga com saídas simultâneas do mesmo produto.
+    """
+
+    def setUp(self):
+        """Cria um produto com estoque para todas as saídas."""
+        self.threads, self.outflows = STRESS_THREADS, STRESS_OUTFLOWS
+        if connection.vendor == 'sqlite':
+            self.threads = SQLITE_STRESS_THREADS
+            self.outflows = SQLITE_STRESS_OUTFLOWS
+        self.product = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=Brand.objects.create(name='Microsoft'),
+            category=Category.objects.create(name='Mouse'),
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=self.outflows * 2,
+        )
+
+    def _create_outflow(self, product_id):
+        try:
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    Outflow.objects.create(product_id=product_id, quantity=1)
+                    return True
+                except InsufficientStockError:
+                    return False
+                except OperationalError:
+                    # No SQLite a transação concorrente falha com a tabela
+                    # bloqueada; a saída é desfeita por inteiro e repetida.
+                    time.sleep(random.uniform(0, 0.001) * min(attempt + 1, 10))
+            raise AssertionError('Saída não registrada.')
+        finally:
+            connection.close()
+
+    def test_saidas_simultaneas_nao_perdem_atualizacoes(self):
+        """
+        Testa se saídas simultâneas do mesmo produto decrementam o
+        estoque exatamente pela soma das quantidades.
+        """
+        with ThreadPoolExecutor(self.threads) as executor:
+            list(
+                executor.map(
+                    self._create_outflow, [self.product.pk] * self.outflows
+                )
+            )
+
+        self.product.refresh_from_db()
+        self.assertEqual(Outflow.objects.count(), self.outflows)
+        self.assertEqual(self.product.quantity, self.outflows)
+
+    def test_saidas_simultaneas_nao_vendem_alem_do_estoque(self):
+        """
+        Testa se, com mais saídas simultâneas do que unidades em estoque,
+        apenas as que cabem no estoque são registradas e a quantidade
+        nunca fica negativa.
+        """
+        stock = self.outflows // 2
+        Product.objects.filter(pk=self.product.pk).update(quantity=stock)
+        with ThreadPoolExecutor(self.threads) as executor:
+            results = list(
+                executor.map(
+                    self._create_outflow, [self.product.pk] * self.outflows
+                )
+            )
+
+        self.product.refresh_from_db()
+        self.assertEqual(results.count(True), stock)
+        self.assertEqual(Outflow.objects.count(), stock)
+        self.assertEqual(self.product.quantity, 0)
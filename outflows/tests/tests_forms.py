@@ -1,4 +1,3 @@
-from django.db.models.signals import post_save
 from django.test import TestCase
 
 from brand.models import Brand
@@ -62,12 +61,8 @@ class TestsFormsOutflow(TestCase):
         form = OutflowForm(
             data={
                 'product': self.product.id,
-                'quantity': 12,
+                'quantity': self.product.quantity + 1,
             }
         )
         self.assertFalse(form.is_valid())
         self.assertIn('quantity', form.errors)
-
-    def tearDown(self):
-        """Limpa os signals após os testes"""
-        post_save.receivers = []
@@ -0,0 +1,171 @@
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.models import DailySalesRollup
+from dashboards.rollups import get_total_rollups, rebuild_sales_rollups
+from outflows.models import InsufficientStockError, Outflow, SalesOrder
+from outflows.orders import create_sales_order
+from products.models import Product
+
+
+class TestsCreateSalesOrder(TestCase):
+    """
+    Testes para o registro de pedidos de venda com várias linhas.
+    """
+
+    def setUp(self):
+        """
+        Cria dois produtos com estoque.
+        """
+        brand = Brand.objects.create(name='Microsoft')
+        category = Category.objects.create(name='Periféricos')
+        self.mouse = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=brand,
+            category=category,
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=10,
+        )
+        self.keyboard = Product.objects.create(
+            title='Teclado Mecânico',
+            brand=brand,
+            category=category,
+            cost_price=110.00,
+            selling_price=185.00,
+            quantity=5,
+        )
+
+    def _rollup_values(self):
+        return sorted(
+            DailySalesRollup.objects.values_list(
+                'product', 'category', 'brand', 'units', 'revenue', 'count'
+            ),
+            key=str,
+        )
+
+    def test_pedido_registra_uma_saida_por_linha(self):
+        """
+        Testa se cada linha vira uma saída do pedido, com os preços do
+        produto.
+        """
+        order, outflows = create_sales_order(
+            [
+                {'product': self.mouse.pk, 'quantity': 2},
+                {'product': self.keyboard.pk, 'quantity': 1},
+                {'product': self.mouse.pk, 'quantity': 3},
+            ],
+            'Venda no balcão',
+        )
+
+        self.assertEqual(SalesOrder.objects.get(), order)
+        self.assertEqual(order.description, 'Venda no balcão')
+        self.assertEqual(
+            [(outflow.product, outflow.quantity) for outflow in outflows],
+            [(self.mouse, 2), (self.keyboard, 1), (self.mouse, 3)],
+        )
+        self.assertEqual(order.outflows.count(), 3)
+        keyboard_outflow = Outflow.objects.get(product=self.keyboard)
+        self.assertEqual(keyboard_outflow.unit_selling_price, Decimal('185'))
+        self.assertEqual(keyboard_outflow.unit_cost_price, Decimal('110'))
+
+    def test_pedido_decrementa_estoque_uma_vez_por_produto(self):
+        """
+        Testa se o estoque de cada produto é decrementado pela soma das
+        suas linhas, com um único UPDATE por produto e um por registro
+        de consolidação, independentemente da quantidade de linhas.
+        """
+        Outflow.objects.create(product=self.mouse, quantity=1)
+        Outflow.objects.create(product=self.keyboard, quantity=1)
+        lines = [{'product': self.mouse.pk, 'quantity': 1}] * 8
+        lines.append({'product': self.keyboard.pk, 'quantity': 4})
+
+        with self.assertNumQueries(14):
+            create_sales_order(lines)
+
+        self.mouse.refresh_from_db()
+        self.keyboard.refresh_from_db()
+        self.assertEqual(self.mouse.quantity, 1)
+        self.assertEqual(self.keyboard.quantity, 0)
+
+    def test_pedido_atualiza_consolidacao_de_vendas(self):
+        """
+        Testa se a consolidação diária fica igual à recalculada a partir
+        das saídas.
+        """
+        Outflow.objects.create(product=self.mouse, quantity=1)
+        create_sales_order(
+            [
+                {'product': self.mouse.pk, 'quantity': 2},
+                {'product': self.keyboard.pk, 'quantity': 3},
+            ]
+        )
+        registrado = self._rollup_values()
+        rebuild_sales_rollups()
+
+        self.assertEqual(registrado, self._rollup_values())
+        total = get_total_rollups().get()
+        self.assertEqual(total.units, 6)
+        self.assertEqual(total.count, 3)
+
+    def test_pedido_sem_estoque_nao_registra_nenhuma_linha(self):
+        """
+        Testa se um produto sem estoque suficiente desfaz o pedido
+        inteiro, inclusive o estoque dos demais produtos.
+        """
+        with self.assertRaises(InsufficientStockError):
+            create_sales_order(
+                [
+                    {'product': self.mouse.pk, 'quantity': 2},
+                    {'product': self.keyboard.pk, 'quantity': 4},
+                    {'product': self.keyboard.pk, 'quantity': 2},
+                ]
+            )
+
+        self.mouse.refresh_from_db()
+        self.assertEqual(self.mouse.quantity, 10)
+        self.assertFalse(SalesOrder.objects.exists())
+        self.assertFalse(Outflow.objects.exists())
+        self.assertFalse(DailySalesRollup.objects.exists())
+
+    def test_pedido_com_produto_inexistente_retorna_erro(self):
+        """
+        Testa se um produto inexistente é informado no erro de validação.
+        """
+        with self.assertRaisesMessage(ValidationError, '999'):
+            create_sales_order([{'product': 999, 'quantity': 1}])
+        self.assertFalse(SalesOrder.objects.exists())
+
+    def test_pedido_com_linhas_invalidas_retorna_erro(self):
+        """
+        Testa se pedidos sem linhas ou com quantidades inválidas são
+        recusados.
+        """
+        invalidos = [
+            [],
+            None,
+            ['mouse'],
+            [{'product': self.mouse.pk, 'quantity': 0}],
+            [{'product': self.mouse.pk, 'quantity': '2'}],
+            [{'product': self.mouse.pk, 'quantity': True}],
+            [{'product': self.mouse.pk, 'quantity': 1, 'description': {}}],
+            [{'product': self.mouse.pk, 'quantity': 1, 'description': [1]}],
+        ]
+        for lines in invalidos:
+            with self.subTest(lines=lines):
+                with self.assertRaises(ValidationError):
+                    create_sales_order(lines)
+
+    def test_pedido_com_descricao_invalida_retorna_erro(self):
+        """
+        Testa se uma descrição do pedido que não é texto é recusada.
+        """
+        with self.assertRaisesMessage(ValidationError, 'deve ser um texto'):
+            create_sales_order(
+                [{'product': self.mouse.pk, 'quantity': 1}], {'a': 1}
+            )
+        self.assertFalse(SalesOrder.objects.exists())
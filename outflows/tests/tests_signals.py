@@ -1,9 +1,13 @@
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from brand.models import Brand
 from categories.models import Category
 from inflows.models import Inflow
-from outflows.models import Outflow
+from outflows.models import InsufficientStockError, Outflow
 from outflows.signals import update_product_quantity
 from products.models import Product
 from suppliers.models import Supplier
@@ -42,3 +46,55 @@ class TestsSignalsOutflow(TestCase):
 
         product.refresh_from_db()
         self.assertEqual(product.quantity, initial_quantity - 5)
+
+    def test_signal_decrementa_estoque_com_update_atomico(self):
+        """
+        Testa se o estoque é decrementado no próprio UPDATE, sem
+        regravar as demais colunas do produto.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            Outflow.objects.create(product=self.product, quantity=4)
+        updates = [
+            query['sql']
+            for query in queries.captured_queries
+            if query['sql'].startswith('UPDATE "products_product"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"quantity" - 4', updates[0])
+        self.assertNotIn('"title"', updates[0])
+        self.assertEqual(self.product.quantity, 16)
+
+    def test_signal_saida_maior_que_estoque_e_rejeitada(self):
+        """
+        Testa se uma saída maior que o estoque levanta
+        InsufficientStockError, sem registrar a saída nem alterar o
+        estoque.
+        """
+        with self.assertRaises(InsufficientStockError):
+            Outflow.objects.create(product=self.product, quantity=21)
+
+        self.product.refresh_from_db()
+        self.assertEqual(Outflow.objects.count(), 0)
+        self.assertEqual(self.product.quantity, 20)
+
+    def test_signal_saida_de_todo_o_estoque_zera_a_quantidade(self):
+        """
+        Testa se uma saída igual ao estoque é aceita e zera a quantidade.
+        """
+        Outflow.objects.create(product=self.product, quantity=20)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 0)
+
+    def test_signal_registra_precos_do_produto_na_saida(self):
+        """
+        Testa se os preços do produto são copiados para a saída
+        no momento da criação.
+        """
+        outflow = Outflow.objects.create(product=self.product, quantity=2)
+        self.product.selling_price = 150.00
+        self.product.save()
+
+        outflow.refresh_from_db()
+        self.assertEqual(outflow.unit_selling_price, Decimal('120.00'))
+        self.assertEqual(outflow.unit_cost_price, Decimal('80.00'))
@@ -54,3 +54,20 @@ class TestsUrlsOutflow(TestCase):
         esperado = views.OutflowDetailView
         resultado = resolve(reverse('outflow_detail', kwargs={'pk': 1}))
         self.assertIs(esperado, resultado.func.view_class)
+
+    def test_url_outflow_export_possui_a_url_correta(self):
+        """
+        Testa se a URL de exportação está correta.
+        """
+        esperado = '/outflows/export/'
+        resultado = reverse('outflow_export')
+        self.assertEqual(esperado, resultado)
+
+    def test_url_outflow_export_retorna_a_view_export_outflow(self):
+        """
+        Testa se a URL de exportação retorna a view correta
+        (OutflowExportView).
+        """
+        esperado = views.OutflowExportView
+        resultado = resolve(reverse('outflow_export'))
+        self.assertIs(esperado, resultado.func.view_class)
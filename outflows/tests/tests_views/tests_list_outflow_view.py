@@ -1,6 +1,8 @@
 from http import HTTPStatus
 
+from django.conf import settings
 from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
 from django.test import TestCase
 from django.urls import reverse
 
@@ -103,6 +105,17 @@ class TestsListOutflowView(TestCase):
         self.assertContains(response, 'Mouse')
         self.assertNotContains(response, 'Teclado')
 
+    def test_list_view_retorna_context_com_busca_aproximada(self):
+        """
+        Testa se a busca aproximada (`fuzzy`) encontra as saídas
+        do produto mesmo com erro de digitação no termo.
+        """
+        response = self.client.get(
+            reverse('outflow_list'), {'product': 'Teclao', 'fuzzy': '1'}
+        )
+        self.assertContains(response, 'Teclado')
+        self.assertNotContains(response, 'Mouse Sem Fio')
+
     def test_list_view_retorna_context_e_quantidade_de_itens(self):
         """
         Testa se o contexto da view contém a lista de saídas
@@ -141,3 +154,29 @@ class TestsListOutflowView(TestCase):
         response = self.client.get(reverse('outflow_list'))
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
+
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de saídas executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        with self.assertNumQueries(7):
+            self.client.get(reverse('outflow_list'))
+
+        for index in range(10):
+            Outflow.objects.create(
+                product=Product.objects.create(
+                    title=f'Produto {index}',
+                    brand=self.outflow_mouse.product.brand,
+                    category=self.outflow_mouse.product.category,
+                    cost_price=10.00,
+                    selling_price=15.00,
+                    quantity=5,
+                ),
+                quantity=1,
+            )
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        with self.assertNumQueries(7):
+            response = self.client.get(reverse('outflow_list'))
+        self.assertEqual(len(response.context['outflows']), 10)
@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from unittest.mock import patch
 
 from django.contrib.auth.models import Permission, User
 from django.test import TestCase
@@ -119,6 +120,28 @@ class TestsNewOutflowView(TestCase):
         self.assertFalse(response.context['form'].is_valid())
         self.assertEqual(Outflow.objects.count(), esperado_quantidade_saidas)
 
+    def test_new_view_estoque_consumido_apos_validacao_retorna_erro(self):
+        """
+        Testa se, quando o estoque é consumido entre a validação do
+        formulário e a gravação, o formulário volta com o erro na
+        quantidade e nenhuma saída é criada.
+        """
+        with patch(
+            'outflows.forms.OutflowForm.clean_quantity',
+            lambda form: form.cleaned_data['quantity'],
+        ):
+            response = self.client.post(
+                reverse('outflow_create'),
+                data={'product': self.product.id, 'quantity': 21},
+            )
+
+        self.product.refresh_from_db()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, 'outflow_create.html')
+        self.assertIn('quantity', response.context['form'].errors)
+        self.assertEqual(Outflow.objects.count(), 0)
+        self.assertEqual(self.product.quantity, 20)
+
     def test_create_view_sem_login_retorna_redirecionameto_a_url_login(self):
         """
         Testa se um usuário não autenticado é redirecionado para a página de
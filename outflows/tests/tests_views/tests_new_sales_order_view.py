@@ -0,0 +1,160 @@
+import json
+from http import HTTPStatus
+
+from django.conf import settings
+from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from dashboards.cache import get_cached_metric
+from dashboards.metrics import get_sales_metrics
+from outflows.models import Outflow, SalesOrder
+from products.models import Product
+
+
+class TestsSalesOrderCreateView(TestCase):
+    """
+    Testes para o endpoint de criação de pedidos de venda.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão para registrar saídas e um produto
+        com estoque.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='add_outflow')
+        )
+        self.client.login(username='testuser', password='12345')
+        self.product = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=Brand.objects.create(name='Microsoft'),
+            category=Category.objects.create(name='Mouse'),
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=10,
+        )
+        self.url = reverse('sales_order_create')
+
+    def _post(self, data):
+        return self.client.post(
+            self.url,
+            data=json.dumps(data) if not isinstance(data, str) else data,
+            content_type='application/json',
+        )
+
+    def test_pedido_valido_retorna_201_e_linhas(self):
+        """
+        Testa se um pedido válido é registrado e devolvido com as linhas.
+        """
+        response = self._post(
+            {
+                'description': 'Venda no balcão',
+                'lines': [
+                    {'product': self.product.pk, 'quantity': 2},
+                    {'product': self.product.pk, 'quantity': 3},
+                ],
+            }
+        )
+
+        order = SalesOrder.objects.get()
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(response.json()['id'], order.pk)
+        self.assertEqual(
+            [line['quantity'] for line in response.json()['lines']], [2, 3]
+        )
+        self.assertEqual(
+            response.json()['lines'][0]['unit_selling_price'], '120.00'
+        )
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.quantity, 5)
+
+    def test_pedido_invalida_metricas_em_cache(self):
+        """
+        Testa se um pedido invalida as métricas em cache e a ETag da API
+        de métricas, mesmo sem disparar os signals de Outflow.
+        """
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='view_outflow')
+        )
+        url = reverse('metric_api', kwargs={'metric': 'sales_metrics'})
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(
+            get_cached_metric(get_sales_metrics)['total_sales'], 0
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._post(
+                {'lines': [{'product': self.product.pk, 'quantity': 2}]}
+            )
+
+        response = self.client.get(url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['total_sales'], 1)
+        self.assertEqual(
+            get_cached_metric(get_sales_metrics)['total_sales'], 1
+        )
+
+    def test_pedido_invalido_retorna_400(self):
+        """
+        Testa se um JSON inválido, sem linhas ou com descrições que não
+        são texto retorna 400 com os erros.
+        """
+        line = {'product': self.product.pk, 'quantity': 1}
+        for data in (
+            '{',
+            [],
+            {'lines': []},
+            {'lines': [dict(line, description={'a': 1})]},
+            {'lines': [line], 'description': ['a']},
+        ):
+            with self.subTest(data=data):
+                response = self._post(data)
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+                self.assertTrue(response.json()['errors'])
+        self.assertFalse(Outflow.objects.exists())
+
+    def test_pedido_sem_estoque_retorna_409(self):
+        """
+        Testa se um pedido acima do estoque retorna 409 sem registrar
+        saídas.
+        """
+        response = self._post(
+            {'lines': [{'product': self.product.pk, 'quantity': 11}]}
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.CONFLICT)
+        self.assertIn('Mouse Sem Fio', response.json()['errors'][0])
+        self.assertFalse(Outflow.objects.exists())
+
+    def test_pedido_sem_login_retorna_redirecionamento(self):
+        """
+        Testa se um usuário não autenticado é redirecionado para o login.
+        """
+        self.client.logout()
+        response = self._post({'lines': []})
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+        self.assertIn(reverse('login'), response.url)
+
+    def test_pedido_sem_permissao_retorna_bloqueado(self):
+        """
+        Testa se um usuário sem permissão para registrar saídas recebe 403.
+        """
+        self.user.user_permissions.clear()
+        response = self._post({'lines': []})
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_get_nao_e_permitido(self):
+        """
+        Testa se o endpoint aceita apenas POST.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
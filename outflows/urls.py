@@ -8,6 +8,11 @@ urlpatterns = [
         views.OutflowListView.as_view(),
         name='outflow_list',
     ),
+    path(
+        'outflows/export/',
+        views.OutflowExportView.as_view(),
+        name='outflow_export',
+    ),
     path(
         'outflows/create/',
         views.OutflowCreateView.as_view(),
@@ -18,4 +23,9 @@ urlpatterns = [
         views.OutflowDetailView.as_view(),
         name='outflow_detail',
     ),
+    path(
+        'outflows/orders/create/',
+        views.SalesOrderCreateView.as_view(),
+        name='sales_order_create',
+    ),
 ]
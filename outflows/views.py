@@ -1,17 +1,29 @@
+import json
+from http import HTTPStatus
+
 from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
+from django.core.exceptions import ValidationError
+from django.http import JsonResponse
 from django.urls import reverse_lazy
+from django.views import View
 from django.views.generic import (
     CreateView,
     DetailView,
     ListView,
 )
 
+from core.exports import StreamingExportMixin
+from core.pagination import EstimatedCountPaginator
+from dashboards.cache import get_cached_metric
 from dashboards.metrics import get_sales_metrics
 from outflows.forms import OutflowForm
-from outflows.models import Outflow
+from outflows.models import InsufficientStockError, Outflow
+from outflows.orders import create_sales_order
+from products.models import Product
+from products.search import get_similar_products
 
 
 class OutflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
@@ -26,6 +38,7 @@ class OutflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         template_name: O template a ser renderizado para a lista de saídas.
         context_object_name: O nome do contexto a ser utilizado no template.
         paginate_by: Número de saídas a serem exibidas por página.
+        paginator_class: Paginador que estima o total em listagens grandes.
         permission_required: Permissão necessária para acessar a view.
     """
 
@@ -33,6 +46,7 @@ class OutflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     template_name = 'outflow_list.html'
     context_object_name = 'outflows'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
     permission_required = 'outflows.view_outflow'
 
     def get_queryset(self):
@@ -40,13 +54,25 @@ class OutflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         Obtém a lista de saídas, aplicando filtro pelo nome do produto,
         se fornecido.
 
+        Com o parâmetro `fuzzy`, o nome é buscado de forma aproximada no
+        título e no número de série dos produtos. O produto vem na mesma
+        consulta, apenas com as colunas exibidas na listagem.
+
         Returns:
             QuerySet: Lista de saídas filtradas pelo nome do produto
             (se fornecido).
         """
-        queryset = super().get_queryset()
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related('product')
+            .only('quantity', 'created_at', 'product__title')
+        )
         product = self.request.GET.get('product')
-        if product:
+        if product and self.request.GET.get('fuzzy'):
+            similar = get_similar_products(Product.objects.all(), product)
+            queryset = queryset.filter(product__in=[pk for pk, _ in similar])
+        elif product:
             queryset = queryset.filter(product__title__istartswith=product)
         return queryset
 
@@ -64,10 +90,35 @@ class OutflowListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
             dict: O contexto atualizado, incluindo as métricas de vendas.
         """
         context = super().get_context_data(**kwargs)
-        context['sales_metrics'] = get_sales_metrics()
+        context['sales_metrics'] = get_cached_metric(get_sales_metrics)
         return context
 
 
+class OutflowExportView(StreamingExportMixin, OutflowListView):
+    """
+    View para exportar saídas em CSV ou JSON Lines.
+
+    Exporta todas as saídas da listagem, com os mesmos filtros da URL.
+
+    Attributes:
+        export_fields: Colunas exportadas e os campos de origem.
+        export_filename: Nome do arquivo baixado, sem extensão.
+    """
+
+    export_fields = (
+        ('id', 'id'),
+        ('created_at', 'created_at'),
+        ('order_id', 'order_id'),
+        ('product_id', 'product_id'),
+        ('product', 'product__title'),
+        ('quantity', 'quantity'),
+        ('unit_selling_price', 'unit_selling_price'),
+        ('unit_cost_price', 'unit_cost_price'),
+        ('description', 'description'),
+    )
+    export_filename = 'saidas'
+
+
 class OutflowCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, CreateView
 ):
@@ -91,6 +142,24 @@ class OutflowCreateView(
     success_url = reverse_lazy('outflow_list')
     permission_required = 'outflows.add_outflow'
 
+    def form_valid(self, form):
+        """
+        Salva a saída ou, se o estoque tiver sido consumido por outra saída
+        depois da validação do formulário, devolve o formulário com o erro.
+
+        Args:
+            form (OutflowForm): Formulário validado.
+
+        Returns:
+            HttpResponse: Redirecionamento para a lista de saídas ou o
+            formulário com o erro de estoque.
+        """
+        try:
+            return super().form_valid(form)
+        except InsufficientStockError as error:
+            form.add_error('quantity', str(error))
+            return self.form_invalid(form)
+
 
 class OutflowDetailView(
     LoginRequiredMixin, PermissionRequiredMixin, DetailView
@@ -110,3 +179,56 @@ class OutflowDetailView(
     model = Outflow
     template_name = 'outflow_detail.html'
     permission_required = 'outflows.view_outflow'
+
+
+class SalesOrderCreateView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Endpoint em JSON para registrar um pedido de venda com várias linhas.
+
+    Recebe um POST com `{"description": ..., "lines": [{"product": id,
+    "quantity": n}, ...]}` e registra o pedido e todas as saídas de uma
+    vez, com `create_sales_order`. Responde com o pedido criado (201),
+    com os erros de validação (400) ou com o erro de estoque (409); nos
+    dois últimos casos nenhuma saída é registrada.
+
+    Attributes:
+        permission_required: Permissão necessária para acessar a view.
+    """
+
+    permission_required = 'outflows.add_outflow'
+
+    def post(self, request, *args, **kwargs):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse(
+                {'errors': ['JSON inválido.']}, status=HTTPStatus.BAD_REQUEST
+            )
+        if not isinstance(data, dict):
+            data = {}
+
+        try:
+            order, outflows = create_sales_order(
+                data.get('lines'), data.get('description')
+            )
+        except ValidationError as error:
+            return JsonResponse(
+                {'errors': error.messages}, status=HTTPStatus.BAD_REQUEST
+            )
+        except InsufficientStockError as error:
+            return JsonResponse(
+                {'errors': [str(error)]}, status=HTTPStatus.CONFLICT
+            )
+
+        lines = [
+            {
+                'id': outflow.pk,
+                'product': outflow.product_id,
+                'quantity': outflow.quantity,
+                'unit_selling_price': str(outflow.unit_selling_price),
+            }
+            for outflow in outflows
+        ]
+        return JsonResponse(
+            {'id': order.pk, 'lines': lines}, status=HTTPStatus.CREATED
+        )
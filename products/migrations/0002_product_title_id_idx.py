@@ -0,0 +1,20 @@
+# Generated by Django 5.0.4 on 2026-10-18 03:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('brand', '0001_initial'),
+        ('categories', '0001_initial'),
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(
+                fields=['title', 'id'], name='product_title_id_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,112 @@
+# Generated by Django 5.0.4 on 2026-10-18 03:10
+
+from django.db import migrations
+
+POSTGRESQL_FORWARD = [
+    """
+    ALTER TABLE products_product ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(serie_number, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX product_search_vector_idx
+    ON products_product USING GIN (search_vector)
+    """,
+]
+
+POSTGRESQL_REVERSE = [
+    'DROP INDEX IF EXISTS product_search_vector_idx',
+    'ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector',
+]
+
+# No SQLite, operações que recriam `products_product` (AlterField,
+# RemoveField...) removem estes gatilhos; eles são recriados após cada
+# `migrate` por `products.search.ensure_fts_triggers`.
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE products_product_fts USING fts5(
+        title,
+        serie_number,
+        description,
+        content='products_product',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER products_product_fts_insert
+    AFTER INSERT ON products_product BEGIN
+        INSERT INTO products_product_fts
+            (rowid, title, serie_number, description)
+        VALUES (new.id, new.title, new.serie_number, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER products_product_fts_delete
+    AFTER DELETE ON products_product BEGIN
+        INSERT INTO products_product_fts
+            (products_product_fts, rowid, title, serie_number, description)
+        VALUES (
+            'delete', old.id, old.title, old.serie_number, old.description
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER products_product_fts_update
+    AFTER UPDATE OF title, serie_number, description ON products_product
+    BEGIN
+        INSERT INTO products_product_fts
+            (products_product_fts, rowid, title, serie_number, description)
+        VALUES (
+            'delete', old.id, old.title, old.serie_number, old.description
+        );
+        INSERT INTO products_product_fts
+            (rowid, title, serie_number, description)
+        VALUES (new.id, new.title, new.serie_number, new.description);
+    END
+    """,
+    """
+    INSERT INTO products_product_fts(products_product_fts) VALUES ('rebuild')
+    """,
+]
+
+SQLITE_REVERSE = [
+    'DROP TRIGGER IF EXISTS products_product_fts_insert',
+    'DROP TRIGGER IF EXISTS products_product_fts_delete',
+    'DROP TRIGGER IF EXISTS products_product_fts_update',
+    'DROP TABLE IF EXISTS products_product_fts',
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRESQL_FORWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_FORWARD)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRESQL_REVERSE)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_REVERSE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('products', '0002_product_title_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.4 on 2026-10-18 04:02
+
+from django.db import migrations
+
+FORWARD = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    """
+    CREATE INDEX product_title_trgm_idx
+    ON products_product USING GIN (title gin_trgm_ops)
+    """,
+    """
+    CREATE INDEX product_serie_number_trgm_idx
+    ON products_product USING GIN (serie_number gin_trgm_ops)
+    """,
+]
+
+REVERSE = [
+    'DROP INDEX IF EXISTS product_title_trgm_idx',
+    'DROP INDEX IF EXISTS product_serie_number_trgm_idx',
+]
+
+
+def _run(schema_editor, statements):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    _run(schema_editor, FORWARD)
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    _run(schema_editor, REVERSE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('products', '0003_product_full_text_search'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:10
+
+from django.db import migrations
+
+SEARCH_VECTOR_INDEX = """
+    CREATE INDEX product_search_vector_idx
+    ON products_product USING GIN (search_vector)
+"""
+
+FORWARD = [
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    # `unaccent` não é IMMUTABLE e não pode ser usado em colunas geradas;
+    # com o dicionário explícito, o resultado depende apenas do texto.
+    """
+    CREATE OR REPLACE FUNCTION products_unaccent(text) RETURNS text
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    """,
+    'DROP INDEX IF EXISTS product_search_vector_idx',
+    'ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector',
+    """
+    ALTER TABLE products_product ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector(
+            'portuguese', products_unaccent(coalesce(title, ''))
+        ), 'A') ||
+        setweight(to_tsvector(
+            'simple', products_unaccent(coalesce(serie_number, ''))
+        ), 'A') ||
+        setweight(to_tsvector(
+            'portuguese', products_unaccent(coalesce(description, ''))
+        ), 'B')
+    ) STORED
+    """,
+    SEARCH_VECTOR_INDEX,
+]
+
+REVERSE = [
+    'DROP INDEX IF EXISTS product_search_vector_idx',
+    'ALTER TABLE products_product DROP COLUMN IF EXISTS search_vector',
+    """
+    ALTER TABLE products_product ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(serie_number, '')), 'A') ||
+        setweight(to_tsvector('portuguese', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    SEARCH_VECTOR_INDEX,
+    'DROP FUNCTION IF EXISTS products_unaccent(text)',
+]
+
+
+def _run(schema_editor, statements):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def add_unaccent_to_search_vector(apps, schema_editor):
+    _run(schema_editor, FORWARD)
+
+
+def remove_unaccent_from_search_vector(apps, schema_editor):
+    _run(schema_editor, REVERSE)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('products', '0004_product_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            add_unaccent_to_search_vector, remove_unaccent_from_search_vector
+        ),
+    ]
@@ -46,6 +46,11 @@ class Product(models.Model):
 
         Attributes:
             ordering (list): Define a ordenação padrão pelo campo 'title'.
+            indexes (list): Índice por título e id, usado na ordenação e na
+            paginação por cursor da listagem de produtos.
         """
 
         ordering = ['title']
+        indexes = [
+            models.Index(fields=['title', 'id'], name='product_title_id_idx'),
+        ]
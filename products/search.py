@@ -0,0 +1,317 @@
+import re
+
+from django.db import connections
+from django.db.models import (
+    Case,
+    F,
+    FloatField,
+    Func,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Greatest
+
+from products.trigram import SIMILARITY_THRESHOLD, get_product_index
+
+SEARCH_CONFIG = 'portuguese'
+FTS_TABLE = 'products_product_fts'
+FTS_WEIGHTS = (10.0, 10.0, 1.0)
+UNACCENT_FUNCTION = 'products_unaccent'
+FUZZY_SEARCH_LIMIT = 20
+
+_WORD_RE = re.compile(r'\w+')
+
+# Mesmos gatilhos criados pela migração 0003 no SQLite. Alterações no
+# esquema de `products_product` que recriam a tabela os removem, e são
+# recriados por `ensure_fts_triggers` após cada `migrate`.
+FTS_TRIGGERS = {
+    'products_product_fts_insert': """
+        CREATE TRIGGER products_product_fts_insert
+        AFTER INSERT ON products_product BEGIN
+            INSERT INTO products_product_fts
+                (rowid, title, serie_number, description)
+            VALUES (new.id, new.title, new.serie_number, new.description);
+        END
+    """,
+    'products_product_fts_delete': """
+        CREATE TRIGGER products_product_fts_delete
+        AFTER DELETE ON products_product BEGIN
+            INSERT INTO products_product_fts
+                (products_product_fts, rowid, title, serie_number,
+                description)
+            VALUES (
+                'delete', old.id, old.title, old.serie_number,
+                old.description
+            );
+        END
+    """,
+    'products_product_fts_update': """
+        CREATE TRIGGER products_product_fts_update
+        AFTER UPDATE OF title, serie_number, description
+        ON products_product BEGIN
+            INSERT INTO products_product_fts
+                (products_product_fts, rowid, title, serie_number,
+                description)
+            VALUES (
+                'delete', old.id, old.title, old.serie_number,
+                old.description
+            );
+            INSERT INTO products_product_fts
+                (rowid, title, serie_number, description)
+            VALUES (new.id, new.title, new.serie_number, new.description);
+        END
+    """,
+}
+
+
+def ensure_fts_triggers(using: str = 'default') -> list:
+    """
+    Recria os gatilhos que mantêm a tabela FTS5 dos produtos atualizada
+    no SQLite, caso tenham sido removidos.
+
+    O SQLite recria a tabela em operações como `AlterField` e
+    `RemoveField`, e os gatilhos criados com SQL pela migração 0003 somem
+    junto com a tabela antiga. Quando algum gatilho é recriado, o índice
+    é reconstruído, já que deixou de acompanhar as alterações. Em outros
+    bancos, ou antes da migração 0003, não faz nada.
+
+    Args:
+        using (str): Alias do banco de dados.
+
+    Returns:
+        list: Nomes dos gatilhos recriados.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT type, name FROM sqlite_master WHERE name = %s '
+            "OR (type = 'trigger' AND tbl_name = 'products_product')",
+            [FTS_TABLE],
+        )
+        existing = {name for _, name in cursor.fetchall()}
+        if FTS_TABLE not in existing:
+            return []
+        missing = [name for name in FTS_TRIGGERS if name not in existing]
+        for name in missing:
+            cursor.execute(FTS_TRIGGERS[name])
+        if missing:
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+    return missing
+
+
+def _build_fts_match(term: str) -> str:
+    """
+    Monta a expressão MATCH do FTS5 a partir do termo digitado.
+
+    Cada palavra vira um prefixo entre aspas, o que evita que operadores
+    do FTS5 sejam interpretados e permite buscar por parte da palavra.
+
+    Args:
+        term (str): Termo digitado pelo usuário.
+
+    Returns:
+        str: Expressão MATCH, vazia quando o termo não tem palavras.
+    """
+    return ' '.join(f'"{word}"*' for word in _WORD_RE.findall(term))
+
+
+def _build_tsquery(term: str) -> str:
+    """
+    Monta a expressão do `to_tsquery` a partir do termo digitado.
+
+    Assim como no FTS5, cada palavra vira um prefixo (`palavra:*`) e todas
+    precisam estar presentes; como apenas caracteres de palavra são
+    mantidos, operadores do tsquery nunca são interpretados.
+
+    Args:
+        term (str): Termo digitado pelo usuário.
+
+    Returns:
+        str: Expressão do tsquery, vazia quando o termo não tem palavras.
+    """
+    return ' & '.join(f'{word}:*' for word in _WORD_RE.findall(term))
+
+
+def _search_postgresql(queryset: QuerySet, term: str) -> QuerySet:
+    from django.contrib.postgres.search import (
+        SearchQuery,
+        SearchRank,
+        SearchVectorField,
+    )
+
+    tsquery = _build_tsquery(term)
+    if not tsquery:
+        return queryset.none()
+    vector = RawSQL(
+        'products_product.search_vector',
+        (),
+        output_field=SearchVectorField(),
+    )
+    query = SearchQuery(
+        Func(
+            Value(tsquery),
+            function=UNACCENT_FUNCTION,
+            output_field=TextField(),
+        ),
+        config=SEARCH_CONFIG,
+        search_type='raw',
+    )
+    return (
+        queryset.alias(search_vector=vector)
+        .annotate(rank=SearchRank(vector, query))
+        .filter(search_vector=query)
+        .order_by('-rank', 'title', 'id')
+    )
+
+
+def _search_sqlite(queryset: QuerySet, term: str) -> QuerySet:
+    match = _build_fts_match(term)
+    if not match:
+        return queryset.none()
+    weights = ', '.join(str(weight) for weight in FTS_WEIGHTS)
+    rank = RawSQL(
+        f'SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid = products_product.id',
+        (match,),
+        output_field=FloatField(),
+    )
+    matches = RawSQL(
+        f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+        (match,),
+    )
+    return (
+        queryset.filter(id__in=matches)
+        .annotate(rank=rank)
+        .order_by('-rank', 'title', 'id')
+    )
+
+
+def search_products(queryset: QuerySet, term: str) -> QuerySet:
+    """
+    Aplica a busca textual de produtos sobre título, número de série e
+    descrição, ordenando os resultados pela relevância (`rank`).
+
+    Nos dois bancos suportados a busca ignora acentos e trata cada palavra
+    como prefixo, exigindo todas elas. No PostgreSQL usa a coluna
+    `search_vector` (tsvector sem acentos, com stemming em português e
+    índice GIN); no SQLite usa a tabela FTS5 `products_product_fts`,
+    mantida por triggers. Em outros bancos, cai para um `icontains` sem
+    ranking.
+
+    Args:
+        queryset (QuerySet): Produtos sobre os quais a busca é aplicada.
+        term (str): Termo digitado pelo usuário.
+
+    Returns:
+        QuerySet: Produtos encontrados, dos mais aos menos relevantes.
+    """
+    term = term.strip()
+    if not term:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == 'postgresql':
+        return _search_postgresql(queryset, term)
+    if vendor == 'sqlite':
+        return _search_sqlite(queryset, term)
+    return queryset.filter(
+        Q(title__icontains=term)
+        | Q(serie_number__icontains=term)
+        | Q(description__icontains=term)
+    )
+
+
+def _get_similar_postgresql(queryset: QuerySet, term: str, limit: int):
+    from django.contrib.postgres.lookups import TrigramWordSimilar
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    return list(
+        queryset.filter(
+            Q(TrigramWordSimilar(F('title'), term))
+            | Q(TrigramWordSimilar(F('serie_number'), term))
+        )
+        .annotate(
+            similarity=Greatest(
+                TrigramWordSimilarity(term, 'title'),
+                TrigramWordSimilarity(term, 'serie_number'),
+            )
+        )
+        .order_by('-similarity', 'id')
+        .values_list('id', 'similarity')[:limit]
+    )
+
+
+def _get_similar_in_memory(queryset: QuerySet, term: str, limit: int):
+    similar = dict(get_product_index().search(term, SIMILARITY_THRESHOLD))
+    visible = queryset.filter(id__in=similar).values_list('id', flat=True)
+    matches = sorted(
+        ((pk, similar[pk]) for pk in visible),
+        key=lambda item: (-item[1], item[0]),
+    )
+    return matches[:limit]
+
+
+def get_similar_products(
+    queryset: QuerySet, term: str, limit: int = FUZZY_SEARCH_LIMIT
+) -> list:
+    """
+    Busca os produtos com título ou número de série parecidos com o
+    termo, tolerando erros de digitação.
+
+    A similaridade é a `word_similarity` do `pg_trgm`, que compara o termo
+    com o trecho mais parecido do texto. No PostgreSQL a busca usa o
+    operador `<%`, atendido pelos índices GIN de trigramas; nos demais
+    bancos usa o índice de trigramas em memória de `products.trigram`.
+
+    Args:
+        queryset (QuerySet): Produtos considerados na busca.
+        term (str): Termo digitado pelo usuário.
+        limit (int): Quantidade máxima de produtos retornados.
+
+    Returns:
+        list: Pares (id, similaridade), dos mais aos menos parecidos.
+    """
+    term = term.strip()
+    if not term:
+        return []
+    if connections[queryset.db].vendor == 'postgresql':
+        return _get_similar_postgresql(queryset, term, limit)
+    return _get_similar_in_memory(queryset, term, limit)
+
+
+def fuzzy_search_products(
+    queryset: QuerySet, term: str, limit: int = FUZZY_SEARCH_LIMIT
+) -> QuerySet:
+    """
+    Restringe o queryset aos produtos mais parecidos com o termo,
+    ordenados pela similaridade (`similarity`).
+
+    Args:
+        queryset (QuerySet): Produtos sobre os quais a busca é aplicada.
+        term (str): Termo digitado pelo usuário.
+        limit (int): Quantidade máxima de produtos retornados.
+
+    Returns:
+        QuerySet: Produtos encontrados, dos mais aos menos parecidos.
+    """
+    if not term.strip():
+        return queryset
+    matches = get_similar_products(queryset, term, limit)
+    if not matches:
+        return queryset.none()
+    similarity = Case(
+        *(When(id=pk, then=Value(score)) for pk, score in matches),
+        output_field=FloatField(),
+    )
+    return (
+        queryset.filter(id__in=[pk for pk, _ in matches])
+        .annotate(similarity=similarity)
+        .order_by('-similarity', 'id')
+    )
@@ -0,0 +1,53 @@
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from products.models import Product
+from products.search import ensure_fts_triggers
+from products.trigram import INDEXED_FIELDS, bump_index_version
+
+
+@receiver(post_save, sender=Product)
+def invalidate_trigram_index(sender, update_fields=None, **kwargs):
+    """
+    Invalida o índice de trigramas dos produtos quando o título ou o
+    número de série pode ter mudado.
+
+    Gravações com `update_fields` que não incluem esses campos, como as
+    atualizações de estoque, são ignoradas.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        update_fields (frozenset | None): Campos gravados, quando
+        informados em `save`.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    if update_fields is None or INDEXED_FIELDS & update_fields:
+        bump_index_version()
+
+
+@receiver(post_delete, sender=Product)
+def invalidate_trigram_index_on_delete(sender, **kwargs):
+    """
+    Invalida o índice de trigramas dos produtos quando um produto é
+    excluído.
+
+    Args:
+        sender (Model): O modelo que enviou o sinal.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    bump_index_version()
+
+
+@receiver(post_migrate)
+def restore_fts_triggers(sender, using, **kwargs):
+    """
+    Recria, após o `migrate`, os gatilhos da busca textual do SQLite
+    removidos por migrações que recriaram a tabela de produtos.
+
+    Args:
+        sender (AppConfig): Configuração do app migrado.
+        using (str): Alias do banco de dados migrado.
+        **kwargs: Argumentos adicionais passados para o signal.
+    """
+    if sender.name == 'products':
+        ensure_fts_triggers(using)
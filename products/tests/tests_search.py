@@ -0,0 +1,175 @@
+from django.db import connection
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from products.models import Product
+from products.search import (
+    _build_fts_match,
+    _build_tsquery,
+    ensure_fts_triggers,
+    fuzzy_search_products,
+    get_similar_products,
+    search_products,
+)
+
+
+class TestsSearchProducts(TestCase):
+    """
+    Testes para a busca textual de produtos.
+    """
+
+    def setUp(self):
+        """
+        Cria produtos com títulos, números de série e descrições distintos.
+        """
+        brand = Brand.objects.create(name='Microsoft')
+        category = Category.objects.create(name='Periféricos')
+        self.mouse = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=brand,
+            category=category,
+            description='Mouse óptico com receptor USB',
+            serie_number='MS83901321',
+            cost_price=80.00,
+            selling_price=120.00,
+        )
+        self.keyboard = Product.objects.create(
+            title='Teclado Mecânico',
+            brand=brand,
+            category=category,
+            description='Teclado com switches azuis e apoio para mouse',
+            serie_number='TC199101901',
+            cost_price=110.00,
+            selling_price=185.00,
+        )
+
+    def _search(self, term):
+        return list(search_products(Product.objects.all(), term))
+
+    def test_busca_por_palavra_do_titulo_retorna_produto(self):
+        """
+        Testa se a busca encontra o produto por uma palavra do título.
+        """
+        self.assertEqual(self._search('teclado'), [self.keyboard])
+
+    def test_busca_ignora_acentos(self):
+        """
+        Testa se a busca sem acento encontra títulos acentuados.
+        """
+        self.assertEqual(self._search('mecanico'), [self.keyboard])
+
+    def test_busca_por_prefixo_do_numero_de_serie(self):
+        """
+        Testa se a busca encontra o produto pelo início do número de série.
+        """
+        self.assertEqual(self._search('MS839'), [self.mouse])
+
+    def test_busca_pela_descricao(self):
+        """
+        Testa se a busca considera a descrição do produto.
+        """
+        self.assertEqual(self._search('receptor'), [self.mouse])
+
+    def test_busca_ordena_titulo_antes_da_descricao(self):
+        """
+        Testa se o produto com o termo no título vem antes do produto
+        que só o menciona na descrição.
+        """
+        resultado = search_products(Product.objects.all(), 'mouse')
+        self.assertEqual(list(resultado), [self.mouse, self.keyboard])
+        self.assertGreater(resultado[0].rank, resultado[1].rank)
+
+    def test_busca_acompanha_alteracoes_no_produto(self):
+        """
+        Testa se o índice de busca é atualizado ao alterar e excluir
+        produtos.
+        """
+        self.mouse.title = 'Trackball Sem Fio'
+        self.mouse.description = ''
+        self.mouse.save()
+        self.assertEqual(self._search('trackball'), [self.mouse])
+        self.assertEqual(self._search('mouse'), [self.keyboard])
+
+        self.keyboard.delete()
+        self.assertEqual(self._search('mouse'), [])
+
+    def test_ensure_fts_triggers_recria_gatilhos_removidos(self):
+        """
+        Testa se os gatilhos removidos por uma recriação da tabela são
+        recriados e se o índice volta a acompanhar os produtos.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER products_product_fts_update')
+        self.mouse.title = 'Headset Sem Fio'
+        self.mouse.save()
+
+        recriados = ensure_fts_triggers()
+
+        self.assertEqual(recriados, ['products_product_fts_update'])
+        self.assertEqual(self._search('headset'), [self.mouse])
+        self.mouse.title = 'Webcam Full HD'
+        self.mouse.save()
+        self.assertEqual(self._search('webcam'), [self.mouse])
+        self.assertEqual(ensure_fts_triggers(), [])
+
+    def test_busca_sem_palavras_nao_retorna_produtos(self):
+        """
+        Testa se um termo apenas com pontuação não retorna produtos.
+        """
+        self.assertEqual(self._search('"*'), [])
+
+    def test_busca_vazia_retorna_queryset_original(self):
+        """
+        Testa se um termo vazio não altera o queryset.
+        """
+        self.assertEqual(len(self._search('  ')), 2)
+
+    def test_build_fts_match_escapa_operadores(self):
+        """
+        Testa se operadores do FTS5 são tratados como texto.
+        """
+        esperado = '"mouse"* "OR"* "usb"*'
+        resultado = _build_fts_match('mouse OR usb"')
+        self.assertEqual(esperado, resultado)
+
+    def test_build_tsquery_monta_prefixos_e_escapa_operadores(self):
+        """
+        Testa se cada palavra vira um prefixo do tsquery e se operadores
+        são descartados.
+        """
+        esperado = 'mouse:* & sem:* & usb:*'
+        resultado = _build_tsquery("mouse & !sem | 'usb':*")
+        self.assertEqual(esperado, resultado)
+
+    def test_busca_aproximada_tolera_erro_de_digitacao(self):
+        """
+        Testa se a busca aproximada encontra o produto mesmo com erro
+        de digitação no termo.
+        """
+        resultado = fuzzy_search_products(Product.objects.all(), 'Teclao')
+        self.assertEqual(list(resultado), [self.keyboard])
+        self.assertGreater(resultado[0].similarity, 0.6)
+
+    def test_busca_aproximada_respeita_o_queryset(self):
+        """
+        Testa se a busca aproximada considera apenas os produtos do
+        queryset recebido.
+        """
+        queryset = Product.objects.exclude(pk=self.keyboard.pk)
+        self.assertEqual(list(fuzzy_search_products(queryset, 'Teclao')), [])
+
+    def test_busca_aproximada_limita_quantidade(self):
+        """
+        Testa se a busca aproximada retorna no máximo `limit` produtos,
+        dos mais aos menos parecidos.
+        """
+        Product.objects.create(
+            title='Mouse Gamer',
+            brand=self.mouse.brand,
+            category=self.mouse.category,
+            cost_price=150.00,
+            selling_price=250.00,
+        )
+        resultado = get_similar_products(Product.objects.all(), 'mouse', 1)
+        self.assertEqual(resultado, [(self.mouse.pk, 1.0)])
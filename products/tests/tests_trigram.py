@@ -0,0 +1,153 @@
+import hashlib
+import time
+from itertools import product
+
+from django.test import TestCase
+
+from brand.models import Brand
+from categories.models import Category
+from inflows.models import Inflow
+from outflows.models import Outflow
+from products.models import Product
+from products.trigram import (
+    TrigramIndex,
+    get_product_index,
+    get_trigrams,
+    word_similarity,
+)
+from suppliers.models import Supplier
+
+
+class TestsTrigram(TestCase):
+    """
+    Testes para o índice de trigramas em memória.
+    """
+
+    def test_get_trigrams_segue_regras_do_pg_trgm(self):
+        """
+        Testa se os trigramas seguem as regras do `pg_trgm`, com
+        palavras em minúsculas e espaços de preenchimento.
+        """
+        esperado = ['  w', ' wo', 'wor', 'ord', 'rd ']
+        resultado = get_trigrams('Word!')
+        self.assertEqual(esperado, resultado)
+
+    def test_word_similarity_igual_ao_pg_trgm(self):
+        """
+        Testa se a similaridade de palavra tem o mesmo valor do
+        `word_similarity('word', 'two words')` do `pg_trgm`.
+        """
+        query = frozenset(get_trigrams('word'))
+        resultado = word_similarity(query, get_trigrams('two words'))
+        self.assertAlmostEqual(resultado, 0.8)
+
+    def test_search_tolera_erro_de_digitacao(self):
+        """
+        Testa se a busca encontra um título com erro de digitação
+        no termo, ordenando pela similaridade.
+        """
+        index = TrigramIndex(
+            [
+                (1, 'Teclado Sem Fio', '2198011'),
+                (2, 'Mouse Sem Fio', '83901321'),
+            ]
+        )
+        resultado = index.search('Teclao')
+        self.assertEqual([pk for pk, _ in resultado], [1])
+
+    def test_search_considera_o_melhor_campo(self):
+        """
+        Testa se a busca considera o número de série além do título.
+        """
+        index = TrigramIndex([(1, 'Teclado Sem Fio', '2198011')])
+        resultado = index.search('219801')
+        self.assertEqual([pk for pk, _ in resultado], [1])
+
+    def test_get_product_index_acompanha_alteracoes(self):
+        """
+        Testa se o índice dos produtos é reconstruído quando a tabela
+        de produtos muda.
+        """
+        product = Product.objects.create(
+            title='Monitor Curvo',
+            brand=Brand.objects.create(name='Samsung'),
+            category=Category.objects.create(name='Monitores'),
+            cost_price=800.00,
+            selling_price=1200.00,
+        )
+        index = get_product_index()
+        self.assertEqual(index.search('monitr')[0][0], product.pk)
+
+        product.title = 'Televisor Curvo'
+        product.save()
+        self.assertEqual(get_product_index().search('monitr'), [])
+        self.assertIs(get_product_index(), get_product_index())
+
+    def test_get_product_index_ignora_movimentacoes_de_estoque(self):
+        """
+        Testa se entradas e saídas, que só alteram a quantidade e a data
+        de atualização do produto, não reconstroem o índice.
+        """
+        product = Product.objects.create(
+            title='Monitor Curvo',
+            brand=Brand.objects.create(name='Samsung'),
+            category=Category.objects.create(name='Monitores'),
+            cost_price=800.00,
+            selling_price=1200.00,
+        )
+        index = get_product_index()
+        Inflow.objects.create(
+            product=product,
+            supplier=Supplier.objects.create(name='Fornecedor'),
+            quantity=5,
+        )
+        Outflow.objects.create(product=product, quantity=2)
+        self.assertIs(get_product_index(), index)
+
+
+class BenchmarkTrigramIndex(TestCase):
+    """
+    Mede a busca no índice de trigramas em memória com um catálogo de
+    10.000 produtos, contra o alvo de 50 ms por busca. O alvo da busca
+    com `pg_trgm` no PostgreSQL não é medido aqui.
+    """
+
+    target_seconds = 0.05
+
+    def setUp(self):
+        words = (
+            'Mouse, Teclado, Monitor, Headset, Webcam, Notebook, '
+            'Impressora, Roteador, Cadeira, Caixa',
+            'Sem Fio, Gamer, Mecânico, Curvo, USB, Bluetooth, Ergonômico, '
+            'Portátil, Compacto, Pro',
+            'Logitech, Microsoft, Samsung, Dell, Razer, Philips, '
+            'Multilaser, Intelbras, Positivo, Acer',
+            'Preto, Branco, Azul, Vermelho, Cinza, Verde, Rosa, Prata, '
+            'Dourado, Roxo',
+        )
+        titles = (
+            ' '.join(title)
+            for title in product(*(group.split(', ') for group in words))
+        )
+        self.index = TrigramIndex(
+            (pk, title, self._serie_number(pk))
+            for pk, title in enumerate(titles, start=1)
+        )
+
+    def _serie_number(self, pk):
+        return hashlib.md5(str(pk).encode()).hexdigest()[:10].upper()
+
+    def _best_time(self, term):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            results = self.index.search(term)
+            timings.append(time.perf_counter() - start)
+        return min(timings), results
+
+    def test_busca_fica_abaixo_do_alvo(self):
+        for term in ('teclado mecanco', self._serie_number(421)[:9], 'webcm'):
+            with self.subTest(term=term):
+                elapsed, results = self._best_time(term)
+                self.assertTrue(results)
+                self.assertLess(elapsed, self.target_seconds)
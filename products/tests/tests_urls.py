@@ -86,3 +86,20 @@ class TestsUrlsProduct(TestCase):
         esperado = views.ProductDeleteView
         resultado = resolve(reverse('product_delete', kwargs={'pk': 1}))
         self.assertIs(esperado, resultado.func.view_class)
+
+    def test_url_product_export_possui_a_url_correta(self):
+        """
+        Testa se a URL de exportação está correta.
+        """
+        esperado = '/products/export/'
+        resultado = reverse('product_export')
+        self.assertEqual(esperado, resultado)
+
+    def test_url_product_export_retorna_a_view_export_product(self):
+        """
+        Testa se a URL de exportação retorna a view correta
+        (ProductExportView).
+        """
+        esperado = views.ProductExportView
+        resultado = resolve(reverse('product_export'))
+        self.assertIs(esperado, resultado.func.view_class)
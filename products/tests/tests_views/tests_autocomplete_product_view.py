@@ -0,0 +1,109 @@
+from http import HTTPStatus
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from products.models import Product
+from products.search import get_similar_products
+
+
+class TestsAutocompleteProductView(TestCase):
+    """Testes para o endpoint de autocomplete de produtos."""
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão de registrar saídas e alguns
+        produtos.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='add_outflow')
+        )
+        self.client.login(username='testuser', password='12345')
+        self.brand = Brand.objects.create(name='Microsoft')
+        self.category = Category.objects.create(name='Periféricos')
+        self.mouse = self._create_product('Mouse Sem Fio', '83901321')
+        self.keyboard = self._create_product('Teclado Mecânico', '199101901')
+
+    def _create_product(self, title, serie_number=None):
+        return Product.objects.create(
+            title=title,
+            brand=self.brand,
+            category=self.category,
+            serie_number=serie_number,
+            cost_price=80.00,
+            selling_price=120.00,
+        )
+
+    def _get_results(self, term):
+        response = self.client.get(
+            reverse('product_autocomplete'), {'q': term}
+        )
+        return response.json()['results']
+
+    def test_autocomplete_retorna_produtos_pelo_prefixo(self):
+        """
+        Testa se o endpoint retorna os produtos cujo título começa com
+        o termo.
+        """
+        esperado = [{'id': self.mouse.pk, 'text': 'Mouse Sem Fio'}]
+        self.assertEqual(self._get_results('mou'), esperado)
+
+    def test_autocomplete_busca_pelo_numero_de_serie(self):
+        """
+        Testa se o endpoint encontra produtos pelo número de série.
+        """
+        resultado = self._get_results('1991')
+        self.assertEqual(
+            [item['id'] for item in resultado], [self.keyboard.pk]
+        )
+
+    def test_autocomplete_completa_com_busca_aproximada(self):
+        """
+        Testa se termos com erro de digitação são completados pela
+        busca por trigramas.
+        """
+        resultado = self._get_results('teclao')
+        self.assertEqual(
+            [item['id'] for item in resultado], [self.keyboard.pk]
+        )
+
+    def test_autocomplete_mantem_a_ordem_da_busca_aproximada(self):
+        """
+        Testa se os produtos da busca por trigramas vêm dos mais aos
+        menos parecidos, com os seus títulos.
+        """
+        gamer = self._create_product('Teclado Gamer')
+        similares = get_similar_products(Product.objects.all(), 'teclao', 20)
+        resultado = self._get_results('teclao')
+        self.assertEqual(
+            {item['id']: item['text'] for item in resultado},
+            {self.keyboard.pk: 'Teclado Mecânico', gamer.pk: 'Teclado Gamer'},
+        )
+        self.assertEqual(
+            [item['id'] for item in resultado],
+            [pk for pk, _ in similares],
+        )
+
+    def test_autocomplete_limita_a_20_resultados(self):
+        """
+        Testa se o endpoint retorna no máximo 20 produtos.
+        """
+        for index in range(25):
+            self._create_product(f'Mouse {index:02d}')
+        self.assertEqual(len(self._get_results('mouse')), 20)
+
+    def test_autocomplete_sem_permissao_retorna_bloqueado(self):
+        """
+        Testa se um usuário sem nenhuma das permissões aceitas recebe
+        403 FORBIDDEN.
+        """
+        User.objects.create_user(username='test2', password='12345')
+        self.client.login(username='test2', password='12345')
+        response = self.client.get(reverse('product_autocomplete'))
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
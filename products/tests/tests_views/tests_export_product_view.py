@@ -0,0 +1,117 @@
+import json
+from http import HTTPStatus
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+
+from brand.models import Brand
+from categories.models import Category
+from products.models import Product
+
+
+class TestsProductExportView(TestCase):
+    """
+    Testes para a exportação de produtos.
+    """
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão para visualizar produtos e dois
+        produtos de marcas diferentes.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='view_product')
+        )
+        self.client.login(username='testuser', password='12345')
+        category = Category.objects.create(name='Periféricos')
+        self.microsoft = Brand.objects.create(name='Microsoft')
+        self.mouse = Product.objects.create(
+            title='Mouse Sem Fio',
+            brand=self.microsoft,
+            category=category,
+            serie_number='MS01',
+            cost_price=80.00,
+            selling_price=120.00,
+            quantity=3,
+        )
+        Product.objects.create(
+            title='Teclado Mecânico',
+            brand=Brand.objects.create(name='Logitech'),
+            category=category,
+            cost_price=110.00,
+            selling_price=185.00,
+        )
+
+    def _export(self, **params):
+        response = self.client.get(reverse('product_export'), params)
+        content = b''.join(response.streaming_content).decode()
+        return response, content
+
+    def test_export_csv_retorna_todos_os_produtos_em_streaming(self):
+        """
+        Testa se a exportação padrão é um CSV em streaming, com todos os
+        produtos, sem paginação.
+        """
+        # Sessão, usuário, permissões e uma única consulta de produtos.
+        with self.assertNumQueries(5):
+            response, content = self._export()
+
+        linhas = content.splitlines()
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertIn('produtos.csv', response['Content-Disposition'])
+        self.assertEqual(
+            linhas[0].split(',')[:3], ['id', 'title', 'serie_number']
+        )
+        self.assertEqual(len(linhas), 3)
+
+    async def test_export_sob_asgi_usa_gerador_assincrono(self):
+        """
+        Testa se, sob ASGI, a exportação é transmitida por um gerador
+        assíncrono, sem ser convertida em lista antes do envio.
+        """
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('product_export'))
+        self.assertTrue(response.is_async)
+        content = b''.join(
+            [chunk async for chunk in response.streaming_content]
+        ).decode()
+        linhas = content.splitlines()
+        self.assertEqual(linhas[0].split(',')[:2], ['id', 'title'])
+        self.assertEqual(len(linhas), 3)
+
+    def test_export_respeita_os_filtros_da_listagem(self):
+        """
+        Testa se a exportação usa os mesmos filtros da listagem.
+        """
+        for params in ({'brand': self.microsoft.pk}, {'q': 'mouse'}):
+            with self.subTest(params=params):
+                _, content = self._export(format='jsonl', **params)
+                linhas = [json.loads(linha) for linha in content.splitlines()]
+                self.assertEqual(len(linhas), 1)
+                self.assertEqual(linhas[0]['title'], 'Mouse Sem Fio')
+                self.assertEqual(linhas[0]['brand'], 'Microsoft')
+                self.assertEqual(linhas[0]['selling_price'], '120.00')
+
+    def test_export_formato_invalido_retorna_400(self):
+        """
+        Testa se um formato desconhecido é recusado.
+        """
+        response = self.client.get(
+            reverse('product_export'), {'format': 'xls'}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_export_sem_permissao_retorna_bloqueado(self):
+        """
+        Testa se um usuário sem permissão para visualizar produtos recebe
+        403.
+        """
+        self.user.user_permissions.clear()
+        response = self.client.get(reverse('product_export'))
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
@@ -1,11 +1,16 @@
 from http import HTTPStatus
 
+from django.conf import settings
 from django.contrib.auth.models import Permission, User
+from django.core.cache import caches
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from brand.models import Brand
 from categories.models import Category
+from core.pagination import encode_cursor
 from products.models import Product
 
 
@@ -97,6 +102,28 @@ class TestsListProductView(TestCase):
         )
         self.assertContains(response, 'Teclado')
 
+    def test_list_view_retorna_context_com_busca_textual(self):
+        """
+        Testa se a busca textual (`q`) retorna apenas os produtos
+        que correspondem ao termo pesquisado.
+        """
+        response = self.client.get(reverse('product_list'), {'q': 'mecanico'})
+        self.assertEqual(
+            list(response.context['products']), [self.product_keyboard]
+        )
+
+    def test_list_view_retorna_context_com_busca_aproximada(self):
+        """
+        Testa se a busca aproximada (`fuzzy`) tolera erros de digitação
+        no termo pesquisado.
+        """
+        response = self.client.get(
+            reverse('product_list'), {'q': 'teclao', 'fuzzy': '1'}
+        )
+        self.assertEqual(
+            list(response.context['products']), [self.product_keyboard]
+        )
+
     def test_list_view_retorna_context_com_filtro_no_category(self):
         """
         Testa se o filtro de busca funciona corretamente.
@@ -160,6 +187,115 @@ class TestsListProductView(TestCase):
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
 
+    def test_list_view_com_cursor_percorre_todos_os_produtos(self):
+        """
+        Testa se a paginação por cursor percorre todos os produtos,
+        na ordem de título e id, sem repetir registros.
+        """
+        for _ in range(15):
+            Product.objects.create(
+                title='Mouse Sem Fio',
+                brand=self.brand_microsoft,
+                category=self.category_mouse,
+                cost_price=80.00,
+                selling_price=120.00,
+            )
+        response = self.client.get(reverse('product_list'), {'cursor': ''})
+        products = list(response.context['products'])
+        while 'cursor_next_query' in response.context:
+            response = self.client.get(
+                f'{reverse("product_list")}?'
+                f'{response.context["cursor_next_query"]}'
+            )
+            products.extend(response.context['products'])
+
+        esperado = list(Product.objects.order_by('title', 'id'))
+        self.assertEqual(products, esperado)
+        self.assertTemplateUsed(response, 'components/_cursor_pagination.html')
+
+    def test_list_view_com_cursor_mantem_filtros(self):
+        """
+        Testa se os links da paginação por cursor preservam os filtros
+        aplicados na listagem.
+        """
+        for index in range(12):
+            Product.objects.create(
+                title=f'Mouse {index:02d}',
+                brand=self.brand_microsoft,
+                category=self.category_mouse,
+                cost_price=80.00,
+                selling_price=120.00,
+            )
+        response = self.client.get(
+            reverse('product_list'),
+            {'cursor': '', 'category': self.category_mouse.id},
+        )
+        query = response.context['cursor_next_query']
+        self.assertIn(f'category={self.category_mouse.id}', query)
+
+        response = self.client.get(f'{reverse("product_list")}?{query}')
+        for product in response.context['products']:
+            self.assertEqual(product.category, self.category_mouse)
+        self.assertIn('cursor_previous_query', response.context)
+
+    def test_list_view_com_cursor_nao_executa_count(self):
+        """
+        Testa se a paginação por cursor não executa COUNT na
+        tabela de produtos.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('product_list'), {'cursor': ''})
+        self.assertFalse(
+            any(
+                'COUNT' in query['sql']
+                and 'products_product' in query['sql']
+                and 'GROUP BY' not in query['sql']
+                for query in queries.captured_queries
+            )
+        )
+
+    def test_list_view_com_cursor_invalido_retorna_primeira_pagina(self):
+        """
+        Testa se cursores com valores de tipo errado, nulos ou em
+        quantidade diferente dos campos de ordenação levam à primeira
+        página, em vez de um erro.
+        """
+        cursores = {
+            'tipo errado': encode_cursor(['P05', 'abc'], 'next'),
+            'valores nulos': encode_cursor([None, None], 'previous'),
+            'quantidade errada': encode_cursor(['P05'], 'next'),
+        }
+        esperado = list(Product.objects.order_by('title', 'id'))
+        for caso, cursor in cursores.items():
+            with self.subTest(caso=caso):
+                response = self.client.get(
+                    reverse('product_list'), {'cursor': cursor}
+                )
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                self.assertEqual(list(response.context['products']), esperado)
+
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de produtos executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        with self.assertNumQueries(9):
+            self.client.get(reverse('product_list'))
+
+        for index in range(10):
+            Product.objects.create(
+                title=f'Produto {index}',
+                brand=Brand.objects.create(name=f'Marca {index}'),
+                category=Category.objects.create(name=f'Categoria {index}'),
+                cost_price=10.00,
+                selling_price=15.00,
+            )
+        caches[settings.METRICS_CACHE_ALIAS].clear()
+        with self.assertNumQueries(9):
+            response = self.client.get(reverse('product_list'))
+        self.assertEqual(len(response.context['products']), 10)
+
     def tearDown(self):
         """Limpa os dados criados no banco de dados após cada teste."""
         Product.objects.all().delete()
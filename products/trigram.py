@@ -0,0 +1,208 @@
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Count, Max
+
+from products.models import Product
+
+SIMILARITY_THRESHOLD = 0.6
+INDEXED_FIELDS = frozenset({'title', 'serie_number'})
+INDEX_VERSION_KEY = 'products:trigram_index_version'
+
+_WORD_RE = re.compile(r'[^\W_]+')
+
+
+def get_trigrams(text: str | None) -> list:
+    """
+    Extrai os trigramas de um texto, na ordem em que aparecem, com as
+    mesmas regras do `pg_trgm`.
+
+    Cada palavra é convertida para minúsculas e recebe dois espaços no
+    início e um no fim antes de ser dividida em trigramas.
+
+    Args:
+        text (str | None): Texto de origem.
+
+    Returns:
+        list: Trigramas do texto.
+    """
+    trigrams = []
+    for word in _WORD_RE.findall((text or '').lower()):
+        padded = f'  {word} '
+        trigrams.extend(
+            padded[index : index + 3] for index in range(len(padded) - 2)
+        )
+    return trigrams
+
+
+def word_similarity(query: frozenset, trigrams: list) -> float:
+    """
+    Calcula a similaridade de palavra do `pg_trgm` (`word_similarity`).
+
+    É a maior similaridade entre os trigramas do termo e um trecho
+    contínuo dos trigramas do texto, o que permite encontrar um termo
+    curto ou com erros de digitação dentro de um título longo. Basta
+    considerar trechos que começam e terminam em trigramas do termo.
+
+    Args:
+        query (frozenset): Trigramas do termo buscado.
+        trigrams (list): Trigramas do texto, na ordem em que aparecem.
+
+    Returns:
+        float: Similaridade entre 0 e 1.
+    """
+    positions = [
+        index for index, trigram in enumerate(trigrams) if trigram in query
+    ]
+    size, best = len(query), 0.0
+    for start_index, start in enumerate(positions):
+        # O trecho cresce a cada fim, então o conjunto e a contagem de
+        # trigramas em comum são atualizados em vez de recalculados.
+        extent, common, cursor = set(), 0, start
+        for end in positions[start_index:]:
+            for trigram in trigrams[cursor : end + 1]:
+                if trigram not in extent:
+                    extent.add(trigram)
+                    common += trigram in query
+            cursor = end + 1
+            similarity = common / (size + len(extent) - common)
+            best = max(best, similarity)
+    return best
+
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas em memória, usado como alternativa ao
+    `pg_trgm` em bancos sem suporte a ele, como o SQLite.
+
+    Os trigramas servem para selecionar os candidatos, que são então
+    pontuados com `word_similarity`. Cada documento pode ter vários
+    campos, e vale a maior similaridade entre eles.
+
+    Attributes:
+        postings (dict): Trigrama -> conjunto de (documento, campo).
+        trigrams (dict): (documento, campo) -> trigramas do campo.
+    """
+
+    def __init__(self, rows=()):
+        self.postings = defaultdict(set)
+        self.trigrams = {}
+        for pk, *fields in rows:
+            self.add(pk, fields)
+
+    def add(self, pk, fields) -> None:
+        """
+        Adiciona um documento ao índice.
+
+        Args:
+            pk: Identificador do documento.
+            fields (Iterable[str | None]): Textos indexados do documento.
+        """
+        for position, text in enumerate(fields):
+            trigrams = get_trigrams(text)
+            if not trigrams:
+                continue
+            self.trigrams[(pk, position)] = trigrams
+            for trigram in trigrams:
+                self.postings[trigram].add((pk, position))
+
+    def search(
+        self, term: str, threshold: float = SIMILARITY_THRESHOLD
+    ) -> list:
+        """
+        Busca os documentos semelhantes ao termo.
+
+        Args:
+            term (str): Termo buscado.
+            threshold (float): Similaridade mínima, entre 0 e 1.
+
+        Returns:
+            list: Pares (documento, similaridade), dos mais aos menos
+            semelhantes.
+        """
+        query = frozenset(get_trigrams(term))
+        shared = Counter()
+        for trigram in query:
+            shared.update(self.postings.get(trigram, ()))
+
+        # A similaridade não passa de (trigramas em comum) / len(query):
+        # campos com poucos trigramas em comum nem são pontuados.
+        minimum = threshold * len(query)
+        scores = {}
+        for (pk, position), common in shared.items():
+            if common < minimum:
+                continue
+            similarity = word_similarity(query, self.trigrams[(pk, position)])
+            if similarity >= threshold and similarity > scores.get(pk, 0):
+                scores[pk] = similarity
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+_lock = threading.Lock()
+_cache = {'state': None, 'index': None}
+
+
+def _get_cache():
+    return caches[settings.METRICS_CACHE_ALIAS]
+
+
+def get_index_version() -> int:
+    """
+    Retorna a versão dos títulos e números de série dos produtos.
+
+    A versão fica no mesmo cache das métricas do dashboard, compartilhado
+    entre os processos, e começa pelo relógio, como a versão das métricas.
+
+    Returns:
+        int: Versão atual.
+    """
+    cache = _get_cache()
+    version = cache.get(INDEX_VERSION_KEY)
+    if version is None:
+        cache.add(INDEX_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(INDEX_VERSION_KEY)
+    return version
+
+
+def bump_index_version() -> None:
+    """
+    Invalida o índice de trigramas dos produtos incrementando a versão.
+    """
+    cache = _get_cache()
+    try:
+        cache.incr(INDEX_VERSION_KEY)
+    except ValueError:
+        cache.add(INDEX_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _get_products_state() -> tuple:
+    state = Product.objects.aggregate(count=Count('id'), last_id=Max('id'))
+    return state['count'], state['last_id'], get_index_version()
+
+
+def get_product_index() -> TrigramIndex:
+    """
+    Retorna o índice de trigramas de título e número de série dos
+    produtos, reconstruído quando eles mudam.
+
+    Mudanças são detectadas pelo total e pelo maior id dos produtos, em
+    uma única agregação, e pela versão de `get_index_version`, que os
+    signals de `Product` incrementam quando o título ou o número de série
+    pode ter mudado. As movimentações de estoque, que só alteram a
+    quantidade, não reconstroem o índice.
+
+    Returns:
+        TrigramIndex: Índice dos produtos.
+    """
+    state = _get_products_state()
+    with _lock:
+        if _cache['state'] != state:
+            _cache['index'] = TrigramIndex(
+                Product.objects.values_list('id', 'title', 'serie_number')
+            )
+            _cache['state'] = state
+        return _cache['index']
@@ -6,6 +6,11 @@ urlpatterns = [
     path(
         'products/list/', views.ProductListView.as_view(), name='product_list'
     ),
+    path(
+        'products/export/',
+        views.ProductExportView.as_view(),
+        name='product_export',
+    ),
     path(
         'products/create/',
         views.ProductCreateView.as_view(),
@@ -26,4 +31,9 @@ urlpatterns = [
         views.ProductDeleteView.as_view(),
         name='product_delete',
     ),
+    path(
+        'products/autocomplete/',
+        views.ProductAutocompleteView.as_view(),
+        name='product_autocomplete',
+    ),
 ]
@@ -2,6 +2,7 @@ from django.contrib.auth.mixins import (
     LoginRequiredMixin,
     PermissionRequiredMixin,
 )
+from django.db.models import Q
 from django.urls import reverse_lazy
 from django.views.generic import (
     CreateView,
@@ -13,49 +14,91 @@ from django.views.generic import (
 
 from brand.models import Brand
 from categories.models import Category
+from core.exports import StreamingExportMixin
+from core.pagination import (
+    CursorPaginationMixin,
+    EstimatedCountPaginator,
+)
+from core.views import AutocompleteView
+from dashboards.cache import get_cached_metric
 from dashboards.metrics import get_product_metrics
 from products.forms import ProductForm
 from products.models import Product
+from products.search import (
+    fuzzy_search_products,
+    get_similar_products,
+    search_products,
+)
 
 
-class ProductListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
+class ProductListView(
+    LoginRequiredMixin,
+    PermissionRequiredMixin,
+    CursorPaginationMixin,
+    ListView,
+):
     """
     View para listar produtos.
 
     Esta view exibe uma lista paginada de produtos. Os usuários devem estar
     autenticados e ter permissão para visualizar produtos. O usuário pode
     filtrar a lista de produtos por título, número de série, categoria e marca.
+    O parâmetro `q` faz uma busca textual em título, número de série e
+    descrição, ordenando os produtos pela relevância; com `fuzzy`, a busca
+    é aproximada por trigramas, tolerando erros de digitação.
+    Com o parâmetro `cursor` na URL, a paginação é feita por cursor sobre
+    (título, id), com custo constante em qualquer página.
 
     Attributes:
         model: O modelo de dados a ser utilizado (Product).
         template_name: O template a ser renderizado para a lista de produtos.
         context_object_name: O nome do contexto a ser utilizado no template.
         paginate_by: Número de produtos a serem exibidos por página.
+        paginator_class: Paginador que estima o total em listagens grandes.
         permission_required: Permissão necessária para acessar a view.
+        cursor_ordering: Campos usados na paginação por cursor.
     """
 
     model = Product
     template_name = 'product_list.html'
     context_object_name = 'products'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
     permission_required = 'products.view_product'
+    cursor_ordering = ('title', 'id')
 
     def get_queryset(self):
         """
         Obtém a lista de produtos, aplicando filtros se fornecidos.
 
-        Filtros disponíveis incluem título, número de série, categoria e
-        marca. Retorna um QuerySet filtrado de acordo com os parâmetros
-        fornecidos na requisição.
+        Filtros disponíveis incluem título, número de série, categoria,
+        marca e a busca textual (`q`). Retorna um QuerySet filtrado de
+        acordo com os parâmetros fornecidos na requisição. Categoria e
+        marca vêm na mesma consulta, apenas com as colunas exibidas na
+        listagem.
 
         Returns:
             QuerySet: Lista de produtos filtrados.
         """
-        queryset = super().get_queryset()
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related('category', 'brand')
+            .only(
+                'title',
+                'serie_number',
+                'cost_price',
+                'selling_price',
+                'quantity',
+                'category__name',
+                'brand__name',
+            )
+        )
         title = self.request.GET.get('title')
         serie_number = self.request.GET.get('serie_number')
         category = self.request.GET.get('category')
         brand = self.request.GET.get('brand')
+        search = self.request.GET.get('q')
 
         if serie_number:
             queryset = queryset.filter(serie_number__istartswith=serie_number)
@@ -69,6 +112,11 @@ class ProductListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         if brand:
             queryset = queryset.filter(brand__id=brand)
 
+        if search and self.request.GET.get('fuzzy'):
+            queryset = fuzzy_search_products(queryset, search)
+        elif search:
+            queryset = search_products(queryset, search)
+
         return queryset
 
     def get_context_data(self, **kwargs):
@@ -89,10 +137,36 @@ class ProductListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         context = super().get_context_data(**kwargs)
         context['categories'] = Category.objects.all()
         context['brands'] = Brand.objects.all()
-        context['product_metrics'] = get_product_metrics()
+        context['product_metrics'] = get_cached_metric(get_product_metrics)
         return context
 
 
+class ProductExportView(StreamingExportMixin, ProductListView):
+    """
+    View para exportar produtos em CSV ou JSON Lines.
+
+    Exporta todos os produtos da listagem, com os mesmos filtros da URL.
+
+    Attributes:
+        export_fields: Colunas exportadas e os campos de origem.
+        export_filename: Nome do arquivo baixado, sem extensão.
+    """
+
+    export_fields = (
+        ('id', 'id'),
+        ('title', 'title'),
+        ('serie_number', 'serie_number'),
+        ('category', 'category__name'),
+        ('brand', 'brand__name'),
+        ('cost_price', 'cost_price'),
+        ('selling_price', 'selling_price'),
+        ('quantity', 'quantity'),
+        ('created_at', 'created_at'),
+        ('updated_at', 'updated_at'),
+    )
+    export_filename = 'produtos'
+
+
 class ProductCreateView(
     LoginRequiredMixin, PermissionRequiredMixin, CreateView
 ):
@@ -187,3 +261,44 @@ class ProductDeleteView(
     template_name = 'product_delete.html'
     success_url = reverse_lazy('product_list')
     permission_required = 'products.delete_product'
+
+
+class ProductAutocompleteView(AutocompleteView):
+    """
+    Endpoint de autocomplete de produtos, usado nos formulários de
+    entradas e saídas.
+
+    Primeiro vêm os produtos cujo título ou número de série começa com o
+    termo; se não completarem o limite, a lista é completada pela busca
+    aproximada por trigramas.
+
+    Attributes:
+        permission_required: Permissões aceitas para acessar a view.
+    """
+
+    permission_required = (
+        'products.view_product',
+        'inflows.add_inflow',
+        'outflows.add_outflow',
+    )
+
+    def get_results(self, term: str) -> list:
+        queryset = Product.objects.order_by('title', 'id')
+        if term:
+            queryset = queryset.filter(
+                Q(title__istartswith=term) | Q(serie_number__istartswith=term)
+            )
+        results = list(queryset.values_list('id', 'title')[: self.limit])
+        missing = self.limit - len(results)
+        if term and missing > 0:
+            found = [pk for pk, _ in results]
+            similar = get_similar_products(
+                Product.objects.exclude(id__in=found), term, missing
+            )
+            titles = dict(
+                Product.objects.filter(
+                    pk__in=[pk for pk, _ in similar]
+                ).values_list('id', 'title')
+            )
+            results.extend((pk, titles[pk]) for pk, _ in similar)
+        return results
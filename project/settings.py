@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'core',
     'brand',
     'categories',
     'suppliers',
@@ -50,11 +51,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.PrometheusMiddleware',
+    'core.middleware.ServerTimingMiddleware',
+    'core.middleware.QueryBudgetMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -95,9 +100,51 @@ DATABASES = {
     'dev': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    },
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'metrics': {
+        'BACKEND': config(
+            'METRICS_CACHE_BACKEND',
+            default='django.core.cache.backends.locmem.LocMemCache',
+        ),
+        'LOCATION': config('METRICS_CACHE_LOCATION', default='metrics'),
+        'TIMEOUT': config('METRICS_CACHE_TIMEOUT', default=300, cast=int),
+    },
 }
 
+METRICS_CACHE_ALIAS = 'metrics'
+
+# Tempo máximo, em segundos, para cada métrica do dashboard assíncrono.
+DASHBOARD_METRIC_TIMEOUT = config(
+    'DASHBOARD_METRIC_TIMEOUT', default=5, cast=float
+)
+
+
+# Orçamento de consultas SQL por requisição (core.middleware).
+QUERY_BUDGET_ENABLED = config('QUERY_BUDGET_ENABLED', default=False, cast=bool)
+QUERY_BUDGET_RAISE = config('QUERY_BUDGET_RAISE', default=False, cast=bool)
+QUERY_BUDGET_DEFAULT = config('QUERY_BUDGET_DEFAULT', default=30, cast=int)
+# Orçamentos específicos, pelo nome da URL.
+QUERY_BUDGETS = {}
+
+# Parâmetro da URL que devolve o perfil da requisição (core.middleware),
+# disponível apenas para usuários da equipe.
+PROFILER_PARAM = 'profile'
+
+# Token exigido pelo endpoint /metrics do Prometheus; vazio libera o acesso.
+# Com vários workers, defina também a variável de ambiente
+# PROMETHEUS_MULTIPROC_DIR com um diretório compartilhado.
+PROMETHEUS_METRICS_TOKEN = config('PROMETHEUS_METRICS_TOKEN', default='')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
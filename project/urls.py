@@ -29,5 +29,6 @@ urlpatterns = [
     path('', include('products.urls')),
     path('', include('dashboards.urls')),
     path('', include('accounts.urls')),
+    path('', include('core.urls')),
     path('logout/', LogoutView.as_view(), name='logout'),
 ]
@@ -0,0 +1,48 @@
+from http import HTTPStatus
+
+from django.contrib.auth.models import Permission, User
+from django.test import TestCase
+from django.urls import reverse
+
+from suppliers.models import Supplier
+
+
+class TestsAutocompleteSupplierView(TestCase):
+    """Testes para o endpoint de autocomplete de fornecedores."""
+
+    def setUp(self):
+        """
+        Cria um usuário com permissão de registrar entradas e alguns
+        fornecedores.
+        """
+        self.user = User.objects.create_user(
+            username='testuser', password='12345'
+        )
+        self.user.user_permissions.add(
+            Permission.objects.get(codename='add_inflow')
+        )
+        self.client.login(username='testuser', password='12345')
+        self.ivan = Supplier.objects.create(name='Ivan')
+        self.distribuidora = Supplier.objects.create(name='Distribuidora Ivo')
+
+    def test_autocomplete_retorna_prefixo_antes_de_contem(self):
+        """
+        Testa se os fornecedores que começam com o termo vêm antes dos
+        que apenas o contêm.
+        """
+        response = self.client.get(
+            reverse('supplier_autocomplete'), {'q': 'iv'}
+        )
+        esperado = [
+            {'id': self.ivan.pk, 'text': 'Ivan'},
+            {'id': self.distribuidora.pk, 'text': 'Distribuidora Ivo'},
+        ]
+        self.assertEqual(response.json()['results'], esperado)
+
+    def test_autocomplete_sem_login_retorna_redirecionamento(self):
+        """
+        Testa se um usuário não autenticado é redirecionado para o login.
+        """
+        self.client.logout()
+        response = self.client.get(reverse('supplier_autocomplete'))
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
@@ -104,6 +104,20 @@ class TestsListSupplierView(TestCase):
         resultado = response.status_code
         self.assertEqual(esperado, resultado)
 
+    def test_list_view_numero_de_consultas_independe_da_pagina(self):
+        """
+        Testa se a listagem de fornecedores executa o mesmo número de consultas
+        com uma página parcial e com uma página cheia.
+        """
+        with self.assertNumQueries(6):
+            self.client.get(reverse('supplier_list'))
+
+        for index in range(10):
+            Supplier.objects.create(name=f'Fornecedor {index:02d}')
+        with self.assertNumQueries(6):
+            response = self.client.get(reverse('supplier_list'))
+        self.assertEqual(len(response.context['suppliers']), 10)
+
     def tearDown(self):
         """Limpa os dados criados no banco de dados após cada teste."""
         Supplier.objects.all().delete()
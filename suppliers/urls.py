@@ -28,4 +28,9 @@ urlpatterns = [
         views.SupplierDeleteView.as_view(),
         name='supplier_delete',
     ),
+    path(
+        'suppliers/autocomplete/',
+        views.SupplierAutocompleteView.as_view(),
+        name='supplier_autocomplete',
+    ),
 ]
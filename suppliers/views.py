@@ -11,6 +11,8 @@ from django.views.generic import (
     UpdateView,
 )
 
+from core.pagination import EstimatedCountPaginator
+from core.views import AutocompleteView
 from suppliers.forms import SupplierForm
 from suppliers.models import Supplier
 
@@ -29,6 +31,7 @@ class SupplierListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         lista de fornecedores.
         context_object_name: O nome do contexto a ser utilizado no template.
         paginate_by: Número de fornecedores a serem exibidos por página.
+        paginator_class: Paginador que estima o total em listagens grandes.
         permission_required: Permissão necessária para acessar a view.
     """
 
@@ -36,6 +39,7 @@ class SupplierListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
     template_name = 'supplier_list.html'
     context_object_name = 'suppliers'
     paginate_by = 10
+    paginator_class = EstimatedCountPaginator
     permission_required = 'suppliers.view_supplier'
 
     def get_queryset(self):
@@ -49,7 +53,7 @@ class SupplierListView(LoginRequiredMixin, PermissionRequiredMixin, ListView):
         Returns:
             QuerySet: Lista de fornecedores filtrados.
         """
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().only('name', 'description')
         name = self.request.GET.get('name')
         if name:
             queryset = queryset.filter(name__istartswith=name)
@@ -153,3 +157,30 @@ class SupplierDeleteView(
     template_name = 'supplier_delete.html'
     success_url = reverse_lazy('supplier_list')
     permission_required = 'suppliers.delete_supplier'
+
+
+class SupplierAutocompleteView(AutocompleteView):
+    """
+    Endpoint de autocomplete de fornecedores, usado no formulário de
+    entradas.
+
+    Primeiro vêm os fornecedores cujo nome começa com o termo; se não
+    completarem o limite, a lista é completada pelos que contêm o termo.
+
+    Attributes:
+        permission_required: Permissões aceitas para acessar a view.
+    """
+
+    permission_required = ('suppliers.view_supplier', 'inflows.add_inflow')
+
+    def get_results(self, term: str) -> list:
+        queryset = Supplier.objects.order_by('name', 'id')
+        prefix = queryset.filter(name__istartswith=term)
+        results = list(prefix.values_list('id', 'name')[: self.limit])
+        missing = self.limit - len(results)
+        if term and missing > 0:
+            contains = queryset.filter(name__icontains=term).exclude(
+                name__istartswith=term
+            )
+            results.extend(contains.values_list('id', 'name')[:missing])
+        return results